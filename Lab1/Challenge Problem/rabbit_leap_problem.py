@@ -1,5 +1,10 @@
+import os
+import sys
 from collections import deque
 
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__)))))
+from cs307.metrics import SearchMetrics  # noqa: E402
+
 # -----------------------------
 # Node Structure
 # -----------------------------
@@ -43,21 +48,20 @@ def generate_successors(node):
 # -----------------------------
 # Breadth-First Search (BFS)
 # -----------------------------
-def breadth_first_search(start_config, goal_config):
+def breadth_first_search(start_config, goal_config, metrics=None):
     start_node = PuzzleNode(start_config)
     goal_node = PuzzleNode(goal_config)
     frontier = deque([start_node])
     visited = set()
-    max_frontier_size = 0
-    nodes_explored = 0
 
     while frontier:
         node = frontier.popleft()
 
         if tuple(node.configuration) in visited:
+            if metrics is not None:
+                metrics.count('duplicates')
             continue
         visited.add(tuple(node.configuration))
-        nodes_explored += 1
 
         # Goal test
         if node.configuration == list(goal_node.configuration):
@@ -65,39 +69,38 @@ def breadth_first_search(start_config, goal_config):
             while node:
                 path.append(node.configuration)
                 node = node.parent
-            print("Total nodes explored (BFS):", nodes_explored)
-            print("Maximum queue size (BFS):", max_frontier_size)
             return path[::-1]
 
         # Expand successors
-        for child in generate_successors(node):
+        children = generate_successors(node)
+        for child in children:
             frontier.append(child)
 
-        max_frontier_size = max(max_frontier_size, len(frontier))
+        if metrics is not None:
+            metrics.count('expansions')
+            metrics.count('generated', len(children))
+            metrics.peak('frontier', len(frontier))
 
-    print("Total nodes explored (BFS):", nodes_explored)
-    print("Maximum queue size (BFS):", max_frontier_size)
     return None
 
 
 # -----------------------------
 # Depth-First Search (DFS)
 # -----------------------------
-def depth_first_search(start_config, goal_config):
+def depth_first_search(start_config, goal_config, metrics=None):
     start_node = PuzzleNode(start_config)
     goal_node = PuzzleNode(goal_config)
     stack = deque([start_node])
     visited = set()
-    max_stack_size = 0
-    nodes_explored = 0
 
     while stack:
         node = stack.pop()
 
         if tuple(node.configuration) in visited:
+            if metrics is not None:
+                metrics.count('duplicates')
             continue
         visited.add(tuple(node.configuration))
-        nodes_explored += 1
 
         # Goal test
         if node.configuration == list(goal_node.configuration):
@@ -105,29 +108,32 @@ def depth_first_search(start_config, goal_config):
             while node:
                 path.append(node.configuration)
                 node = node.parent
-            print("Total nodes explored (DFS):", nodes_explored)
-            print("Maximum stack size (DFS):", max_stack_size)
             return path[::-1]
 
         # Expand successors
-        for child in generate_successors(node):
+        children = generate_successors(node)
+        for child in children:
             stack.append(child)
 
-        max_stack_size = max(max_stack_size, len(stack))
+        if metrics is not None:
+            metrics.count('expansions')
+            metrics.count('generated', len(children))
+            metrics.peak('frontier', len(stack))
 
-    print("Total nodes explored (DFS):", nodes_explored)
-    print("Maximum stack size (DFS):", max_stack_size)
     return None
 
 
 # -----------------------------
 # Main Execution
 # -----------------------------
-if __name__ == "__main__":
+def main():
     initial_config = ('E', 'E', 'E', 'O', 'W', 'W', 'W')
     target_config = ('W', 'W', 'W', 'O', 'E', 'E', 'E')
 
-    bfs_result = breadth_first_search(initial_config, target_config)
+    bfs_metrics = SearchMetrics()
+    bfs_result = breadth_first_search(initial_config, target_config, bfs_metrics)
+    print("Total nodes expanded (BFS):", bfs_metrics.counters.get('expansions', 0))
+    print("Maximum queue size (BFS):", bfs_metrics.peaks.get('frontier', 0))
     if bfs_result:
         print("\nSolution path (BFS):")
         for step_no, config in enumerate(bfs_result, start=1):
@@ -136,7 +142,10 @@ if __name__ == "__main__":
     else:
         print("No solution found using BFS.")
 
-    dfs_result = depth_first_search(initial_config, target_config)
+    dfs_metrics = SearchMetrics()
+    dfs_result = depth_first_search(initial_config, target_config, dfs_metrics)
+    print("Total nodes expanded (DFS):", dfs_metrics.counters.get('expansions', 0))
+    print("Maximum stack size (DFS):", dfs_metrics.peaks.get('frontier', 0))
     if dfs_result:
         print("\nSolution path (DFS):")
         for step_no, config in enumerate(dfs_result, start=1):
@@ -145,3 +154,6 @@ if __name__ == "__main__":
     else:
         print("No solution found using DFS.")
 
+
+if __name__ == "__main__":
+    main()
@@ -17,7 +17,7 @@ def GetSuccessors(node):
     # Placeholder — must be defined for your problem
     return []
 
-def BFS(S, G):
+def BFS(S, G, metrics=None):
     # Initialize start and goal nodes
     start_node = Node(S)
     goal_node = Node(G)
@@ -32,6 +32,8 @@ def BFS(S, G):
 
         # Skip if already visited
         if tuple(node.state) in visited:
+            if metrics is not None:
+                metrics.count('duplicates')
             continue
 
         visited.add(tuple(node.state))
@@ -45,9 +47,15 @@ def BFS(S, G):
             return path[::-1]  # Return reversed path (start → goal)
 
         # Add all successors to queue
-        for successor in GetSuccessors(node):
+        successors = GetSuccessors(node)
+        for successor in successors:
             queue.append(successor)
 
+        if metrics is not None:
+            metrics.count('expansions')
+            metrics.count('generated', len(successors))
+            metrics.peak('frontier', len(queue))
+
     # If goal not found
     return None
 
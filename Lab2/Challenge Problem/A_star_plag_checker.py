@@ -1,10 +1,12 @@
+import argparse
 import heapq
 import re
+from contextlib import nullcontext
 
 # ------------------------------------------------------------
 # Step 1: Text Preprocessing (Normalization and Sentence Tokenization)
 # ------------------------------------------------------------
-def preprocess_document(text):
+def preprocess_document(text, verbose=True):
     """
     Normalize and split the text into clean, lowercase sentences.
     """
@@ -24,10 +26,11 @@ def preprocess_document(text):
     cleaned_sentences = [s.strip() for s in sentences if s.strip()]
 
     # Display preprocessed sentences for verification
-    print("Processed Sentences:\n")
-    for idx, sentence in enumerate(cleaned_sentences, start=1):
-        print(f"Sentence {idx}: {sentence}")
-    print("\n")
+    if verbose:
+        print("Processed Sentences:\n")
+        for idx, sentence in enumerate(cleaned_sentences, start=1):
+            print(f"Sentence {idx}: {sentence}")
+        print("\n")
 
     return cleaned_sentences
 
@@ -91,9 +94,10 @@ def estimate_remaining_cost(idx1, idx2, sentences1, sentences2):
 # ------------------------------------------------------------
 # Step 5: A* Search for Sentence Alignment
 # ------------------------------------------------------------
-def perform_astar_alignment(sentences1, sentences2):
+def perform_astar_alignment(sentences1, sentences2, verbose=True, metrics=None):
     """
     Use A* search to align sentences between two documents.
+    verbose prints every node as it is expanded.
     """
     start_node = AlignmentNode(0, 0, 0, estimate_remaining_cost(0, 0, sentences1, sentences2))
     frontier = []
@@ -104,7 +108,8 @@ def perform_astar_alignment(sentences1, sentences2):
         current = heapq.heappop(frontier)
         idx1, idx2 = current.idx1, current.idx2
 
-        print(f"Exploring: Doc1={idx1}, Doc2={idx2}, g={current.cost_so_far}, h={current.heuristic_cost}")
+        if verbose:
+            print(f"Exploring: Doc1={idx1}, Doc2={idx2}, g={current.cost_so_far}, h={current.heuristic_cost}")
 
         # Goal: both documents fully processed
         if idx1 == len(sentences1) and idx2 == len(sentences2):
@@ -115,7 +120,14 @@ def perform_astar_alignment(sentences1, sentences2):
                 node = node.parent
             return path[::-1]
 
+        # A cheaper copy of this node was already expanded
+        if (idx1, idx2) in explored:
+            if metrics is not None:
+                metrics.count('duplicates')
+            continue
         explored.add((idx1, idx2))
+        if metrics is not None:
+            metrics.count('expansions')
 
         # Possible moves: align (1,1), skip doc1 (1,0), skip doc2 (0,1)
         for move in [(1, 1), (1, 0), (0, 1)]:
@@ -134,6 +146,11 @@ def perform_astar_alignment(sentences1, sentences2):
                 heuristic_cost = estimate_remaining_cost(new_idx1, new_idx2, sentences1, sentences2)
                 next_node = AlignmentNode(new_idx1, new_idx2, new_cost, heuristic_cost, current)
                 heapq.heappush(frontier, next_node)
+                if metrics is not None:
+                    metrics.count('generated')
+
+        if metrics is not None:
+            metrics.peak('frontier', len(frontier))
 
     return None
 
@@ -141,14 +158,17 @@ def perform_astar_alignment(sentences1, sentences2):
 # ------------------------------------------------------------
 # Step 6: Document Alignment Wrapper
 # ------------------------------------------------------------
-def align_documents(doc_text1, doc_text2):
+def align_documents(doc_text1, doc_text2, verbose=True, metrics=None):
     """
     Align two documents at the sentence level using A*.
+    A metrics object (cs307.metrics.SearchMetrics) also times the preprocess and search phases.
     """
-    sentences1 = preprocess_document(doc_text1)
-    sentences2 = preprocess_document(doc_text2)
+    with metrics.phase("preprocess") if metrics is not None else nullcontext():
+        sentences1 = preprocess_document(doc_text1, verbose)
+        sentences2 = preprocess_document(doc_text2, verbose)
 
-    alignment_path = perform_astar_alignment(sentences1, sentences2)
+    with metrics.phase("search") if metrics is not None else nullcontext():
+        alignment_path = perform_astar_alignment(sentences1, sentences2, verbose, metrics)
 
     aligned_pairs = []
     for i, j in alignment_path:
@@ -194,11 +214,11 @@ def read_text_file(path):
 # ------------------------------------------------------------
 # Step 9: Main Pipeline Execution
 # ------------------------------------------------------------
-def run_plagiarism_detection(file1_path, file2_path, output_path):
+def run_plagiarism_detection(file1_path, file2_path, output_path, verbose=True, metrics=None):
     doc_text1 = read_text_file(file1_path)
     doc_text2 = read_text_file(file2_path)
 
-    aligned_results = align_documents(doc_text1, doc_text2)
+    aligned_results = align_documents(doc_text1, doc_text2, verbose, metrics)
 
     with open(output_path, 'a') as out_file:
         out_file.write("Sentence Alignment with Edit Distances:\n\n")
@@ -225,9 +245,16 @@ def run_plagiarism_detection(file1_path, file2_path, output_path):
 # ------------------------------------------------------------
 # Step 10: Example Usage
 # ------------------------------------------------------------
-if __name__ == "__main__":
-    file1_path = "doc1.txt"
-    file2_path = "doc2.txt"
-    output_path = "alignment_results.txt"
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Align two documents with A* and report likely plagiarism.")
+    parser.add_argument('file1_path', nargs='?', default="doc1.txt")
+    parser.add_argument('file2_path', nargs='?', default="doc2.txt")
+    parser.add_argument('output_path', nargs='?', default="alignment_results.txt")
+    parser.add_argument('--quiet', action='store_true', help="do not print sentences and explored nodes")
+    args = parser.parse_args(argv)
+
+    run_plagiarism_detection(args.file1_path, args.file2_path, args.output_path, verbose=not args.quiet)
 
-    run_plagiarism_detection(file1_path, file2_path, output_path)
+
+if __name__ == "__main__":
+    main()
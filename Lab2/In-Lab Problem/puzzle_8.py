@@ -1,4 +1,5 @@
-from collections import deque
+from collections import OrderedDict, deque
+from contextlib import nullcontext
 import time
 import math
 import random
@@ -29,27 +30,81 @@ def generate_neighbors(node):
     
     return neighbors
 
+# -------------------- Transposition Table --------------------
+def pack_state(state):
+    """Pack a board (tiles 0-8) into one integer, one byte per square."""
+    return int.from_bytes(bytes(state), 'little')
+
+class TranspositionTable:
+    """
+    Remembers, per packed state, the largest remaining depth it has been searched with.
+    A search from a state that found nothing with r moves left proves the goal is not
+    within r moves of it, so any later visit with at most r moves left (a deeper or
+    repeated occurrence, in this or a later IDS iteration) can be pruned. The least
+    recently used entries are evicted beyond max_size; eviction only costs pruning.
+    """
+    def __init__(self, max_size=200000):
+        self.max_size = max_size
+        self.entries = OrderedDict()
+        self.stats = {'lookups': 0, 'hits': 0, 'evictions': 0}
+
+    def visit(self, key, remaining):
+        """Return True if the state can be pruned; otherwise record this visit."""
+        self.stats['lookups'] += 1
+        searched = self.entries.get(key)
+        if searched is not None:
+            self.entries.move_to_end(key)
+            if searched >= remaining:
+                self.stats['hits'] += 1
+                return True
+        self.entries[key] = remaining
+        if len(self.entries) > self.max_size:
+            self.entries.popitem(last=False)
+            self.stats['evictions'] += 1
+        return False
+
+    def hit_rate(self):
+        return self.stats['hits'] / self.stats['lookups'] if self.stats['lookups'] else 0.0
+
 # -------------------- Depth-Limited Search --------------------
-def depth_limited_search(node, goal_state, limit):
-    """Recursive depth-limited search (DLS)."""
+def depth_limited_search(node, goal_state, limit, metrics=None, table=None):
+    """Recursive depth-limited search (DLS), pruning transpositions when a table is given."""
     if node.state == goal_state:
         return node
     if node.depth == limit:
         return None
+    if table is not None and table.visit(pack_state(node.state), limit - node.depth):
+        if metrics is not None:
+            metrics.count('duplicates')
+        return None
 
-    for neighbor in generate_neighbors(node):
-        result = depth_limited_search(neighbor, goal_state, limit)
+    neighbors = generate_neighbors(node)
+    if metrics is not None:
+        metrics.count('expansions')
+        metrics.count('generated', len(neighbors))
+        metrics.peak('frontier', node.depth + 1)  # recursion depth
+    for neighbor in neighbors:
+        result = depth_limited_search(neighbor, goal_state, limit, metrics, table)
         if result:
             return result
     return None
 
 # -------------------- Iterative Deepening Search --------------------
-def iterative_deepening_search(start_state, goal_state):
-    """Run IDS by incrementally increasing the search depth."""
+def iterative_deepening_search(start_state, goal_state, metrics=None, use_table=True, table=None):
+    """
+    Run IDS by incrementally increasing the search depth.
+    With use_table, one TranspositionTable (or the given table) is shared by every
+    iteration; use_table=False runs the plain baseline search.
+    """
+    if use_table and table is None:
+        table = TranspositionTable()
+    if not use_table:
+        table = None
     depth = 0
     while True:
         print(f"Exploring depth limit: {depth}")
-        result = depth_limited_search(PuzzleNode(start_state), goal_state, depth)
+        with metrics.phase(f"depth {depth}") if metrics is not None else nullcontext():
+            result = depth_limited_search(PuzzleNode(start_state), goal_state, depth, metrics, table)
         if result:
             return result
         depth += 1
@@ -81,7 +136,8 @@ def run_ids_test_for_depth(depth):
     print(f"\nGenerated goal state (depth {depth}): {goal_state}")
 
     start_time = time.time()
-    result = iterative_deepening_search(initial_state, goal_state)
+    table = TranspositionTable()
+    result = iterative_deepening_search(initial_state, goal_state, table=table)
     
     if result:
         path = extract_solution_path(result)
@@ -94,7 +150,14 @@ def run_ids_test_for_depth(depth):
 
     end_time = time.time()
     print(f"Execution time: {math.ceil((end_time - start_time) * 1000)} ms")
+    print(f"Transposition table: {table.stats['hits']}/{table.stats['lookups']} hits "
+          f"({table.hit_rate():.1%}), {len(table.entries)} states stored")
 
 # -------------------- Run Tests --------------------
-for d in [10, 20, 30, 40, 50, 100]:
-    run_ids_test_for_depth(d)
+def main():
+    for d in [10, 20, 30, 40, 50, 100]:
+        run_ids_test_for_depth(d)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,171 @@
+import random
+
+# Assignments are bitsets: bit v-1 is the value of variable v. Each clause is a pair
+# of bitmasks (pos, neg) holding its positive and negated variables, so a clause of
+# any length is satisfied exactly when (pos & A) | (neg & ~A) != 0.
+
+# ------------------------------------------------------------
+# Encoding
+# ------------------------------------------------------------
+def encode_clause_masks(clauses):
+    """Convert clauses of any length into (pos, neg) bitmask pairs."""
+    masks = []
+    for clause in clauses:
+        pos = neg = 0
+        for lit in clause:
+            if lit > 0:
+                pos |= 1 << (lit - 1)
+            else:
+                neg |= 1 << (-lit - 1)
+        masks.append((pos, neg))
+    return masks
+
+
+def assignment_to_bits(assignment):
+    bits = 0
+    for idx, value in enumerate(assignment):
+        if value:
+            bits |= 1 << idx
+    return bits
+
+
+def bits_to_assignment(bits, num_vars):
+    return [bool(bits >> idx & 1) for idx in range(num_vars)]
+
+
+def random_bits(num_vars):
+    return random.getrandbits(num_vars) if num_vars else 0
+
+
+# ------------------------------------------------------------
+# Clause Evaluation on Python Integers
+# ------------------------------------------------------------
+def count_unsatisfied_bits(masks, bits):
+    """Number of clauses left unsatisfied by the bitset assignment."""
+    inverted = ~bits
+    return sum(1 for pos, neg in masks if not (pos & bits) | (neg & inverted))
+
+
+def weighted_unsatisfied_bits(masks, bits, weights):
+    """Total weight of the clauses left unsatisfied by the bitset assignment."""
+    inverted = ~bits
+    return sum(w for (pos, neg), w in zip(masks, weights) if not (pos & bits) | (neg & inverted))
+
+
+# ------------------------------------------------------------
+# Beam Search on Bitsets
+# ------------------------------------------------------------
+def _beam_search_bits(clauses, num_vars, beam_width, max_steps, reweight, metrics):
+    masks = encode_clause_masks(clauses)
+    weights = [1] * len(masks)
+    flips = [1 << idx for idx in range(num_vars)]
+    beam = [random_bits(num_vars) for _ in range(beam_width)]
+    # The starting beam is the best so far, so max_steps=0 still returns an assignment
+    best_solution = min(beam, key=lambda bits: weighted_unsatisfied_bits(masks, bits, weights))
+    best_score = weighted_unsatisfied_bits(masks, best_solution, weights)
+
+    for _ in range(max_steps):
+        candidate_pool = []
+        for bits in beam:
+            score = weighted_unsatisfied_bits(masks, bits, weights)
+            if score < best_score:
+                best_score = score
+                best_solution = bits
+                if metrics is not None:
+                    metrics.count('improved')
+            if score == 0:
+                return bits_to_assignment(bits, num_vars), True
+
+            # Neighbours are single integers, not copied lists
+            for flip in flips:
+                neighbour = bits ^ flip
+                candidate_pool.append((weighted_unsatisfied_bits(masks, neighbour, weights), neighbour))
+
+        candidate_pool.sort(key=lambda x: x[0])
+        beam = [bits for _, bits in candidate_pool[:beam_width]]
+        if metrics is not None:
+            metrics.count('generated', len(candidate_pool))
+            metrics.count('accepted', len(beam))
+        if reweight and beam:
+            inverted = ~beam[0]
+            for idx, (pos, neg) in enumerate(masks):
+                if not (pos & beam[0]) | (neg & inverted):
+                    weights[idx] += 1
+
+    return bits_to_assignment(best_solution, num_vars), best_score == 0
+
+
+def beam_search_bits(clauses, num_vars, beam_width=3, max_steps=1000, metrics=None):
+    """Bitset counterpart of `beam_search_unsat` (unsatisfied clause count heuristic)."""
+    return _beam_search_bits(clauses, num_vars, beam_width, max_steps, False, metrics)
+
+
+def beam_search_with_weights_bits(clauses, num_vars, beam_width=5, max_steps=1000, metrics=None):
+    """Bitset counterpart of `beam_search_with_weights` (clause weighting heuristic)."""
+    return _beam_search_bits(clauses, num_vars, beam_width, max_steps, True, metrics)
+
+
+# ------------------------------------------------------------
+# NumPy uint64 Batches (n <= 64)
+# ------------------------------------------------------------
+def clause_masks_u64(clauses, num_vars):
+    """Clause masks as two uint64 arrays; every assignment then fits in one machine word."""
+    import numpy as np
+
+    if num_vars > 64:
+        raise ValueError("uint64 bitsets hold at most 64 variables")
+    masks = encode_clause_masks(clauses)
+    pos = np.array([p for p, _ in masks], dtype=np.uint64)
+    neg = np.array([n for _, n in masks], dtype=np.uint64)
+    return pos, neg
+
+
+def count_unsatisfied_u64(pos, neg, assignments):
+    """Unsatisfied clause count for each uint64 assignment in an array of any shape."""
+    import numpy as np
+
+    words = np.asarray(assignments, dtype=np.uint64)[..., None]
+    satisfied = ((pos & words) | (neg & ~words)) != 0
+    return (~satisfied).sum(axis=-1)
+
+
+def flip_neighbours_u64(assignments, num_vars):
+    """(b, n) array of every single-flip neighbour of each uint64 assignment."""
+    import numpy as np
+
+    flips = np.left_shift(np.uint64(1), np.arange(num_vars, dtype=np.uint64))
+    return np.asarray(assignments, dtype=np.uint64)[:, None] ^ flips[None, :]
+
+
+def beam_search_u64(clauses, num_vars, beam_width=3, max_steps=1000, metrics=None):
+    """Beam search with the whole beam and all its neighbours held as uint64 words."""
+    import numpy as np
+
+    pos, neg = clause_masks_u64(clauses, num_vars)
+    beam = np.array([random_bits(num_vars) for _ in range(beam_width)], dtype=np.uint64)
+    # The starting beam is the best so far, so max_steps=0 still returns an assignment
+    current = count_unsatisfied_u64(pos, neg, beam)
+    leader = int(np.argmin(current))
+    best_unsat = int(current[leader])
+    best_solution = int(beam[leader])
+
+    for _ in range(max_steps):
+        if best_unsat == 0 or num_vars == 0:
+            break
+
+        neighbours = flip_neighbours_u64(beam, num_vars).ravel()
+        scores = count_unsatisfied_u64(pos, neg, neighbours)
+        keep = min(beam_width, scores.size)
+        chosen = np.argpartition(scores, keep - 1)[:keep]
+        beam, current = neighbours[chosen], scores[chosen]  # the new beam's scores are already known
+        if metrics is not None:
+            metrics.count('generated', scores.size)
+            metrics.count('accepted', keep)
+        leader = int(np.argmin(current))
+        if current[leader] < best_unsat:
+            best_unsat = int(current[leader])
+            best_solution = int(beam[leader])
+            if metrics is not None:
+                metrics.count('improved')
+
+    return bits_to_assignment(best_solution, num_vars), best_unsat == 0
@@ -0,0 +1,311 @@
+import heapq
+import time
+
+SAT = 'SAT'
+UNSAT = 'UNSAT'
+UNKNOWN = 'UNKNOWN'
+
+# Internal literal encoding: variable v (0-based) is 2*v, its negation 2*v + 1.
+# Variable values are 1 (true), 0 (false) or -1 (unassigned).
+
+
+def _encode(lit):
+    return 2 * (lit - 1) if lit > 0 else 2 * (-lit - 1) + 1
+
+
+# ------------------------------------------------------------
+# Restart Schedule
+# ------------------------------------------------------------
+def luby(i):
+    """The i-th element (1-based) of the Luby sequence 1, 1, 2, 1, 1, 2, 4, ..."""
+    k = 1
+    while (1 << k) - 1 < i:
+        k += 1
+    while (1 << k) - 1 != i:
+        i -= (1 << (k - 1)) - 1
+        k = 1
+        while (1 << k) - 1 < i:
+            k += 1
+    return 1 << (k - 1)
+
+
+# ------------------------------------------------------------
+# CDCL Solver
+# ------------------------------------------------------------
+class CDCLSolver:
+    """
+    Conflict-driven clause learning: two-watched-literal unit propagation,
+    VSIDS decisions with phase saving, first-UIP clause learning with
+    non-chronological backjumping, Luby restarts and LBD-based learnt clause reduction.
+    """
+
+    def __init__(self, clauses, num_vars, var_decay=0.95, restart_base=100):
+        self.num_vars = num_vars
+        self.values = [-1] * num_vars
+        self.level = [0] * num_vars
+        self.reason = [None] * num_vars
+        self.polarity = [1] * num_vars  # saved phase, 1 means "assign false"
+        self.activity = [0.0] * num_vars
+        self.var_inc = 1.0
+        self.var_decay = var_decay
+        self.restart_base = restart_base
+
+        self.clauses = []
+        self.learnt_lbd = {}
+        self.watches = [[] for _ in range(2 * num_vars)]
+        self.trail = []
+        self.trail_lim = []
+        self.qhead = 0
+        self.conflicts = 0
+        self.ok = True
+
+        for clause in clauses:
+            lits = set(_encode(lit) for lit in clause)
+            if any(lit ^ 1 in lits for lit in lits):
+                continue  # tautology
+            self._add_clause(sorted(lits))
+            if not self.ok:
+                break
+        self.num_original = len(self.clauses)
+        self.heap = [(0.0, v) for v in range(num_vars)]
+        self.max_learnts = max(len(self.clauses) // 3, 1000)
+
+    # -------------------- Assignment helpers --------------------
+    def _lit_value(self, lit):
+        value = self.values[lit >> 1]
+        return -1 if value < 0 else value ^ (lit & 1)
+
+    def _decision_level(self):
+        return len(self.trail_lim)
+
+    def _enqueue(self, lit, reason):
+        var = lit >> 1
+        self.values[var] = 1 ^ (lit & 1)
+        self.level[var] = self._decision_level()
+        self.reason[var] = reason
+        self.trail.append(lit)
+
+    def _add_clause(self, lits):
+        if not lits:
+            self.ok = False
+        elif len(lits) == 1:
+            value = self._lit_value(lits[0])
+            if value == 0:
+                self.ok = False
+            elif value < 0:
+                self._enqueue(lits[0], None)
+        else:
+            self.watches[lits[0]].append(len(self.clauses))
+            self.watches[lits[1]].append(len(self.clauses))
+            self.clauses.append(lits)
+
+    # -------------------- Unit propagation --------------------
+    def _propagate(self):
+        """Propagate the trail; return the index of a conflicting clause or None."""
+        values, clauses, watches = self.values, self.clauses, self.watches
+        while self.qhead < len(self.trail):
+            false_lit = self.trail[self.qhead] ^ 1
+            self.qhead += 1
+            watchers = watches[false_lit]
+            i = j = 0
+            while i < len(watchers):
+                ci = watchers[i]
+                i += 1
+                clause = clauses[ci]
+                if clause[0] == false_lit:
+                    clause[0], clause[1] = clause[1], false_lit
+                first = clause[0]
+                first_value = values[first >> 1]
+                if first_value >= 0 and first_value ^ (first & 1) == 1:
+                    watchers[j] = ci
+                    j += 1
+                    continue
+
+                for k in range(2, len(clause)):
+                    lit = clause[k]
+                    value = values[lit >> 1]
+                    if value < 0 or value ^ (lit & 1) == 1:
+                        clause[1], clause[k] = lit, false_lit
+                        watches[lit].append(ci)
+                        break
+                else:
+                    watchers[j] = ci
+                    j += 1
+                    if first_value >= 0:
+                        # Every literal is false: keep the remaining watchers and report
+                        while i < len(watchers):
+                            watchers[j] = watchers[i]
+                            j += 1
+                            i += 1
+                        del watchers[j:]
+                        return ci
+                    self._enqueue(first, ci)
+            del watchers[j:]
+        return None
+
+    # -------------------- Conflict analysis --------------------
+    def _bump(self, var):
+        self.activity[var] += self.var_inc
+        if self.activity[var] > 1e100:
+            self.activity = [a * 1e-100 for a in self.activity]
+            self.var_inc *= 1e-100
+            self.heap = [(-self.activity[v], v) for v in range(self.num_vars) if self.values[v] < 0]
+            heapq.heapify(self.heap)
+        elif self.values[var] < 0:
+            heapq.heappush(self.heap, (-self.activity[var], var))
+
+    def _analyze(self, conflict):
+        """First-UIP learning; returns (learnt clause, backjump level)."""
+        seen = set()
+        learnt = [None]
+        counter = 0
+        lit = None
+        idx = len(self.trail) - 1
+        current = self._decision_level()
+
+        while True:
+            clause = self.clauses[conflict]
+            for q in (clause if lit is None else clause[1:]):
+                var = q >> 1
+                if var not in seen and self.level[var] > 0:
+                    seen.add(var)
+                    self._bump(var)
+                    if self.level[var] >= current:
+                        counter += 1
+                    else:
+                        learnt.append(q)
+            while (self.trail[idx] >> 1) not in seen:
+                idx -= 1
+            lit = self.trail[idx]
+            idx -= 1
+            conflict = self.reason[lit >> 1]
+            counter -= 1
+            if counter == 0:
+                break
+        learnt[0] = lit ^ 1
+
+        if len(learnt) == 1:
+            return learnt, 0
+        # Second watch goes to the literal assigned at the highest remaining level
+        best = max(range(1, len(learnt)), key=lambda k: self.level[learnt[k] >> 1])
+        learnt[1], learnt[best] = learnt[best], learnt[1]
+        return learnt, self.level[learnt[1] >> 1]
+
+    def _backtrack(self, level):
+        if self._decision_level() <= level:
+            return
+        for lit in reversed(self.trail[self.trail_lim[level]:]):
+            var = lit >> 1
+            self.values[var] = -1
+            self.reason[var] = None
+            self.polarity[var] = lit & 1
+            heapq.heappush(self.heap, (-self.activity[var], var))
+        del self.trail[self.trail_lim[level]:]
+        del self.trail_lim[level:]
+        self.qhead = len(self.trail)
+
+    # -------------------- Decisions and clause database --------------------
+    def _pick_branch_var(self):
+        while self.heap:
+            neg_activity, var = heapq.heappop(self.heap)
+            if self.values[var] < 0 and -neg_activity == self.activity[var]:
+                return var
+        return None
+
+    def _reduce_learnts(self):
+        """Drop the worse half of the learnt clauses (by LBD); only called at level 0."""
+        learnt_ids = sorted(self.learnt_lbd, key=lambda ci: (self.learnt_lbd[ci], len(self.clauses[ci])))
+        keep = set(learnt_ids[:len(learnt_ids) // 2])
+        keep.update(ci for ci in learnt_ids if self.learnt_lbd[ci] <= 2)
+
+        clauses = self.clauses[:self.num_original]
+        learnt_lbd = {}
+        for ci in learnt_ids:
+            if ci in keep:
+                learnt_lbd[len(clauses)] = self.learnt_lbd[ci]
+                clauses.append(self.clauses[ci])
+        self.clauses = clauses
+        self.learnt_lbd = learnt_lbd
+        self.watches = [[] for _ in range(2 * self.num_vars)]
+        for ci, clause in enumerate(clauses):
+            self.watches[clause[0]].append(ci)
+            self.watches[clause[1]].append(ci)
+        # Level-0 reasons are never inspected by conflict analysis
+        self.reason = [None] * self.num_vars
+
+    # -------------------- Main search loop --------------------
+    def solve(self, max_conflicts=None, timeout=None, metrics=None):
+        """Return (assignment, status); assignment is a list of bools when status is SAT.
+
+        A metrics object (cs307.metrics.SearchMetrics) counts decisions, conflicts,
+        propagated literals, learnt clauses, restarts and learnt-clause reductions.
+        """
+        if not self.ok or self._propagate() is not None:
+            return None, UNSAT
+        deadline = None if timeout is None else time.perf_counter() + timeout
+        restarts = 0
+        budget = self.restart_base * luby(1)
+
+        while True:
+            head = self.qhead
+            conflict = self._propagate()
+            if metrics is not None:
+                metrics.count('propagations', self.qhead - head)
+            if conflict is not None:
+                self.conflicts += 1
+                budget -= 1
+                if metrics is not None:
+                    metrics.count('conflicts')
+                if self._decision_level() == 0:
+                    return None, UNSAT
+                learnt, back_level = self._analyze(conflict)
+                self._backtrack(back_level)
+                if len(learnt) == 1:
+                    self._enqueue(learnt[0], None)
+                else:
+                    ci = len(self.clauses)
+                    self.learnt_lbd[ci] = len(set(self.level[lit >> 1] for lit in learnt))
+                    self.watches[learnt[0]].append(ci)
+                    self.watches[learnt[1]].append(ci)
+                    self.clauses.append(learnt)
+                    self._enqueue(learnt[0], ci)
+                if metrics is not None:
+                    metrics.count('learnt')
+                self.var_inc /= self.var_decay
+                continue
+
+            if max_conflicts is not None and self.conflicts >= max_conflicts:
+                return None, UNKNOWN
+            if deadline is not None and time.perf_counter() > deadline:
+                return None, UNKNOWN
+            if budget <= 0:
+                restarts += 1
+                budget = self.restart_base * luby(restarts + 1)
+                self._backtrack(0)
+                if metrics is not None:
+                    metrics.count('restarts')
+                if len(self.learnt_lbd) > self.max_learnts:
+                    self._reduce_learnts()
+                    self.max_learnts = int(self.max_learnts * 1.1)
+                    if metrics is not None:
+                        metrics.count('reductions')
+                continue
+
+            var = self._pick_branch_var()
+            if var is None:
+                return [value == 1 for value in self.values], SAT
+            self.trail_lim.append(len(self.trail))
+            self._enqueue(2 * var + self.polarity[var], None)
+            if metrics is not None:
+                metrics.count('decisions')
+
+
+def cdcl_solve(clauses, num_vars, max_conflicts=None, timeout=None, metrics=None):
+    """Complete solve: returns (assignment, status) with status SAT, UNSAT or UNKNOWN (budget hit)."""
+    return CDCLSolver(clauses, num_vars).solve(max_conflicts=max_conflicts, timeout=timeout,
+                                               metrics=metrics)
+
+
+def classify_instance(clauses, num_vars, timeout=10.0, metrics=None):
+    """Ground-truth label for an instance: SAT, UNSAT or UNKNOWN if the timeout expires."""
+    return cdcl_solve(clauses, num_vars, timeout=timeout, metrics=metrics)[1]
@@ -0,0 +1,132 @@
+import gzip
+from array import array
+
+# ------------------------------------------------------------
+# Flat Clause Storage
+# ------------------------------------------------------------
+class FlatCNF:
+    """
+    A CNF formula stored as one flat int32 literal array plus clause offsets,
+    so clause i is literals[offsets[i]:offsets[i + 1]]. Clauses may have any length.
+    Iterating or indexing yields plain lists, so the solvers accept it like a clause list.
+    """
+
+    def __init__(self, num_vars=0, literals=None, offsets=None):
+        self.num_vars = num_vars
+        self.literals = literals if literals is not None else array('i')
+        self.offsets = offsets if offsets is not None else array('q', [0])
+
+    @classmethod
+    def from_clauses(cls, clauses, num_vars=None):
+        cnf = cls()
+        for clause in clauses:
+            cnf.append(clause)
+        if num_vars is not None:
+            cnf.num_vars = num_vars
+        return cnf
+
+    def append(self, clause):
+        self.literals.extend(clause)
+        self.offsets.append(len(self.literals))
+        for lit in clause:
+            if abs(lit) > self.num_vars:
+                self.num_vars = abs(lit)
+
+    def __len__(self):
+        return len(self.offsets) - 1
+
+    def __getitem__(self, idx):
+        if idx < 0:
+            idx += len(self)
+        if not 0 <= idx < len(self):
+            raise IndexError("clause index out of range")
+        return self.literals[self.offsets[idx]:self.offsets[idx + 1]].tolist()
+
+    def __iter__(self):
+        literals, offsets = self.literals, self.offsets
+        for idx in range(len(offsets) - 1):
+            yield literals[offsets[idx]:offsets[idx + 1]].tolist()
+
+    def to_clauses(self):
+        return list(self)
+
+
+# ------------------------------------------------------------
+# DIMACS Reader
+# ------------------------------------------------------------
+def _open_text(path, mode):
+    if str(path).endswith('.gz'):
+        return gzip.open(path, mode + 't')
+    return open(path, mode)
+
+
+def _parse_header(line):
+    fields = line.split()
+    if len(fields) != 4 or fields[1] != 'cnf':
+        raise ValueError(f"unsupported DIMACS header: {line!r}")
+    return int(fields[2]), int(fields[3])
+
+
+def read_dimacs(path):
+    """
+    Read a DIMACS .cnf or .cnf.gz file line by line straight into the flat arrays of a
+    FlatCNF. Clauses may span several lines and are terminated by 0; everything after
+    a SATLIB-style '%' line is ignored.
+    """
+    literals = array('i')
+    offsets = array('q', [0])
+    header = None
+    max_var = 0
+    with _open_text(path, 'r') as file:
+        for line in file:
+            line = line.strip()
+            if not line or line[0] == 'c':
+                continue
+            if line[0] == 'p':
+                header = _parse_header(line)
+                continue
+            if line[0] == '%':
+                break
+            values = array('i', map(int, line.split()))
+            if not values:
+                continue
+            max_var = max(max_var, max(values), -min(values))
+            if values[-1] == 0 and values.count(0) == 1:
+                # Common case: exactly one complete clause on the line
+                literals.extend(values[:-1])
+                offsets.append(len(literals))
+                continue
+            for lit in values:
+                if lit == 0:
+                    offsets.append(len(literals))
+                else:
+                    literals.append(lit)
+    if len(literals) > offsets[-1]:
+        offsets.append(len(literals))
+
+    cnf = FlatCNF(max_var, literals, offsets)
+    if header is not None:
+        cnf.num_vars = max(max_var, header[0])
+        if header[1] != len(cnf):
+            raise ValueError(f"{path}: header declares {header[1]} clauses, found {len(cnf)}")
+    return cnf
+
+
+def load_instance(path):
+    """Load a DIMACS file as (clauses, num_vars) for the list-based solvers."""
+    cnf = read_dimacs(path)
+    return cnf.to_clauses(), cnf.num_vars
+
+
+# ------------------------------------------------------------
+# DIMACS Writer
+# ------------------------------------------------------------
+def write_dimacs(path, clauses, num_vars, comments=()):
+    """Write clauses (a list of literal lists or a FlatCNF) as DIMACS; '.gz' paths are compressed."""
+    with _open_text(path, 'w') as file:
+        for comment in comments:
+            file.write(f"c {comment}\n")
+        file.write(f"p cnf {num_vars} {len(clauses)}\n")
+        for clause in clauses:
+            file.write(" ".join(map(str, clause)))
+            file.write(" 0\n")
@@ -1,4 +1,11 @@
+import os
 import random
+from contextlib import nullcontext
+
+from cdcl import SAT, UNSAT, UNKNOWN, classify_instance
+from dimacs import write_dimacs
+from preprocess import preprocess_formula
+from walksat import ClauseState
 
 # -----------------------------------------------------------
 # 3-SAT Random Instance Generator
@@ -48,7 +55,11 @@ def increment_unsatisfied_weights(clauses, assignment, weights):
 # -----------------------------------------------------------
 # Hill Climbing with Clause Weighting
 # -----------------------------------------------------------
-def hill_climb_with_weights(clauses, num_vars, max_steps=1000, restarts=10):
+def hill_climb_with_weights(clauses, num_vars, max_steps=1000, restarts=10, metrics=None):
+    """Hill climbing on the weighted score.
+
+    A metrics object (cs307.metrics.SearchMetrics) counts evaluated and committed flips.
+    """
     best_solution = None
     best_score = float('inf')
     weights = [1] * len(clauses)
@@ -71,10 +82,14 @@ def hill_climb_with_weights(clauses, num_vars, max_steps=1000, restarts=10):
                     best_flip = var_idx
                 assignment[var_idx] = not assignment[var_idx]  # revert
 
+            if metrics is not None:
+                metrics.count('generated', num_vars)
             if best_flip is None:
                 break  # Local minimum reached
 
             assignment[best_flip] = not assignment[best_flip]
+            if metrics is not None:
+                metrics.count('accepted')
             increment_unsatisfied_weights(clauses, assignment, weights)
 
         if score < best_score:
@@ -87,7 +102,12 @@ def hill_climb_with_weights(clauses, num_vars, max_steps=1000, restarts=10):
 # -----------------------------------------------------------
 # Beam Search with Clause Weighting
 # -----------------------------------------------------------
-def beam_search_with_weights(clauses, num_vars, beam_width=5, max_steps=1000):
+def beam_search_with_weights(clauses, num_vars, beam_width=5, max_steps=1000, metrics=None):
+    """Beam search on the weighted score.
+
+    A metrics object (cs307.metrics.SearchMetrics) counts evaluated neighbours, one
+    committed flip per beam member per step and new best assignments.
+    """
     beam = [[random.choice([True, False]) for _ in range(num_vars)] for _ in range(beam_width)]
     best_solution = None
     best_score = float('inf')
@@ -100,6 +120,8 @@ def beam_search_with_weights(clauses, num_vars, beam_width=5, max_steps=1000):
             if score < best_score:
                 best_score = score
                 best_solution = assignment
+                if metrics is not None:
+                    metrics.count('improved')
             if score == 0:
                 return assignment, True
 
@@ -113,6 +135,9 @@ def beam_search_with_weights(clauses, num_vars, beam_width=5, max_steps=1000):
         # Keep the top beam_width best candidates
         candidates.sort(key=lambda x: x[1])
         beam = [a for a, _ in candidates[:beam_width]]
+        if metrics is not None:
+            metrics.count('generated', len(candidates))
+            metrics.count('accepted', len(beam))
         increment_unsatisfied_weights(clauses, beam[0], weights)
 
     return best_solution, best_score == 0
@@ -121,41 +146,41 @@ def beam_search_with_weights(clauses, num_vars, beam_width=5, max_steps=1000):
 # -----------------------------------------------------------
 # Variable Neighborhood Descent (VND) with Clause Weighting
 # -----------------------------------------------------------
-def vnd_with_weights(clauses, num_vars, max_steps=1000):
+def vnd_with_weights(clauses, num_vars, max_steps=1000, metrics=None):
+    """VND on the weighted score, with delta-scored moves (see vnd_unsat in k_sat_unsat.py).
+
+    2- and 3-flips are restricted to clause-connected sets touching an unsatisfied clause.
+    A metrics object (cs307.metrics.SearchMetrics) counts evaluated moves and committed flips.
+    """
     def neighborhood_flip_1(_):
         for i in range(num_vars):
             yield (i,)
 
-    def neighborhood_flip_2(_):
-        for i in range(num_vars):
-            for j in range(i + 1, num_vars):
-                yield (i, j)
+    def neighborhood_flip_2(state):
+        return state.flip_sets(2)
 
-    def neighborhood_flip_3(_):
-        for i in range(num_vars):
-            for j in range(i + 1, num_vars):
-                for k in range(j + 1, num_vars):
-                    yield (i, j, k)
+    def neighborhood_flip_3(state):
+        return state.flip_sets(3)
 
     neighborhoods = [neighborhood_flip_1, neighborhood_flip_2, neighborhood_flip_3]
-    assignment = [random.choice([True, False]) for _ in range(num_vars)]
     weights = [1] * len(clauses)
+    state = ClauseState(clauses, num_vars, weights=weights)
 
     for _ in range(max_steps):
-        current_score = weighted_unsatisfied_sum(clauses, assignment, weights)
-        if current_score == 0:
-            return assignment, True
+        if not state.unsat:
+            return state.assignment, True
 
+        single = state.flip_deltas()
         improved = False
         for neighborhood in neighborhoods:
-            for flip_set in neighborhood(assignment):
-                new_assignment = assignment[:]
-                for var_idx in flip_set:
-                    new_assignment[var_idx] = not new_assignment[var_idx]
-                new_score = weighted_unsatisfied_sum(clauses, new_assignment, weights)
-                if new_score < current_score:
-                    assignment = new_assignment
-                    current_score = new_score
+            for flip_set in neighborhood(state):
+                if metrics is not None:
+                    metrics.count('generated')
+                if state.flip_delta(flip_set, single) < 0:
+                    for var_idx in flip_set:
+                        state.flip(var_idx)
+                    if metrics is not None:
+                        metrics.count('accepted', len(flip_set))
                     improved = True
                     break
             if improved:
@@ -163,50 +188,87 @@ def vnd_with_weights(clauses, num_vars, max_steps=1000):
 
         if not improved:
             break
-        increment_unsatisfied_weights(clauses, assignment, weights)
+        # Same rule as increment_unsatisfied_weights, using the tracked unsatisfied set
+        for idx in state.unsat:
+            weights[idx] += 1
 
-    return assignment, current_score == 0
+    return state.assignment, not state.unsat
 
 
 # -----------------------------------------------------------
 # Experiment Runner
 # -----------------------------------------------------------
-def run_experiment(num_vars, num_clauses, trials=5):
-    """Run and compare all clause-weighting-based algorithms."""
-    stats = {
-        'hill_climb': {'success': 0, 'avg_unsat_weight': 0},
-        'beam_3': {'success': 0, 'avg_unsat_weight': 0},
-        'beam_4': {'success': 0, 'avg_unsat_weight': 0},
-        'vnd': {'success': 0, 'avg_unsat_weight': 0},
-    }
-
-    for _ in range(trials):
+def run_experiment(num_vars, num_clauses, trials=5, backend="python", instance_dir=None,
+                   certify=True, certify_timeout=10.0, simplify=True, metrics=None):
+    """Run and compare all clause-weighting-based algorithms.
+
+    backend="numpy" runs beam search on the vectorised evaluator in sat_numpy.py,
+    backend="bitset" on the integer bitset assignments of bitset_sat.py.
+    If instance_dir is given, every generated instance is saved there as DIMACS
+    so the run can be repeated with dimacs.load_instance.
+    With certify=True each instance is first classified by the CDCL solver in cdcl.py;
+    proven-UNSAT instances are skipped and success rates are taken over the rest.
+    With simplify=True the solvers work on the formula reduced by preprocess.py and
+    their answers are mapped back and scored on the original clauses.
+    A metrics object (cs307.metrics.SearchMetrics) times the simplify, certify and
+    per-solver phases.
+    """
+    if backend == "numpy":
+        from sat_numpy import beam_search_with_weights_np as beam_search
+    elif backend == "bitset":
+        from bitset_sat import beam_search_with_weights_bits as beam_search
+    else:
+        beam_search = beam_search_with_weights
+
+    algorithms_to_run = [
+        ('hill_climb', hill_climb_with_weights, {}),
+        ('beam_3', beam_search, {'beam_width': 3}),
+        ('beam_4', beam_search, {'beam_width': 4}),
+        ('vnd', vnd_with_weights, {}),
+    ]
+    stats = {name: {'success': 0, 'avg_unsat_weight': 0} for name, _, _ in algorithms_to_run}
+    ground_truth = {SAT: 0, UNSAT: 0, UNKNOWN: 0}
+    if instance_dir is not None:
+        os.makedirs(instance_dir, exist_ok=True)
+
+    for trial in range(trials):
         clauses = generate_3sat_instance(num_vars, num_clauses)
         weights = [1] * num_clauses
-
-        # Hill Climbing
-        sol, solved = hill_climb_with_weights(clauses, num_vars)
-        stats['hill_climb']['success'] += int(solved)
-        stats['hill_climb']['avg_unsat_weight'] += weighted_unsatisfied_sum(clauses, sol, weights)
-
-        # Beam Search (width = 3)
-        sol, solved = beam_search_with_weights(clauses, num_vars, beam_width=3)
-        stats['beam_3']['success'] += int(solved)
-        stats['beam_3']['avg_unsat_weight'] += weighted_unsatisfied_sum(clauses, sol, weights)
-
-        # Beam Search (width = 4)
-        sol, solved = beam_search_with_weights(clauses, num_vars, beam_width=4)
-        stats['beam_4']['success'] += int(solved)
-        stats['beam_4']['avg_unsat_weight'] += weighted_unsatisfied_sum(clauses, sol, weights)
-
-        # VND
-        sol, solved = vnd_with_weights(clauses, num_vars)
-        stats['vnd']['success'] += int(solved)
-        stats['vnd']['avg_unsat_weight'] += weighted_unsatisfied_sum(clauses, sol, weights)
+        if instance_dir is not None:
+            path = os.path.join(instance_dir, f"uf{num_vars}-{num_clauses}-{trial + 1}.cnf")
+            write_dimacs(path, clauses, num_vars)
+
+        # Simplify once; every solver then works on the smaller formula
+        if simplify:
+            with metrics.phase("simplify") if metrics is not None else nullcontext():
+                reduced = preprocess_formula(clauses, num_vars)
+            if reduced.unsat:
+                ground_truth[UNSAT] += 1
+                continue
+            work_clauses, work_vars, restore = reduced.clauses, reduced.num_vars, reduced.reconstruct
+        else:
+            work_clauses, work_vars, restore = clauses, num_vars, list
+
+        # Certify the instance first: local search can never succeed on UNSAT ones
+        if certify:
+            with metrics.phase("certify") if metrics is not None else nullcontext():
+                status = classify_instance(work_clauses, work_vars, timeout=certify_timeout)
+            ground_truth[status] += 1
+            if status == UNSAT:
+                continue
+
+        for name, solver, kwargs in algorithms_to_run:
+            with metrics.phase(name) if metrics is not None else nullcontext():
+                sol, solved = solver(work_clauses, work_vars, **kwargs)
+            sol = restore(sol)
+            stats[name]['success'] += int(solved)
+            stats[name]['avg_unsat_weight'] += weighted_unsatisfied_sum(clauses, sol, weights)
 
     # Compute averages
+    searched = trials - ground_truth[UNSAT]
     for algo in stats:
-        stats[algo]['avg_unsat_weight'] /= trials
+        stats[algo]['avg_unsat_weight'] /= max(searched, 1)
+    stats['ground_truth'] = ground_truth
 
     return stats
 
@@ -214,15 +276,23 @@ def run_experiment(num_vars, num_clauses, trials=5):
 # -----------------------------------------------------------
 # Run and Display Results
 # -----------------------------------------------------------
-num_vars = 20
-num_clauses = 80
-num_trials = 5
-
-results = run_experiment(num_vars, num_clauses, num_trials)
-
-print(f"\nn = {num_vars}, m = {num_clauses}")
-print("3-SAT Clause Weighting Heuristic: Algorithm Comparison\n")
-print(f"Hill Climbing: Success {results['hill_climb']['success']}/{num_trials}, Avg Unsatisfied Weight: {results['hill_climb']['avg_unsat_weight']:.2f}")
-print(f"Beam Search (width=3): Success {results['beam_3']['success']}/{num_trials}, Avg Unsatisfied Weight: {results['beam_3']['avg_unsat_weight']:.2f}")
-print(f"Beam Search (width=4): Success {results['beam_4']['success']}/{num_trials}, Avg Unsatisfied Weight: {results['beam_4']['avg_unsat_weight']:.2f}")
-print(f"VND: Success {results['vnd']['success']}/{num_trials}, Avg Unsatisfied Weight: {results['vnd']['avg_unsat_weight']:.2f}")
+def main():
+    num_vars = 20
+    num_clauses = 80
+    num_trials = 5
+
+    results = run_experiment(num_vars, num_clauses, num_trials)
+    truth = results['ground_truth']
+    searched = num_trials - truth[UNSAT]
+
+    print(f"\nn = {num_vars}, m = {num_clauses}")
+    print("3-SAT Clause Weighting Heuristic: Algorithm Comparison\n")
+    print(f"Ground truth (CDCL): {truth[SAT]} SAT, {truth[UNSAT]} UNSAT, {truth[UNKNOWN]} unknown\n")
+    print(f"Hill Climbing: Success {results['hill_climb']['success']}/{searched}, Avg Unsatisfied Weight: {results['hill_climb']['avg_unsat_weight']:.2f}")
+    print(f"Beam Search (width=3): Success {results['beam_3']['success']}/{searched}, Avg Unsatisfied Weight: {results['beam_3']['avg_unsat_weight']:.2f}")
+    print(f"Beam Search (width=4): Success {results['beam_4']['success']}/{searched}, Avg Unsatisfied Weight: {results['beam_4']['avg_unsat_weight']:.2f}")
+    print(f"VND: Success {results['vnd']['success']}/{searched}, Avg Unsatisfied Weight: {results['vnd']['avg_unsat_weight']:.2f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -1,4 +1,11 @@
+import os
 import random
+from contextlib import nullcontext
+
+from cdcl import SAT, UNSAT, UNKNOWN, classify_instance
+from dimacs import write_dimacs
+from preprocess import preprocess_formula
+from walksat import ClauseState, walksat, probsat
 
 # ------------------------------------------------------------
 # Generate a Random 3-SAT Problem
@@ -33,8 +40,11 @@ def count_unsatisfied_clauses(clauses, solution):
 # ------------------------------------------------------------
 # Hill Climbing based on Unsatisfied Clauses
 # ------------------------------------------------------------
-def hill_climb_unsat(clauses, num_vars, max_steps=1000):
-    """Performs hill climbing to minimize unsatisfied clauses."""
+def hill_climb_unsat(clauses, num_vars, max_steps=1000, metrics=None):
+    """Performs hill climbing to minimize unsatisfied clauses.
+
+    A metrics object (cs307.metrics.SearchMetrics) counts evaluated and committed flips.
+    """
     solution = [random.choice([True, False]) for _ in range(num_vars)]
     for _ in range(max_steps):
         current_unsat = count_unsatisfied_clauses(clauses, solution)
@@ -52,9 +62,13 @@ def hill_climb_unsat(clauses, num_vars, max_steps=1000):
                 best_flip = var_idx
             solution[var_idx] = not solution[var_idx]  # revert change
 
+        if metrics is not None:
+            metrics.count('generated', num_vars)
         if best_flip is None:
             break  # No improvement
         solution[best_flip] = not solution[best_flip]  # commit the best move
+        if metrics is not None:
+            metrics.count('accepted')
 
     return solution, False
 
@@ -62,8 +76,12 @@ def hill_climb_unsat(clauses, num_vars, max_steps=1000):
 # ------------------------------------------------------------
 # Beam Search based on Unsatisfied Clauses
 # ------------------------------------------------------------
-def beam_search_unsat(clauses, num_vars, beam_width=3, max_steps=1000):
-    """Performs beam search using unsatisfied clauses heuristic."""
+def beam_search_unsat(clauses, num_vars, beam_width=3, max_steps=1000, metrics=None):
+    """Performs beam search using unsatisfied clauses heuristic.
+
+    A metrics object (cs307.metrics.SearchMetrics) counts evaluated neighbours, one
+    committed flip per beam member per step and new best assignments.
+    """
     beam = [[random.choice([True, False]) for _ in range(num_vars)] for _ in range(beam_width)]
     best_solution = None
     best_unsat = float('inf')
@@ -75,6 +93,8 @@ def beam_search_unsat(clauses, num_vars, beam_width=3, max_steps=1000):
             if current_unsat < best_unsat:
                 best_unsat = current_unsat
                 best_solution = solution
+                if metrics is not None:
+                    metrics.count('improved')
             if current_unsat == 0:
                 return solution, True
 
@@ -87,6 +107,9 @@ def beam_search_unsat(clauses, num_vars, beam_width=3, max_steps=1000):
         # Keep top 'beam_width' candidates with least unsatisfied clauses
         candidate_pool.sort(key=lambda x: x[1])
         beam = [sol for sol, _ in candidate_pool[:beam_width]]
+        if metrics is not None:
+            metrics.count('generated', len(candidate_pool))
+            metrics.count('accepted', len(beam))
 
     return best_solution, False
 
@@ -94,42 +117,45 @@ def beam_search_unsat(clauses, num_vars, beam_width=3, max_steps=1000):
 # ------------------------------------------------------------
 # Variable Neighborhood Descent (VND)
 # ------------------------------------------------------------
-def vnd_unsat(clauses, num_vars, max_steps=1000):
-    """Uses Variable Neighborhood Descent to reduce unsatisfied clauses."""
+def vnd_unsat(clauses, num_vars, max_steps=1000, metrics=None):
+    """Uses Variable Neighborhood Descent to reduce unsatisfied clauses.
+
+    Moves are scored incrementally instead of rescanning every clause: 1-flips from
+    make/break counts, 2- and 3-flips from summed single-flip deltas corrected on the
+    clauses the flipped variables share. The 2- and 3-flip neighborhoods only contain
+    clause-connected variable sets that touch an unsatisfied clause (ClauseState.flip_sets),
+    which loses no improving move.
+    A metrics object (cs307.metrics.SearchMetrics) counts evaluated moves and committed flips.
+    """
 
     def neighborhood_1(_):
         for i in range(num_vars):
             yield (i,)
 
-    def neighborhood_2(_):
-        for i in range(num_vars):
-            for j in range(i + 1, num_vars):
-                yield (i, j)
+    def neighborhood_2(state):
+        return state.flip_sets(2)
 
-    def neighborhood_3(_):
-        for i in range(num_vars):
-            for j in range(i + 1, num_vars):
-                for k in range(j + 1, num_vars):
-                    yield (i, j, k)
+    def neighborhood_3(state):
+        return state.flip_sets(3)
 
     neighborhoods = [neighborhood_1, neighborhood_2, neighborhood_3]
-    solution = [random.choice([True, False]) for _ in range(num_vars)]
+    state = ClauseState(clauses, num_vars)
 
     for _ in range(max_steps):
-        current_unsat = count_unsatisfied_clauses(clauses, solution)
-        if current_unsat == 0:
-            return solution, True
+        if not state.unsat:
+            return state.assignment, True
 
+        single = state.flip_deltas()
         improved = False
         for neighborhood in neighborhoods:
-            for flip_indices in neighborhood(solution):
-                new_solution = solution[:]
-                for idx in flip_indices:
-                    new_solution[idx] = not new_solution[idx]
-                new_unsat = count_unsatisfied_clauses(clauses, new_solution)
-                if new_unsat < current_unsat:
-                    solution = new_solution
-                    current_unsat = new_unsat
+            for flip_indices in neighborhood(state):
+                if metrics is not None:
+                    metrics.count('generated')
+                if state.flip_delta(flip_indices, single) < 0:
+                    for idx in flip_indices:
+                        state.flip(idx)
+                    if metrics is not None:
+                        metrics.count('accepted', len(flip_indices))
                     improved = True
                     break
             if improved:
@@ -138,46 +164,83 @@ def vnd_unsat(clauses, num_vars, max_steps=1000):
         if not improved:
             break
 
-    return solution, False
+    return state.assignment, False
 
 
 # ------------------------------------------------------------
 # Experiment Runner
 # ------------------------------------------------------------
-def run_experiment(num_vars, num_clauses, trials=10):
-    """Compares hill climbing, beam search, and VND on random 3-SAT problems."""
-    stats = {
-        'hill_climb': {'success': 0, 'avg_unsat': 0},
-        'beam_3': {'success': 0, 'avg_unsat': 0},
-        'beam_4': {'success': 0, 'avg_unsat': 0},
-        'vnd': {'success': 0, 'avg_unsat': 0},
-    }
-
-    for _ in range(trials):
+def run_experiment(num_vars, num_clauses, trials=10, backend="python", instance_dir=None,
+                   certify=True, certify_timeout=10.0, simplify=True, metrics=None):
+    """Compares hill climbing, beam search, VND and WalkSAT/probSAT on random 3-SAT problems.
+
+    backend="numpy" runs beam search on the vectorised evaluator in sat_numpy.py,
+    backend="bitset" on the integer bitset assignments of bitset_sat.py.
+    If instance_dir is given, every generated instance is saved there as DIMACS
+    so the run can be repeated with dimacs.load_instance.
+    With certify=True each instance is first classified by the CDCL solver in cdcl.py;
+    proven-UNSAT instances are skipped and success rates are taken over the rest.
+    With simplify=True the solvers work on the formula reduced by preprocess.py and
+    their answers are mapped back and scored on the original clauses.
+    A metrics object (cs307.metrics.SearchMetrics) times the simplify, certify and
+    per-solver phases.
+    """
+    if backend == "numpy":
+        from sat_numpy import beam_search_unsat_np as beam_search
+    elif backend == "bitset":
+        from bitset_sat import beam_search_bits as beam_search
+    else:
+        beam_search = beam_search_unsat
+
+    algorithms_to_run = [
+        ('hill_climb', hill_climb_unsat, {}),
+        ('beam_3', beam_search, {'beam_width': 3}),
+        ('beam_4', beam_search, {'beam_width': 4}),
+        ('vnd', vnd_unsat, {}),
+        ('walksat', walksat, {}),
+        ('probsat', probsat, {}),
+    ]
+    stats = {name: {'success': 0, 'avg_unsat': 0} for name, _, _ in algorithms_to_run}
+    ground_truth = {SAT: 0, UNSAT: 0, UNKNOWN: 0}
+    if instance_dir is not None:
+        os.makedirs(instance_dir, exist_ok=True)
+
+    for trial in range(trials):
         clauses = generate_3sat_instance(num_vars, num_clauses)
-
-        # Hill Climbing
-        sol, solved = hill_climb_unsat(clauses, num_vars)
-        stats['hill_climb']['success'] += int(solved)
-        stats['hill_climb']['avg_unsat'] += count_unsatisfied_clauses(clauses, sol)
-
-        # Beam Search (width = 3)
-        sol, solved = beam_search_unsat(clauses, num_vars, beam_width=3)
-        stats['beam_3']['success'] += int(solved)
-        stats['beam_3']['avg_unsat'] += count_unsatisfied_clauses(clauses, sol)
-
-        # Beam Search (width = 4)
-        sol, solved = beam_search_unsat(clauses, num_vars, beam_width=4)
-        stats['beam_4']['success'] += int(solved)
-        stats['beam_4']['avg_unsat'] += count_unsatisfied_clauses(clauses, sol)
-
-        # Variable Neighborhood Descent
-        sol, solved = vnd_unsat(clauses, num_vars)
-        stats['vnd']['success'] += int(solved)
-        stats['vnd']['avg_unsat'] += count_unsatisfied_clauses(clauses, sol)
-
+        if instance_dir is not None:
+            path = os.path.join(instance_dir, f"uf{num_vars}-{num_clauses}-{trial + 1}.cnf")
+            write_dimacs(path, clauses, num_vars)
+
+        # Simplify once; every solver then works on the smaller formula
+        if simplify:
+            with metrics.phase("simplify") if metrics is not None else nullcontext():
+                reduced = preprocess_formula(clauses, num_vars)
+            if reduced.unsat:
+                ground_truth[UNSAT] += 1
+                continue
+            work_clauses, work_vars, restore = reduced.clauses, reduced.num_vars, reduced.reconstruct
+        else:
+            work_clauses, work_vars, restore = clauses, num_vars, list
+
+        # Certify the instance first: local search can never succeed on UNSAT ones
+        if certify:
+            with metrics.phase("certify") if metrics is not None else nullcontext():
+                status = classify_instance(work_clauses, work_vars, timeout=certify_timeout)
+            ground_truth[status] += 1
+            if status == UNSAT:
+                continue
+
+        for name, solver, kwargs in algorithms_to_run:
+            with metrics.phase(name) if metrics is not None else nullcontext():
+                sol, solved = solver(work_clauses, work_vars, **kwargs)
+            sol = restore(sol)
+            stats[name]['success'] += int(solved)
+            stats[name]['avg_unsat'] += count_unsatisfied_clauses(clauses, sol)
+
+    searched = trials - ground_truth[UNSAT]
     for algo in stats:
-        stats[algo]['avg_unsat'] /= trials
+        stats[algo]['avg_unsat'] /= max(searched, 1)
+    stats['ground_truth'] = ground_truth
 
     return stats
 
@@ -185,16 +248,25 @@ def run_experiment(num_vars, num_clauses, trials=10):
 # ------------------------------------------------------------
 # Run and Display Results
 # ------------------------------------------------------------
-num_vars = 20
-num_clauses = 80
-num_trials = 5
-
-results = run_experiment(num_vars, num_clauses, num_trials)
-
-print(f"n = {num_vars}, m = {num_clauses}")
-print("Comparison Results for 3-SAT Problem (Unsatisfied Clause Heuristic):\n")
-print(f"Hill Climbing: Success Rate: {results['hill_climb']['success']}/{num_trials}, Avg Unsatisfied: {results['hill_climb']['avg_unsat']:.2f}")
-print(f"Beam Search (width=3): Success Rate: {results['beam_3']['success']}/{num_trials}, Avg Unsatisfied: {results['beam_3']['avg_unsat']:.2f}")
-print(f"Beam Search (width=4): Success Rate: {results['beam_4']['success']}/{num_trials}, Avg Unsatisfied: {results['beam_4']['avg_unsat']:.2f}")
-print(f"VND: Success Rate: {results['vnd']['success']}/{num_trials}, Avg Unsatisfied: {results['vnd']['avg_unsat']:.2f}")
-
+def main():
+    num_vars = 20
+    num_clauses = 80
+    num_trials = 5
+
+    results = run_experiment(num_vars, num_clauses, num_trials)
+    truth = results['ground_truth']
+    searched = num_trials - truth[UNSAT]
+
+    print(f"n = {num_vars}, m = {num_clauses}")
+    print("Comparison Results for 3-SAT Problem (Unsatisfied Clause Heuristic):\n")
+    print(f"Ground truth (CDCL): {truth[SAT]} SAT, {truth[UNSAT]} UNSAT, {truth[UNKNOWN]} unknown\n")
+    print(f"Hill Climbing: Success Rate: {results['hill_climb']['success']}/{searched}, Avg Unsatisfied: {results['hill_climb']['avg_unsat']:.2f}")
+    print(f"Beam Search (width=3): Success Rate: {results['beam_3']['success']}/{searched}, Avg Unsatisfied: {results['beam_3']['avg_unsat']:.2f}")
+    print(f"Beam Search (width=4): Success Rate: {results['beam_4']['success']}/{searched}, Avg Unsatisfied: {results['beam_4']['avg_unsat']:.2f}")
+    print(f"VND: Success Rate: {results['vnd']['success']}/{searched}, Avg Unsatisfied: {results['vnd']['avg_unsat']:.2f}")
+    print(f"WalkSAT: Success Rate: {results['walksat']['success']}/{searched}, Avg Unsatisfied: {results['walksat']['avg_unsat']:.2f}")
+    print(f"probSAT: Success Rate: {results['probsat']['success']}/{searched}, Avg Unsatisfied: {results['probsat']['avg_unsat']:.2f}")
+
+
+if __name__ == "__main__":
+    main()
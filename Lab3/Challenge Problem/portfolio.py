@@ -0,0 +1,217 @@
+import importlib
+import multiprocessing as mp
+import os
+import queue
+import random
+import time
+from array import array
+from multiprocessing import shared_memory
+
+from k_sat_unsat import count_unsatisfied_clauses, generate_3sat_instance
+
+# ------------------------------------------------------------
+# Solver Registry
+# ------------------------------------------------------------
+# name -> (module, function, keyword arguments); looked up by name inside the workers.
+# Ordered fastest first (about 1 ms for WalkSAT/probSAT, 20 ms for VND/hill climbing
+# and 7-14 s for beam search on n=20, m=80): the portfolio dispatches in this order,
+# so with fewer workers than runs the quick solvers are never queued behind beam search.
+SOLVERS = {
+    'walksat': ('walksat', 'walksat', {}),
+    'probsat': ('walksat', 'probsat', {}),
+    'vnd': ('k_sat_unsat', 'vnd_unsat', {}),
+    'hill_climb': ('k_sat_unsat', 'hill_climb_unsat', {}),
+    'vnd_weighted': ('k_sat', 'vnd_with_weights', {}),
+    'hill_climb_weighted': ('k_sat', 'hill_climb_with_weights', {}),
+    'beam_3': ('k_sat_unsat', 'beam_search_unsat', {'beam_width': 3}),
+    'beam_4': ('k_sat_unsat', 'beam_search_unsat', {'beam_width': 4}),
+    'beam_3_weighted': ('k_sat', 'beam_search_with_weights', {'beam_width': 3}),
+}
+
+DEFAULT_SOLVERS = ('walksat', 'probsat', 'vnd', 'hill_climb', 'beam_3', 'beam_4')
+
+
+# ------------------------------------------------------------
+# Shared-Memory Instance
+# ------------------------------------------------------------
+class SharedInstance:
+    """
+    A clause list flattened into one shared int32 block laid out as
+    [num_vars, num_clauses, offsets (num_clauses + 1), literals], so workers
+    attach by name instead of receiving a pickled copy.
+    """
+
+    def __init__(self, clauses, num_vars):
+        data = array('i', [num_vars, len(clauses), 0])
+        for clause in clauses:
+            data.append(data[-1] + len(clause))
+        for clause in clauses:
+            data.extend(clause)
+        payload = data.tobytes()
+        self.shm = shared_memory.SharedMemory(create=True, size=len(payload))
+        self.shm.buf[:len(payload)] = payload
+
+    @property
+    def name(self):
+        return self.shm.name
+
+    def release(self):
+        self.shm.close()
+        self.shm.unlink()
+
+    @staticmethod
+    def load(name):
+        """Attach to a shared instance and return (clauses, num_vars)."""
+        shm = _attach(name)
+        view = shm.buf.cast('i')
+        num_vars, num_clauses = view[0], view[1]
+        offsets = view[2:3 + num_clauses].tolist()
+        literals = view[3 + num_clauses:3 + num_clauses + offsets[-1]].tolist()
+        view.release()
+        shm.close()
+        clauses = [literals[offsets[i]:offsets[i + 1]] for i in range(num_clauses)]
+        return clauses, num_vars
+
+
+def _attach(name):
+    try:
+        # Only the parent owns (and unlinks) the block
+        return shared_memory.SharedMemory(name=name, track=False)
+    except TypeError:
+        # Python < 3.13 has no track flag; workers share the parent's resource tracker
+        return shared_memory.SharedMemory(name=name)
+
+
+# ------------------------------------------------------------
+# Worker
+# ------------------------------------------------------------
+def _run_solver(shm_name, solver_name, seed, results):
+    clauses, num_vars = SharedInstance.load(shm_name)
+    module, function, kwargs = SOLVERS[solver_name]
+    solver = getattr(importlib.import_module(module), function)
+    random.seed(seed)
+    start = time.perf_counter()
+    assignment, solved = solver(clauses, num_vars, **kwargs)
+    elapsed = time.perf_counter() - start
+    results.put((solver_name, seed, solved, assignment,
+                 count_unsatisfied_clauses(clauses, assignment), elapsed))
+
+
+# ------------------------------------------------------------
+# Portfolio Driver
+# ------------------------------------------------------------
+def solve_portfolio(clauses, num_vars, solvers=DEFAULT_SOLVERS, seeds=(0, 1, 2),
+                    max_workers=None, timeout=None, metrics=None):
+    """
+    Run every (solver, seed) pair in its own worker process, at most max_workers at a
+    time, and terminate the remaining workers as soon as one reports a satisfying
+    assignment. Runs start round-robin over the solvers, fastest first (SOLVERS order),
+    for seed after seed. Returns a dict with the winner, wall time and one record per
+    finished run.
+    A metrics object (cs307.metrics.SearchMetrics) counts started and cancelled runs,
+    keeps the peak number of live workers and adds each finished run's solver time
+    as a phase named after the solver.
+    """
+    max_workers = max_workers or os.cpu_count() or 1
+    ctx = mp.get_context()
+    results = ctx.Queue()
+    shared = SharedInstance(clauses, num_vars)
+    solvers = sorted(solvers, key=list(SOLVERS).index)
+    pending = [(name, seed) for seed in seeds for name in solvers][::-1]
+    running = {}
+    runs = []
+    best = None
+    winner = None
+    start = time.perf_counter()
+    deadline = None if timeout is None else start + timeout
+
+    try:
+        while (pending or running) and winner is None:
+            while pending and len(running) < max_workers:
+                task = pending.pop()
+                process = ctx.Process(target=_run_solver, args=(shared.name, *task, results), daemon=True)
+                process.start()
+                running[task] = process
+                if metrics is not None:
+                    metrics.count('started')
+                    metrics.peak('workers', len(running))
+
+            if deadline is not None and time.perf_counter() > deadline:
+                break
+            try:
+                name, seed, solved, assignment, unsat, elapsed = results.get(timeout=0.05)
+            except queue.Empty:
+                # A worker that died without reporting (e.g. killed) frees its slot
+                for task, process in list(running.items()):
+                    if process.exitcode not in (None, 0):
+                        running.pop(task)
+                        runs.append({'solver': task[0], 'seed': task[1], 'solved': False,
+                                     'unsat': None, 'time': None, 'error': process.exitcode})
+                continue
+
+            running.pop((name, seed)).join()
+            runs.append({'solver': name, 'seed': seed, 'solved': solved,
+                         'unsat': unsat, 'time': elapsed, 'error': None})
+            if metrics is not None:
+                metrics.add_time(name, elapsed)
+            if best is None or unsat < best[0]:
+                best = (unsat, assignment)
+            if solved:
+                winner = {'solver': name, 'seed': seed, 'time': elapsed,
+                          'wall_time': time.perf_counter() - start}
+    finally:
+        for process in running.values():
+            process.terminate()
+        for process in running.values():
+            process.join()
+        shared.release()
+
+    if metrics is not None:
+        metrics.count('cancelled', len(running) + len(pending))
+    return {
+        'solved': winner is not None,
+        'assignment': best[1] if best else None,
+        'winner': winner,
+        'wall_time': time.perf_counter() - start,
+        'cancelled': len(running) + len(pending),
+        'runs': runs,
+    }
+
+
+# ------------------------------------------------------------
+# Portfolio Experiment
+# ------------------------------------------------------------
+def run_portfolio_experiment(num_vars, num_clauses, trials=5, solvers=DEFAULT_SOLVERS,
+                             seeds=(0, 1, 2), max_workers=None, timeout=None):
+    """Race the portfolio on random 3-SAT instances and tally which solver wins."""
+    wins = {name: 0 for name in solvers}
+    solved_count = 0
+    total_wall = 0.0
+
+    for _ in range(trials):
+        clauses = generate_3sat_instance(num_vars, num_clauses)
+        result = solve_portfolio(clauses, num_vars, solvers, seeds, max_workers, timeout)
+        total_wall += result['wall_time']
+        if result['solved']:
+            solved_count += 1
+            wins[result['winner']['solver']] += 1
+
+    return {'solved': solved_count, 'wins': wins, 'avg_wall_time': total_wall / trials}
+
+
+def main():
+    num_vars = 20
+    num_clauses = 80
+    num_trials = 5
+
+    results = run_portfolio_experiment(num_vars, num_clauses, num_trials)
+
+    print(f"n = {num_vars}, m = {num_clauses}")
+    print("3-SAT Solver Portfolio (first to solve wins):\n")
+    print(f"Solved: {results['solved']}/{num_trials}, Avg Wall Time: {results['avg_wall_time']:.3f} s")
+    for name, count in results['wins'].items():
+        print(f"{name}: {count} wins")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,142 @@
+import itertools
+
+# ------------------------------------------------------------
+# Preprocessing Result
+# ------------------------------------------------------------
+class PreprocessResult:
+    """
+    A reduced formula over variables 1..num_vars plus what is needed to map a
+    solution of it back onto the original variables.
+    """
+
+    def __init__(self, clauses, num_vars, original_num_vars, fixed, new_to_old, unsat):
+        self.clauses = clauses
+        self.num_vars = num_vars
+        self.original_num_vars = original_num_vars
+        self.fixed = fixed              # original variable -> value forced by preprocessing
+        self.new_to_old = new_to_old    # new_to_old[i] is the original variable of reduced variable i + 1
+        self.unsat = unsat              # an empty clause was derived
+
+    def reconstruct(self, assignment):
+        """Extend an assignment of the reduced formula to one of the original formula."""
+        full = [True] * self.original_num_vars  # variables left in no clause are free
+        for var, value in self.fixed.items():
+            full[var - 1] = value
+        for idx, var in enumerate(self.new_to_old):
+            full[var - 1] = assignment[idx]
+        return full
+
+
+# ------------------------------------------------------------
+# Simplification Passes
+# ------------------------------------------------------------
+class _Simplifier:
+    def __init__(self, clauses, num_vars):
+        self.num_vars = num_vars
+        self.fixed = {}
+        self.unsat = False
+        self.clauses = {}   # clause id -> frozenset of literals
+        self.occurrences = {}   # literal -> ids of the clauses containing it
+        self.units = []
+        self.ids = itertools.count()
+
+        seen = set()
+        for clause in clauses:
+            lits = frozenset(clause)
+            if lits in seen or any(-lit in lits for lit in lits):
+                continue  # duplicate clause or tautology
+            seen.add(lits)
+            self._add(lits)
+
+    def _add(self, lits):
+        if not lits:
+            self.unsat = True
+            return
+        idx = next(self.ids)
+        self.clauses[idx] = lits
+        for lit in lits:
+            self.occurrences.setdefault(lit, set()).add(idx)
+        if len(lits) == 1:
+            self.units.append(idx)
+
+    def _remove(self, idx):
+        for lit in self.clauses.pop(idx):
+            self.occurrences[lit].discard(idx)
+
+    def _assign(self, lit):
+        """Fix lit to true: drop the clauses it satisfies and strip -lit from the rest."""
+        self.fixed[abs(lit)] = lit > 0
+        for idx in list(self.occurrences.get(lit, ())):
+            self._remove(idx)
+        for idx in list(self.occurrences.get(-lit, ())):
+            lits = self.clauses[idx]
+            self._remove(idx)
+            self._add(lits - {-lit})
+
+    def unit_propagate(self):
+        changed = False
+        while self.units and not self.unsat:
+            idx = self.units.pop()
+            if idx not in self.clauses:
+                continue
+            (lit,) = self.clauses[idx]
+            if abs(lit) in self.fixed:
+                continue
+            self._assign(lit)
+            changed = True
+        return changed
+
+    def eliminate_pure_literals(self):
+        changed = False
+        for lit in list(self.occurrences):
+            if self.occurrences[lit] and not self.occurrences.get(-lit) and abs(lit) not in self.fixed:
+                self._assign(lit)
+                changed = True
+        return changed
+
+    def remove_subsumed(self):
+        """Drop every clause that is a superset of another clause (backward subsumption)."""
+        changed = False
+        for idx in sorted(self.clauses, key=lambda i: len(self.clauses[i])):
+            if idx not in self.clauses:
+                continue
+            lits = self.clauses[idx]
+            # Any clause subsumed by lits must contain its rarest literal
+            rarest = min(lits, key=lambda lit: len(self.occurrences[lit]))
+            for other in list(self.occurrences[rarest]):
+                if other != idx and lits <= self.clauses[other]:
+                    self._remove(other)
+                    changed = True
+        return changed
+
+    def run(self):
+        while not self.unsat:
+            changed = self.unit_propagate()
+            if self.unsat:
+                break
+            changed |= self.eliminate_pure_literals()
+            changed |= self.remove_subsumed()
+            if not changed:
+                break
+
+
+# ------------------------------------------------------------
+# Public Entry Point
+# ------------------------------------------------------------
+def preprocess_formula(clauses, num_vars):
+    """
+    Simplify a CNF formula with unit propagation, pure-literal elimination and
+    duplicate/subsumed clause removal, then renumber the remaining variables densely.
+    The result's reconstruct() maps a reduced assignment back to all num_vars variables.
+    """
+    simplifier = _Simplifier(clauses, num_vars)
+    simplifier.run()
+    if simplifier.unsat:
+        return PreprocessResult([], 0, num_vars, simplifier.fixed, [], True)
+
+    remaining = sorted(simplifier.clauses.values(), key=lambda lits: sorted(lits, key=abs))
+    new_to_old = sorted({abs(lit) for lits in remaining for lit in lits})
+    old_to_new = {var: idx + 1 for idx, var in enumerate(new_to_old)}
+    reduced = [sorted((old_to_new[lit] if lit > 0 else -old_to_new[-lit] for lit in lits), key=abs)
+               for lits in remaining]
+    return PreprocessResult(reduced, len(new_to_old), num_vars, simplifier.fixed, new_to_old, False)
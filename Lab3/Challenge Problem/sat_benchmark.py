@@ -0,0 +1,125 @@
+import argparse
+import csv
+import importlib
+import os
+import random
+import sys
+import time
+from concurrent.futures import ProcessPoolExecutor
+
+from k_sat_unsat import count_unsatisfied_clauses, generate_3sat_instance
+from portfolio import SOLVERS
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__)))))
+from cs307.metrics import SearchMetrics  # noqa: E402
+
+# ------------------------------------------------------------
+# Single Benchmark Run
+# ------------------------------------------------------------
+def benchmark_run(solver_name, num_vars, ratio, seed):
+    """
+    Solve one random instance with one solver and return a result row.
+    The instance depends only on (num_vars, ratio, seed), so every solver sees the same one.
+    """
+    num_clauses = round(ratio * num_vars)
+    random.seed(f"instance-{num_vars}-{num_clauses}-{seed}")
+    clauses = generate_3sat_instance(num_vars, num_clauses)
+
+    module, function, kwargs = SOLVERS[solver_name]
+    solver = getattr(importlib.import_module(module), function)
+    metrics = SearchMetrics()
+    random.seed(seed)
+    start = time.perf_counter()
+    assignment, solved = solver(clauses, num_vars, metrics=metrics, **kwargs)
+    elapsed = time.perf_counter() - start
+
+    return {
+        'solver': solver_name,
+        'n': num_vars,
+        'ratio': ratio,
+        'm': num_clauses,
+        'seed': seed,
+        'solved': bool(solved),
+        'time': elapsed,
+        'flips': metrics.counters.get('accepted', 0),
+        'unsat': count_unsatisfied_clauses(clauses, assignment),
+    }
+
+
+def _benchmark_task(task):
+    return benchmark_run(*task)
+
+
+# ------------------------------------------------------------
+# Phase-Transition Sweep
+# ------------------------------------------------------------
+def sweep(sizes, ratios, seeds, solvers, max_workers=None):
+    """Run every (solver, n, m/n, seed) combination in a process pool; returns raw rows."""
+    tasks = [(solver, n, ratio, seed)
+             for n in sizes for ratio in ratios for seed in seeds for solver in solvers]
+    with ProcessPoolExecutor(max_workers=max_workers) as pool:
+        return list(pool.map(_benchmark_task, tasks, chunksize=max(1, len(tasks) // 64)))
+
+
+def summarize(rows):
+    """Aggregate raw rows per (solver, n, ratio)."""
+    groups = {}
+    for row in rows:
+        groups.setdefault((row['solver'], row['n'], row['ratio']), []).append(row)
+
+    summary = []
+    for (solver, n, ratio), group in groups.items():
+        solved = [row for row in group if row['solved']]
+        total_time = sum(row['time'] for row in group)
+        summary.append({
+            'solver': solver,
+            'n': n,
+            'ratio': ratio,
+            'runs': len(group),
+            'success_rate': len(solved) / len(group),
+            'flips_per_sec': sum(row['flips'] for row in group) / total_time if total_time else 0.0,
+            'mean_time_to_solution': sum(row['time'] for row in solved) / len(solved) if solved else '',
+            'mean_final_unsat': sum(row['unsat'] for row in group) / len(group),
+        })
+    return summary
+
+
+def write_csv(path, rows):
+    with open(path, 'w', newline='') as file:
+        writer = csv.DictWriter(file, fieldnames=list(rows[0]))
+        writer.writeheader()
+        writer.writerows(rows)
+
+
+# ------------------------------------------------------------
+# Command Line Entry Point
+# ------------------------------------------------------------
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Sweep n and m/n for the 3-SAT solvers and write CSV.")
+    parser.add_argument('--sizes', type=int, nargs='+', default=[20, 50, 100])
+    parser.add_argument('--ratios', type=float, nargs='+', default=[3.0, 3.5, 4.0, 4.26, 4.5, 5.0])
+    parser.add_argument('--seeds', type=int, default=10, help="instances per (n, m/n) cell")
+    parser.add_argument('--solvers', nargs='+', default=['hill_climb', 'beam_3', 'vnd', 'walksat', 'probsat'],
+                        choices=sorted(SOLVERS))
+    parser.add_argument('--workers', type=int, default=None)
+    parser.add_argument('--out', default='sat_benchmark.csv')
+    parser.add_argument('--raw', default=None, help="optional CSV path for the per-run rows")
+    args = parser.parse_args(argv)
+
+    start = time.perf_counter()
+    rows = sweep(args.sizes, args.ratios, range(args.seeds), args.solvers, args.workers)
+    summary = summarize(rows)
+    write_csv(args.out, summary)
+    if args.raw:
+        write_csv(args.raw, rows)
+
+    print(f"{len(rows)} runs on {args.workers or os.cpu_count()} workers in {time.perf_counter() - start:.1f} s")
+    for row in summary:
+        print(f"{row['solver']:>12} n={row['n']:<4} m/n={row['ratio']:<5} "
+              f"success={row['success_rate']:.2f} flips/s={row['flips_per_sec']:.0f} "
+              f"unsat={row['mean_final_unsat']:.2f}")
+    print(f"Summary written to {args.out}")
+
+
+if __name__ == "__main__":
+    main()
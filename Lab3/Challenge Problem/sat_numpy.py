@@ -0,0 +1,116 @@
+import random
+
+import numpy as np
+
+# ------------------------------------------------------------
+# Clause and Assignment Encoding
+# ------------------------------------------------------------
+def clauses_to_array(clauses):
+    """Pack clauses into an (m, k) int32 literal array; shorter clauses are padded with 0."""
+    width = max((len(clause) for clause in clauses), default=3)
+    literals = np.zeros((len(clauses), width), dtype=np.int32)
+    for idx, clause in enumerate(clauses):
+        literals[idx, :len(clause)] = clause
+    return literals
+
+
+def random_assignments(count, num_vars):
+    """Draw `count` random assignments as a (count, n) boolean array."""
+    rows = [[random.choice([True, False]) for _ in range(num_vars)] for _ in range(count)]
+    return np.array(rows, dtype=bool).reshape(count, num_vars)
+
+
+# ------------------------------------------------------------
+# Batched Clause Evaluation
+# ------------------------------------------------------------
+def literal_truth(literals, assignments):
+    """Truth value of every literal for a (b, n) batch of assignments, shape (b, m, k)."""
+    var_idx = np.maximum(np.abs(literals) - 1, 0)
+    values = assignments[:, var_idx]
+    return np.where(literals > 0, values, ~values) & (literals != 0)
+
+
+def unsatisfied_mask(literals, assignments):
+    """(b, m) mask of the clauses left unsatisfied by each assignment in the batch."""
+    return ~literal_truth(literals, assignments).any(axis=2)
+
+
+def score_flip_neighbours(literals, assignments, weights):
+    """
+    Score all n single-flip neighbours of every assignment in one batched pass.
+
+    Returns (current, scores): current[b] is the unsatisfied weight of assignment b
+    and scores[b, v] the unsatisfied weight after flipping variable v in it.
+    Assumes the variables inside a clause are distinct.
+    """
+    batch, num_vars = assignments.shape
+    truth = literal_truth(literals, assignments)
+    true_count = truth.sum(axis=2)
+    unsat = true_count == 0
+    current = unsat.astype(np.int64) @ weights
+
+    # Flipping any variable of an unsatisfied clause satisfies it ("make"),
+    # flipping the only true literal of a clause falsifies it ("break").
+    clause_weights = np.broadcast_to(weights[None, :, None], truth.shape)
+    delta = np.where(unsat[:, :, None], -clause_weights, 0)
+    delta = delta + np.where(truth & (true_count == 1)[:, :, None], clause_weights, 0)
+    delta = np.where(literals != 0, delta, 0)
+
+    var_idx = np.maximum(np.abs(literals) - 1, 0)
+    flat_idx = np.arange(batch)[:, None, None] * num_vars + var_idx[None, :, :]
+    per_var = np.bincount(flat_idx.ravel(), weights=delta.ravel(), minlength=batch * num_vars)
+    scores = current[:, None] + per_var.reshape(batch, num_vars).astype(np.int64)
+    return current, scores
+
+
+# ------------------------------------------------------------
+# Vectorised Beam Search
+# ------------------------------------------------------------
+def _beam_search(clauses, num_vars, beam_width, max_steps, reweight, metrics):
+    literals = clauses_to_array(clauses)
+    weights = np.ones(len(clauses), dtype=np.int64)
+    beam = random_assignments(beam_width, num_vars)
+    # The starting beam is the best so far, so max_steps=0 still returns an assignment
+    start = unsatisfied_mask(literals, beam).sum(axis=1)
+    best_solution = beam[int(np.argmin(start))].copy()
+    best_score = int(start.min())
+
+    for _ in range(max_steps):
+        current, scores = score_flip_neighbours(literals, beam, weights)
+        leader = int(np.argmin(current))
+        if current[leader] < best_score:
+            best_score = int(current[leader])
+            best_solution = beam[leader].copy()
+            if metrics is not None:
+                metrics.count('improved')
+        if current[leader] == 0:
+            return beam[leader].tolist(), True
+
+        # Keep the top 'beam_width' neighbours without sorting the whole pool
+        flat_scores = scores.ravel()
+        keep = min(beam_width, flat_scores.size)
+        if keep == 0:
+            break
+        top = np.argpartition(flat_scores, keep - 1)[:keep]
+        rows, flips = np.divmod(top, num_vars)
+        beam = beam[rows]
+        beam[np.arange(keep), flips] ^= True
+        if metrics is not None:
+            metrics.count('generated', flat_scores.size)
+            metrics.count('accepted', keep)
+
+        if reweight:
+            leader = int(np.argmin(flat_scores[top]))
+            weights += unsatisfied_mask(literals, beam[leader:leader + 1])[0]
+
+    return best_solution.tolist(), best_score == 0
+
+
+def beam_search_unsat_np(clauses, num_vars, beam_width=3, max_steps=1000, metrics=None):
+    """Vectorised counterpart of `beam_search_unsat` (unsatisfied clause count heuristic)."""
+    return _beam_search(clauses, num_vars, beam_width, max_steps, False, metrics)
+
+
+def beam_search_with_weights_np(clauses, num_vars, beam_width=5, max_steps=1000, metrics=None):
+    """Vectorised counterpart of `beam_search_with_weights` (clause weighting heuristic)."""
+    return _beam_search(clauses, num_vars, beam_width, max_steps, True, metrics)
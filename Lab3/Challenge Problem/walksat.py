@@ -0,0 +1,225 @@
+import random
+import time
+
+# ------------------------------------------------------------
+# Incremental Clause State
+# ------------------------------------------------------------
+class ClauseState:
+    """
+    An assignment together with the number of true literals in every clause and
+    the set of unsatisfied clauses (a list plus position index, so add/remove/pick are O(1)).
+    Clauses are expected to be free of tautologies (x and -x in the same clause).
+    """
+
+    def __init__(self, clauses, num_vars, assignment=None, weights=None):
+        self.clauses = [list(clause) for clause in clauses]
+        self.num_vars = num_vars
+        self.weights = weights
+        if assignment is None:
+            assignment = [random.choice([True, False]) for _ in range(num_vars)]
+        self.assignment = list(assignment)
+
+        # occurrences[lit + num_vars] -> indices of the clauses containing lit
+        self.occurrences = [[] for _ in range(2 * num_vars + 1)]
+        for idx, clause in enumerate(self.clauses):
+            for lit in clause:
+                self.occurrences[lit + num_vars].append(idx)
+
+        self.true_count = [sum(self.is_true(lit) for lit in clause) for clause in self.clauses]
+        self.unsat = []
+        self.unsat_pos = [-1] * len(self.clauses)
+        for idx, count in enumerate(self.true_count):
+            if count == 0:
+                self._add_unsat(idx)
+
+    def is_true(self, lit):
+        return self.assignment[lit - 1] if lit > 0 else not self.assignment[-lit - 1]
+
+    def _add_unsat(self, idx):
+        self.unsat_pos[idx] = len(self.unsat)
+        self.unsat.append(idx)
+
+    def _remove_unsat(self, idx):
+        pos = self.unsat_pos[idx]
+        last = self.unsat.pop()
+        if last != idx:
+            self.unsat[pos] = last
+            self.unsat_pos[last] = pos
+        self.unsat_pos[idx] = -1
+
+    def _weight(self, idx):
+        return 1 if self.weights is None else self.weights[idx]
+
+    def true_literal(self, var_idx):
+        """The literal of variable var_idx (0-based) that is currently true."""
+        return var_idx + 1 if self.assignment[var_idx] else -(var_idx + 1)
+
+    def break_score(self, var_idx):
+        """Weight of the clauses that become unsatisfied if var_idx is flipped."""
+        lit = self.true_literal(var_idx)
+        return sum(self._weight(idx) for idx in self.occurrences[lit + self.num_vars]
+                   if self.true_count[idx] == 1)
+
+    def make_score(self, var_idx):
+        """Weight of the unsatisfied clauses that become satisfied if var_idx is flipped."""
+        lit = -self.true_literal(var_idx)
+        return sum(self._weight(idx) for idx in self.occurrences[lit + self.num_vars]
+                   if self.true_count[idx] == 0)
+
+    def flip_deltas(self):
+        """Change in unsatisfied weight for flipping each single variable."""
+        return [self.break_score(v) - self.make_score(v) for v in range(self.num_vars)]
+
+    def unsat_variables(self):
+        """Sorted indices of the variables that occur in unsatisfied clauses."""
+        return sorted({abs(lit) - 1 for idx in self.unsat for lit in self.clauses[idx]})
+
+    def variable_neighbours(self):
+        """neighbours[v]: sorted variables sharing at least one clause with v (built once)."""
+        if getattr(self, '_neighbours', None) is None:
+            linked = [set() for _ in range(self.num_vars)]
+            for clause in self.clauses:
+                for lit in clause:
+                    linked[abs(lit) - 1].update(abs(other) - 1 for other in clause)
+            self._neighbours = [sorted(vs - {v}) for v, vs in enumerate(linked)]
+        return self._neighbours
+
+    def flip_sets(self, size):
+        """
+        Yield sorted tuples of `size` variables that are connected through shared clauses
+        and include a variable of an unsatisfied clause. When no smaller move improves,
+        any improving move of this size has that shape: flips that share no clause add
+        up independently, and flips outside unsatisfied clauses can only break clauses.
+        """
+        neighbours = self.variable_neighbours()
+        seen = set()
+        for start in self.unsat_variables():
+            stack = [(start,)]
+            while stack:
+                group = stack.pop()
+                if len(group) == size:
+                    key = tuple(sorted(group))
+                    if key not in seen:
+                        seen.add(key)
+                        yield key
+                    continue
+                frontier = {w for v in group for w in neighbours[v]}.difference(group)
+                stack.extend(group + (w,) for w in sorted(frontier, reverse=True))
+
+    def _var_clauses(self, var_idx):
+        return (self.occurrences[var_idx + 1 + self.num_vars]
+                + self.occurrences[-(var_idx + 1) + self.num_vars])
+
+    def flip_delta(self, var_indices, single=None):
+        """
+        Change in unsatisfied weight if every variable in var_indices is flipped together:
+        the sum of the single-flip deltas, corrected on clauses shared by two or more of them.
+        """
+        if single is None:
+            single = {v: self.break_score(v) - self.make_score(v) for v in var_indices}
+        delta = sum(single[v] for v in var_indices)
+        if len(var_indices) < 2:
+            return delta
+
+        touched = {}
+        for v in var_indices:
+            for idx in self._var_clauses(v):
+                touched[idx] = touched.get(idx, 0) + 1
+        flipped = {v + 1 for v in var_indices}
+        for idx, hits in touched.items():
+            if hits < 2:
+                continue
+            count = self.true_count[idx]
+            weight = self._weight(idx)
+            new_count = count
+            for lit in self.clauses[idx]:
+                if abs(lit) not in flipped:
+                    continue
+                # Undo this variable's share of the single-flip sum
+                if count == 0:
+                    delta += weight
+                elif count == 1 and self.is_true(lit):
+                    delta -= weight
+                new_count += -1 if self.is_true(lit) else 1
+            delta += weight * ((new_count == 0) - (count == 0))
+        return delta
+
+    def flip(self, var_idx):
+        old_true = self.true_literal(var_idx)
+        self.assignment[var_idx] = not self.assignment[var_idx]
+        for idx in self.occurrences[old_true + self.num_vars]:
+            self.true_count[idx] -= 1
+            if self.true_count[idx] == 0:
+                self._add_unsat(idx)
+        for idx in self.occurrences[-old_true + self.num_vars]:
+            self.true_count[idx] += 1
+            if self.true_count[idx] == 1:
+                self._remove_unsat(idx)
+
+
+# ------------------------------------------------------------
+# Focused Random Walk Driver
+# ------------------------------------------------------------
+def _focused_walk(clauses, num_vars, pick_variable, max_flips, timeout, metrics):
+    state = ClauseState(clauses, num_vars)
+    best_solution = state.assignment[:]
+    best_unsat = len(state.unsat)
+    deadline = None if timeout is None else time.perf_counter() + timeout
+
+    for flip in range(max_flips):
+        if not state.unsat:
+            return state.assignment, True
+        if deadline is not None and flip % 1024 == 0 and time.perf_counter() > deadline:
+            break
+
+        clause = state.clauses[random.choice(state.unsat)]
+        state.flip(pick_variable(state, clause))
+        if metrics is not None:
+            metrics.count('accepted')
+
+        if len(state.unsat) < best_unsat:
+            best_unsat = len(state.unsat)
+            best_solution = state.assignment[:]
+            if metrics is not None:
+                metrics.count('improved')
+
+    if not state.unsat:
+        return state.assignment, True
+    return best_solution, False
+
+
+# ------------------------------------------------------------
+# WalkSAT (SKC variant)
+# ------------------------------------------------------------
+def walksat(clauses, num_vars, max_flips=100000, noise=0.5, timeout=None, metrics=None):
+    """
+    Focused random walk: repeatedly pick a random unsatisfied clause and flip one of its
+    variables. Zero-break flips are always taken; otherwise a random variable is flipped
+    with probability `noise` and a minimum-break variable the rest of the time.
+    A metrics object (cs307.metrics.SearchMetrics) counts flips and new best assignments.
+    """
+    def pick_variable(state, clause):
+        breaks = [(state.break_score(abs(lit) - 1), abs(lit) - 1) for lit in clause]
+        min_break = min(b for b, _ in breaks)
+        if min_break > 0 and random.random() < noise:
+            return random.choice(breaks)[1]
+        return random.choice([v for b, v in breaks if b == min_break])
+
+    return _focused_walk(clauses, num_vars, pick_variable, max_flips, timeout, metrics)
+
+
+# ------------------------------------------------------------
+# probSAT (polynomial break distribution)
+# ------------------------------------------------------------
+def probsat(clauses, num_vars, max_flips=100000, cb=2.38, eps=1.0, timeout=None, metrics=None):
+    """
+    probSAT: flip a variable of a random unsatisfied clause with probability
+    proportional to (eps + break)^-cb. The defaults are the published 3-SAT settings.
+    A metrics object (cs307.metrics.SearchMetrics) counts flips and new best assignments.
+    """
+    def pick_variable(state, clause):
+        candidates = [abs(lit) - 1 for lit in clause]
+        probs = [(eps + state.break_score(v)) ** -cb for v in candidates]
+        return random.choices(candidates, weights=probs)[0]
+
+    return _focused_walk(clauses, num_vars, pick_variable, max_flips, timeout, metrics)
@@ -1,10 +1,11 @@
 import heapq
-from typing import List, Optional, Tuple
+from typing import List, Optional
 
 from .helpers import State, calculate_heuristic, get_successors, is_goal, construct_path
 
 
-def a_star_search(start_state: List[List[int]], heuristic_type: str) -> Optional[Tuple[int, int]]:
+def a_star_search(start_state: List[List[int]], heuristic_type: str,
+                  metrics: Optional[object] = None) -> Optional[int]:
     explored = set()
     frontier = []
     initial_state = State(start_state, None, None, calculate_heuristic(start_state, heuristic_type), 0)
@@ -14,15 +15,24 @@ def a_star_search(start_state: List[List[int]], heuristic_type: str) -> Optional
         _, g, current_state = heapq.heappop(frontier)
 
         if is_goal(current_state.state):
-            return len(construct_path(current_state)), len(explored)
+            return len(construct_path(current_state))
 
         current_state_tuple = tuple(map(tuple, current_state.state))
-        if current_state_tuple not in explored:
+        if current_state_tuple in explored:
+            if metrics is not None:
+                metrics.count('duplicates')
+        else:
             explored.add(current_state_tuple)
-            for successor in get_successors(current_state.state, heuristic_type):
+            successors = get_successors(current_state.state, heuristic_type)
+            if metrics is not None:
+                metrics.count('expansions')
+                metrics.count('generated', len(successors))
+            for successor in successors:
                 successor.parent = current_state
                 successor.cost = g + 1
                 f = successor.cost + successor.heuristic
                 heapq.heappush(frontier, (f, successor.cost, successor))
+            if metrics is not None:
+                metrics.peak('frontier', len(frontier))
 
     return None
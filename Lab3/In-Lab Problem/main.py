@@ -1,3 +1,6 @@
+import os
+import sys
+
 from functions.tabulate import tabulate
 import heapq
 from typing import List, Tuple, Optional
@@ -5,6 +8,9 @@ from typing import List, Tuple, Optional
 from functions.best_first_search import best_first_search
 from functions.a_star import a_star_search
 
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__)))))
+from cs307.metrics import SearchMetrics  # noqa: E402
+
 # Define the starting configuration of the puzzle
 initial_board = [
     [2, 2, 1, 1, 1, 2, 2],
@@ -16,28 +22,35 @@ initial_board = [
     [2, 2, 1, 1, 1, 2, 2]
 ]
 
-# Store results from all algorithm runs
-results_table = []
 
-# List of algorithms and heuristics to evaluate
-algorithms_to_run = [
-    ("Best First Search", best_first_search, "Manhattan"),
-    ("Best First Search", best_first_search, "Exponential"),
-    ("A* Search", a_star_search, "Manhattan"),
-    ("A* Search", a_star_search, "Exponential")
-]
+def main():
+    # Store results from all algorithm runs
+    results_table = []
+
+    # List of algorithms and heuristics to evaluate
+    algorithms_to_run = [
+        ("Best First Search", best_first_search, "Manhattan"),
+        ("Best First Search", best_first_search, "Exponential"),
+        ("A* Search", a_star_search, "Manhattan"),
+        ("A* Search", a_star_search, "Exponential")
+    ]
+
+    # Execute each algorithm with the specified heuristic
+    for algo_name, algo_func, heuristic in algorithms_to_run:
+        print(f"Running {algo_name} using {heuristic} heuristic")
+
+        metrics = SearchMetrics()
+        path_length = algo_func(initial_board, heuristic, metrics)
+
+        if path_length:
+            results_table.append([algo_name, heuristic, "Solution found", path_length,
+                                  metrics.counters.get('expansions', 0)])
+        else:
+            results_table.append([algo_name, heuristic, "No solution found", "N/A", "N/A"])
 
-# Execute each algorithm with the specified heuristic
-for algo_name, algo_func, heuristic in algorithms_to_run:
-    print(f"Running {algo_name} using {heuristic} heuristic")
-    
-    solution = algo_func(initial_board, heuristic)
-    
-    if solution:
-        results_table.append([algo_name, heuristic, "Solution found", solution[0], solution[1]])
-    else:
-        results_table.append([algo_name, heuristic, "No solution found", "N/A", "N/A"])
+    # Display the results in a formatted table
+    print(tabulate(results_table, headers=["Algorithm", "Heuristic", "Result", "Path Length", "Explored Nodes"]))
 
-# Display the results in a formatted table
-print(tabulate(results_table, headers=["Algorithm", "Heuristic", "Result", "Path Length", "Explored Nodes"]))
 
+if __name__ == "__main__":
+    main()
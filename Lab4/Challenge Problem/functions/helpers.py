@@ -1,65 +1,203 @@
-import numpy as np
+import json
+import math
+import os
 import random
+import warnings
+
+import numpy as np
+
+# The parsed image is cached next to the text file as <name>.npy (uint8 when every
+# pixel is an integer in 0..255) plus a <name>.npy.json sidecar recording the source
+# file's size and mtime; the cache is rebuilt whenever either changes.
+def _cache_paths(file_path):
+    base = os.path.splitext(file_path)[0]
+    return base + ".npy", base + ".npy.json"
+
+def _source_signature(file_path):
+    info = os.stat(file_path)
+    return {"size": info.st_size, "mtime_ns": info.st_mtime_ns}
 
-def load_file(file_path):
-    numbers = np.loadtxt(file_path)
-    matrix = numbers.reshape(512, 512)
+def _read_cache(file_path):
+    npy_path, meta_path = _cache_paths(file_path)
+    try:
+        with open(meta_path) as f:
+            meta = json.load(f)
+        if meta.get("source") != _source_signature(file_path):
+            return None
+        return np.load(npy_path)
+    except (OSError, ValueError):
+        return None
+
+def _write_cache(file_path, pixels):
+    npy_path, meta_path = _cache_paths(file_path)
+    if pixels.min() >= 0 and pixels.max() <= 255 and np.array_equal(pixels, np.round(pixels)):
+        pixels = pixels.astype(np.uint8)
+    try:
+        np.save(npy_path + ".part.npy", pixels)
+        os.replace(npy_path + ".part.npy", npy_path)
+        with open(meta_path, "w") as f:
+            json.dump({"source": _source_signature(file_path), "shape": list(pixels.shape),
+                       "dtype": str(pixels.dtype)}, f)
+    except OSError:
+        pass  # read-only checkout: just parse the text again next time
+
+def _parse_text(file_path):
+    # One C-level pass over whitespace-separated numbers; text np.fromstring cannot
+    # read to the end (comments, stray tokens) falls back to np.loadtxt.
+    # Older NumPy only warns about unread data, so the warning is raised as an error.
+    with open(file_path) as f:
+        text = f.read()
+    with warnings.catch_warnings():
+        warnings.simplefilter("error", DeprecationWarning)
+        try:
+            return np.fromstring(text, sep=" ")
+        except (ValueError, DeprecationWarning):
+            return np.loadtxt(file_path).ravel()
+
+def load_file(file_path, use_cache=True, shape=None):
+    # shape is (rows, cols) of the stored pixels; a square image is assumed when omitted
+    numbers = _read_cache(file_path) if use_cache else None
+    if numbers is not None and shape is not None and numbers.shape != tuple(shape):
+        numbers = None
+    if numbers is None:
+        numbers = _parse_text(file_path)
+        if shape is None:
+            side = math.isqrt(numbers.size)
+            if side * side != numbers.size:
+                raise ValueError(f"{file_path}: {numbers.size} pixels is not a square image; pass shape")
+            shape = (side, side)
+        numbers = numbers.reshape(shape)
+        if use_cache:
+            _write_cache(file_path, numbers)
+    matrix = numbers.astype(np.float64)
     matrix = matrix.transpose()
     return matrix
 
-def calculate_energy(grid):
-    energy = 0
-    for i in range(512):
-        for j in range(512):
-            if j < 511:  
-                if (j + 1) % 128 == 0:
-                    energy += abs(grid[i, j] - grid[i, j + 1])
-            if i < 511:  
-                if (i + 1) % 128 == 0:
-                    energy += abs(grid[i, j] - grid[i + 1, j])
+# By default the puzzle is a 4x4 grid of 128x128 tiles; energy is the total absolute pixel
+# difference across the seams between neighbouring tiles (24 for a 4x4 grid).
+# Permutations are row-major: perm[r * cols + c] is the tile at row r, column c.
+TILE_SIZE = 128
+GRID_SIZE = 4
+
+def calculate_energy(grid, tile_size=TILE_SIZE):
+    right = np.abs(grid[:, tile_size - 1:-1:tile_size] - grid[:, tile_size::tile_size]).sum()
+    down = np.abs(grid[tile_size - 1:-1:tile_size, :] - grid[tile_size::tile_size, :]).sum()
+    return right + down
+
+def extract_tiles(grid, tile_size=TILE_SIZE):
+    # tiles[r * cols + c] is the tile at row r, column c of the grid
+    rows, cols = grid.shape[0] // tile_size, grid.shape[1] // tile_size
+    tiles = grid[:rows * tile_size, :cols * tile_size].reshape(rows, tile_size, cols, tile_size)
+    return tiles.transpose(0, 2, 1, 3).reshape(rows * cols, tile_size, tile_size)
+
+def build_seam_table(tiles):
+    """
+    table[a, b, 0]: seam cost with tile b directly right of tile a;
+    table[a, b, 1]: seam cost with tile b directly below tile a.
+    """
+    tiles = np.asarray(tiles, dtype=np.float64)
+    table = np.empty((len(tiles), len(tiles), 2))
+    table[:, :, 0] = np.abs(tiles[:, None, :, -1] - tiles[None, :, :, 0]).sum(axis=-1)
+    table[:, :, 1] = np.abs(tiles[:, None, -1, :] - tiles[None, :, 0, :]).sum(axis=-1)
+    return table
+
+def arrangement_energy(perm, table, cols=GRID_SIZE):
+    rows = len(perm) // cols
+    energy = 0.0
+    for r in range(rows):
+        for c in range(cols):
+            tile = perm[r * cols + c]
+            if c + 1 < cols:
+                energy += table[tile, perm[r * cols + c + 1], 0]
+            if r + 1 < rows:
+                energy += table[tile, perm[(r + 1) * cols + c], 1]
     return energy
 
-def swap_pieces(grid):
-    i, j = random.sample(range(16), 2)
-    r1, r2 = i // 4, j // 4
-    c1, c2 = i % 4, j % 4
+def swap_pieces(grid, i=None, j=None, tile_size=TILE_SIZE):
+    cols = grid.shape[1] // tile_size
+    if i is None or j is None:
+        i, j = random.sample(range((grid.shape[0] // tile_size) * cols), 2)
+    r1, r2 = i // cols, j // cols
+    c1, c2 = i % cols, j % cols
     
-    rn1, rn2 = 128 * r1, 128 * r2
-    cn1, cn2 = 128 * c1, 128 * c2
+    rn1, rn2 = tile_size * r1, tile_size * r2
+    cn1, cn2 = tile_size * c1, tile_size * c2
     
-    piece1 = grid[rn1:rn1 + 128, cn1:cn1 + 128].copy()
-    piece2 = grid[rn2:rn2 + 128, cn2:cn2 + 128].copy()
+    piece1 = grid[rn1:rn1 + tile_size, cn1:cn1 + tile_size].copy()
+    piece2 = grid[rn2:rn2 + tile_size, cn2:cn2 + tile_size].copy()
 
-    grid[rn1:rn1 + 128, cn1:cn1 + 128] = piece2
-    grid[rn2:rn2 + 128, cn2:cn2 + 128] = piece1
+    grid[rn1:rn1 + tile_size, cn1:cn1 + tile_size] = piece2
+    grid[rn2:rn2 + tile_size, cn2:cn2 + tile_size] = piece1
 
     return grid
 
-def simulated_annealing(grid, initial_temp, cooling_rate, min_temp):
-    current_grid = grid.copy()
-    current_energy = calculate_energy(current_grid)
-    best_grid = current_grid.copy()
+def render(tiles, perm, cols=GRID_SIZE):
+    # Pixels are only assembled when an image is actually needed
+    rows = len(perm) // cols
+    return np.vstack([np.hstack([tiles[perm[r * cols + c]] for c in range(cols)])
+                      for r in range(rows)])
+
+def seams_touching(positions, rows=GRID_SIZE, cols=GRID_SIZE):
+    # (p, q, direction) for every seam with p left of / above q that touches a position
+    seams = set()
+    for pos in positions:
+        r, c = divmod(pos, cols)
+        if c > 0:
+            seams.add((pos - 1, pos, 0))
+        if c + 1 < cols:
+            seams.add((pos, pos + 1, 0))
+        if r > 0:
+            seams.add((pos - cols, pos, 1))
+        if r + 1 < rows:
+            seams.add((pos, pos + cols, 1))
+    return seams
+
+def swap_delta(perm, table, i, j, cols=GRID_SIZE):
+    # Only the (at most 8) seams around positions i and j change when their tiles swap
+    seams = seams_touching((i, j), len(perm) // cols, cols)
+    before = sum(table[perm[p], perm[q], d] for p, q, d in seams)
+    perm[i], perm[j] = perm[j], perm[i]
+    after = sum(table[perm[p], perm[q], d] for p, q, d in seams)
+    perm[i], perm[j] = perm[j], perm[i]
+    return after - before
+
+def anneal_permutation(table, perm, initial_temp, cooling_rate, min_temp, cols=GRID_SIZE, metrics=None):
+    """
+    Anneal a tile permutation with swap moves scored by swap_delta.
+    Returns (best_perm, best_energy); no pixels are touched. A metrics object
+    (cs307.metrics.SearchMetrics) counts accepted, rejected and improving moves.
+    """
+    current_perm = list(perm)
+    current_energy = arrangement_energy(current_perm, table, cols)
+    best_perm = current_perm.copy()
     best_energy = current_energy
-    
+
     temperature = initial_temp
-    
+
     while temperature > min_temp:
-        new_grid = current_grid.copy()
-        swap_pieces(new_grid)
-
-        new_energy = calculate_energy(new_grid)
-        if new_energy < current_energy:
-            current_grid = new_grid
-            current_energy = new_energy
-        else:
-            acceptance_probability = np.exp(-(new_energy - current_energy) / temperature)
-            if np.random.rand() < acceptance_probability:
-                current_grid = new_grid
-                current_energy = new_energy
+        i, j = random.sample(range(len(current_perm)), 2)
+        delta = swap_delta(current_perm, table, i, j, cols)
+        if delta < 0 or np.random.rand() < np.exp(-delta / temperature):
+            current_perm[i], current_perm[j] = current_perm[j], current_perm[i]
+            current_energy += delta
+            if metrics is not None:
+                metrics.count('accepted')
+        elif metrics is not None:
+            metrics.count('rejected')
 
         if current_energy < best_energy:
-            best_grid = current_grid.copy()
+            best_perm = current_perm.copy()
             best_energy = current_energy
+            if metrics is not None:
+                metrics.count('improved')
 
         temperature *= cooling_rate
-    return best_grid
+    return best_perm, best_energy
+
+def simulated_annealing(grid, initial_temp, cooling_rate, min_temp, tile_size=TILE_SIZE):
+    # Grid-in, grid-out wrapper around the permutation annealer
+    tiles = extract_tiles(grid, tile_size)
+    cols = grid.shape[1] // tile_size
+    best_perm, _ = anneal_permutation(build_seam_table(tiles), range(len(tiles)),
+                                      initial_temp, cooling_rate, min_temp, cols)
+    return render(tiles, best_perm, cols)
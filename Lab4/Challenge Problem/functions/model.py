@@ -0,0 +1,228 @@
+import random
+
+import numpy as np
+
+from .helpers import extract_tiles
+
+# Sides of a piece; a seam cost is always stored as (piece, neighbour on that side)
+RIGHT, DOWN, LEFT, UP = 0, 1, 2, 3
+
+
+class PuzzleModel:
+    """
+    An image cut into rows x cols square tiles of tile_size pixels.
+
+    With rotations, every tile can be placed in four orientations and a placed piece is
+    the oriented id tile * 4 + k (k counter-clockwise quarter turns); otherwise the
+    piece id is the tile index. A permutation is a row-major list of piece ids.
+
+    Seam costs are held in a dense (P, P, 2) table for up to dense_limit pieces. Beyond
+    that (or when k_best is given) only each piece's k_best cheapest neighbours on every
+    side are stored, so memory grows as O(P * k) rather than O(P^2); any other seam is
+    computed on demand from the stored edge pixels. Each piece has P - orientations
+    possible neighbours; a k_best below 1 or not below that count keeps the dense table.
+    Seam structures computed elsewhere (for example attached from shared memory) can be
+    passed in: a dense table as `table`, or the sparse (near, near_costs) arrays as `sparse`.
+    """
+
+    def __init__(self, image, tile_size, rotations=False, k_best=None, dense_limit=1024, table=None,
+                 sparse=None):
+        image = np.asarray(image, dtype=np.float64)
+        if image.shape[0] % tile_size or image.shape[1] % tile_size:
+            raise ValueError(f"image shape {image.shape} is not a multiple of tile size {tile_size}")
+        self.tile_size = tile_size
+        self.rows = image.shape[0] // tile_size
+        self.cols = image.shape[1] // tile_size
+        self.tiles = extract_tiles(image, tile_size)
+        self.orientations = 4 if rotations else 1
+        self.k_best = k_best
+
+        oriented = np.stack([np.rot90(tile, k) for tile in self.tiles for k in range(self.orientations)])
+        self.num_pieces = len(oriented)
+        # Edge pixels of every oriented piece
+        self.right = np.ascontiguousarray(oriented[:, :, -1])
+        self.left = np.ascontiguousarray(oriented[:, :, 0])
+        self.bottom = np.ascontiguousarray(oriented[:, -1, :])
+        self.top = np.ascontiguousarray(oriented[:, 0, :])
+
+        self.near = self.near_costs = self.best = None
+        k = 8 if k_best is None else k_best
+        # Lists of every other piece (or of none) are no cheaper than the dense table
+        sparse_ok = 1 <= k < self.num_pieces - self.orientations
+        if table is not None:
+            self.table = table
+        elif sparse is not None:
+            self.table = None
+            self._index_sparse(*sparse)
+        elif (k_best is None and self.num_pieces <= dense_limit) or not sparse_ok:
+            self.table = np.stack([self._cost_rows(np.arange(self.num_pieces), RIGHT),
+                                   self._cost_rows(np.arange(self.num_pieces), DOWN)], axis=-1)
+        else:
+            self.table = None
+            self._index_sparse(*self._build_sparse(k))
+
+    # --------------------- Seam Costs ---------------------
+    def _cost_rows(self, pieces, side, block=None):
+        """(len(pieces), P) costs of every piece placed on `side` of each given piece."""
+        own, other = {RIGHT: (self.right, self.left), DOWN: (self.bottom, self.top),
+                      LEFT: (self.left, self.right), UP: (self.top, self.bottom)}[side]
+        block = block or max(1, 2 ** 22 // (self.num_pieces * self.tile_size))  # ~32 MB temporaries
+        out = np.empty((len(pieces), self.num_pieces))
+        for start in range(0, len(pieces), block):
+            chunk = pieces[start:start + block]
+            out[start:start + len(chunk)] = np.abs(own[chunk, None, :] - other[None, :, :]).sum(axis=-1)
+        return out
+
+    def _build_sparse(self, k):
+        """(4, P, k) arrays: near[side, a] are the k cheapest pieces on that side of a, best first."""
+        tile_of = np.arange(self.num_pieces) // self.orientations
+        near_all = np.empty((4, self.num_pieces, k), dtype=np.int64)
+        costs_all = np.empty((4, self.num_pieces, k))
+        for side in (RIGHT, DOWN, LEFT, UP):
+            for start in range(0, self.num_pieces, 256):
+                pieces = np.arange(start, min(start + 256, self.num_pieces))
+                costs = self._cost_rows(pieces, side)
+                costs[tile_of[pieces, None] == tile_of[None, :]] = np.inf  # a tile cannot neighbour itself
+                near = np.argpartition(costs, k - 1, axis=1)[:, :k]
+                near_costs = np.take_along_axis(costs, near, axis=1)
+                order = near_costs.argsort(axis=1)
+                near_all[side, pieces] = np.take_along_axis(near, order, axis=1)
+                costs_all[side, pieces] = np.take_along_axis(near_costs, order, axis=1)
+        return near_all, costs_all
+
+    def _index_sparse(self, near, near_costs):
+        """best[side][a]: [(b, cost), ...] lists and the (a, b) -> cost lookups behind cost()."""
+        self.near, self.near_costs = near, near_costs
+        self.best = []
+        self._known = [{}, {}]  # (a, b) -> cost for RIGHT and DOWN seams found above
+        for side in (RIGHT, DOWN, LEFT, UP):
+            lists = []
+            for a, (bs, cs) in enumerate(zip(near[side].tolist(), near_costs[side].tolist())):
+                lists.append(list(zip(bs, cs)))
+                for b, c in zip(bs, cs):
+                    if side in (RIGHT, DOWN):
+                        self._known[side][(a, b)] = c
+                    else:
+                        self._known[side - 2][(b, a)] = c
+            self.best.append(lists)
+
+    def cost(self, a, b, direction):
+        """Seam cost with piece b to the right of (direction 0) or below (direction 1) piece a."""
+        if self.table is not None:
+            return self.table[a, b, direction]
+        known = self._known[direction].get((a, b))
+        if known is not None:
+            return known
+        if direction == RIGHT:
+            return float(np.abs(self.right[a] - self.left[b]).sum())
+        return float(np.abs(self.bottom[a] - self.top[b]).sum())
+
+    def neighbours(self, a, side, k=None):
+        """Cheapest pieces to place on `side` of a as [(b, cost), ...], best first."""
+        if self.best is not None:
+            return self.best[side][a][:k]
+        costs = self._cost_rows(np.array([a]), side)[0]
+        tile_of = np.arange(self.num_pieces) // self.orientations
+        costs[tile_of == a // self.orientations] = np.inf
+        order = np.argsort(costs)[:k]
+        return [(int(b), float(costs[b])) for b in order]
+
+    # --------------------- Arrangements ---------------------
+    def identity(self):
+        return [tile * self.orientations for tile in range(self.rows * self.cols)]
+
+    def seams_touching(self, positions):
+        seams = set()
+        for pos in positions:
+            r, c = divmod(pos, self.cols)
+            if c > 0:
+                seams.add((pos - 1, pos, RIGHT))
+            if c + 1 < self.cols:
+                seams.add((pos, pos + 1, RIGHT))
+            if r > 0:
+                seams.add((pos - self.cols, pos, DOWN))
+            if r + 1 < self.rows:
+                seams.add((pos, pos + self.cols, DOWN))
+        return seams
+
+    def energy(self, perm):
+        total = 0.0
+        for pos, piece in enumerate(perm):
+            r, c = divmod(pos, self.cols)
+            if c + 1 < self.cols:
+                total += self.cost(piece, perm[pos + 1], RIGHT)
+            if r + 1 < self.rows:
+                total += self.cost(piece, perm[pos + self.cols], DOWN)
+        return total
+
+    def _local_delta(self, perm, changes):
+        """Energy change if perm[pos] = piece for every (pos, piece) in changes."""
+        seams = self.seams_touching([pos for pos, _ in changes])
+        before = sum(self.cost(perm[p], perm[q], d) for p, q, d in seams)
+        saved = [(pos, perm[pos]) for pos, _ in changes]
+        for pos, piece in changes:
+            perm[pos] = piece
+        after = sum(self.cost(perm[p], perm[q], d) for p, q, d in seams)
+        for pos, piece in saved:
+            perm[pos] = piece
+        return after - before
+
+    def swap_delta(self, perm, i, j):
+        return self._local_delta(perm, ((i, perm[j]), (j, perm[i])))
+
+    def rotate_delta(self, perm, i, turns):
+        return self._local_delta(perm, ((i, self.rotated(perm[i], turns)),))
+
+    def rotated(self, piece, turns):
+        tile, k = divmod(piece, self.orientations)
+        return tile * self.orientations + (k + turns) % self.orientations
+
+    def render(self, perm, tiles=None):
+        """Assemble the image for perm from self.tiles (or the same tiles in another dtype)."""
+        tiles = self.tiles if tiles is None else tiles
+        pieces = [np.rot90(tiles[p // self.orientations], p % self.orientations) for p in perm]
+        return np.vstack([np.hstack(pieces[r * self.cols:(r + 1) * self.cols]) for r in range(self.rows)])
+
+
+# --------------------- Annealing on a Model ---------------------
+def anneal_model(model, perm, initial_temp, cooling_rate, min_temp, rotate_prob=0.5, metrics=None):
+    """
+    Anneal a permutation of the model's pieces with swap moves (and, when the model
+    allows rotations, quarter-turn moves with probability rotate_prob).
+    Returns (best_perm, best_energy); a metrics object (cs307.metrics.SearchMetrics)
+    counts accepted, rejected and improving moves.
+    """
+    current_perm = list(perm)
+    current_energy = model.energy(current_perm)
+    best_perm = current_perm.copy()
+    best_energy = current_energy
+
+    temperature = initial_temp
+
+    while temperature > min_temp:
+        rotating = model.orientations > 1 and random.random() < rotate_prob
+        if rotating:
+            i, turns = random.randrange(len(current_perm)), random.choice((1, 2, 3))
+            delta = model.rotate_delta(current_perm, i, turns)
+        else:
+            i, j = random.sample(range(len(current_perm)), 2)
+            delta = model.swap_delta(current_perm, i, j)
+        if delta < 0 or np.random.rand() < np.exp(-delta / temperature):
+            if rotating:
+                current_perm[i] = model.rotated(current_perm[i], turns)
+            else:
+                current_perm[i], current_perm[j] = current_perm[j], current_perm[i]
+            current_energy += delta
+            if metrics is not None:
+                metrics.count('accepted')
+        elif metrics is not None:
+            metrics.count('rejected')
+
+        if current_energy < best_energy:
+            best_perm = current_perm.copy()
+            best_energy = current_energy
+            if metrics is not None:
+                metrics.count('improved')
+
+        temperature *= cooling_rate
+    return best_perm, best_energy
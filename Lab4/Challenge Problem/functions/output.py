@@ -0,0 +1,94 @@
+import queue
+import threading
+
+import numpy as np
+
+# ------------------------ Snapshot Writer ------------------------
+class SnapshotWriter:
+    """
+    Writes PNG snapshots of arrangements on a background thread.
+
+    snapshot(perm, path) only queues the permutation: the writer thread renders it from
+    uint8 tiles, encodes it and saves it, so the annealing loop never waits on PNG
+    encoding unless max_queue snapshots are already pending. Only every `every`-th
+    snapshot is kept, and one identical to the last saved arrangement is skipped.
+    Use as a context manager (or call close()) to flush the queue; errors raised
+    while writing are re-raised there, and by the next snapshot() once recorded.
+    """
+
+    def __init__(self, model, every=1, max_queue=8):
+        from PIL import Image  # imported here so a missing PIL fails before any work is queued
+
+        self.image = Image
+        self.model = model
+        self.every = every
+        self.tiles = np.clip(model.tiles, 0, 255).astype(np.uint8)
+        self.calls = 0
+        self.last = None
+        self.stats = {'saved': 0, 'duplicates': 0, 'skipped': 0}
+        self.error = None
+        self.queue = queue.Queue(maxsize=max_queue)
+        self.thread = threading.Thread(target=self._run, daemon=True)
+        self.thread.start()
+
+    def snapshot(self, perm, path, force=False):
+        """Queue perm to be saved at path; returns False when it is skipped."""
+        self.calls += 1
+        if not force and (self.calls - 1) % self.every:
+            self.stats['skipped'] += 1
+            return False
+        if not force and self.last == tuple(perm):
+            self.stats['duplicates'] += 1
+            return False
+        self.last = tuple(perm)
+        self._put(('perm', list(perm), path))
+        return True
+
+    def save_array(self, array, path):
+        """Queue a ready image array (for example the scrambled input) to be saved at path."""
+        self._put(('array', np.clip(array, 0, 255).astype(np.uint8), path))
+
+    def _check(self):
+        if self.error is not None:
+            raise self.error
+        if not self.thread.is_alive():
+            raise RuntimeError("snapshot writer thread has stopped")
+
+    def _put(self, item):
+        # Never block on a full queue whose consumer has died
+        while True:
+            self._check()
+            try:
+                self.queue.put(item, timeout=0.1)
+                return
+            except queue.Full:
+                pass
+
+    def _run(self):
+        while True:
+            item = self.queue.get()
+            if item is None:
+                break
+            kind, data, path = item
+            try:
+                if self.error is None:
+                    image = self.model.render(data, tiles=self.tiles) if kind == 'perm' else data
+                    self.image.fromarray(image, mode='L').save(path)
+                    self.stats['saved'] += 1
+            except Exception as exc:
+                self.error = exc
+            finally:
+                self.queue.task_done()
+
+    def close(self):
+        if self.thread.is_alive():
+            self.queue.put(None)
+            self.thread.join()
+        if self.error is not None:
+            raise self.error
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc_info):
+        self.close()
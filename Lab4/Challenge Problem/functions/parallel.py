@@ -0,0 +1,89 @@
+import random
+import sys
+import time
+from concurrent.futures import ProcessPoolExecutor, as_completed
+from multiprocessing import shared_memory
+
+import numpy as np
+
+from .model import PuzzleModel, anneal_model
+
+# ------------------------ Shared Arrays ------------------------
+class SharedArray:
+    """A NumPy array copied once into shared memory; workers attach by (name, shape, dtype)."""
+
+    def __init__(self, array):
+        array = np.ascontiguousarray(array)
+        self.shm = shared_memory.SharedMemory(create=True, size=max(array.nbytes, 1))
+        np.ndarray(array.shape, dtype=array.dtype, buffer=self.shm.buf)[...] = array
+        self.spec = (self.shm.name, array.shape, array.dtype.str)
+
+    def release(self):
+        self.shm.close()
+        self.shm.unlink()
+
+    @staticmethod
+    def attach(spec):
+        """
+        Map the block named in a (name, shape, dtype string) spec and return (shm, array).
+        The array is a view of shm.buf, so shm must stay referenced while it is used.
+        SharedArray.release in the parent is the only unlink; from Python 3.13 the
+        worker also opts out of resource tracking so its exit does not report a leak.
+        """
+        name, shape, dtype = spec
+        options = {'track': False} if sys.version_info >= (3, 13) else {}
+        shm = shared_memory.SharedMemory(name=name, **options)
+        return shm, np.ndarray(shape, dtype=np.dtype(dtype), buffer=shm.buf)
+
+
+# ------------------------ Worker ------------------------
+_worker = {}
+
+def _init_worker(image_spec, seam_specs, tile_size, rotations):
+    # Runs once per worker process: attach the shared blocks and build the model on top.
+    # seam_specs is the dense table, or the sparse (near, near_costs) pair.
+    image_shm, image = SharedArray.attach(image_spec)
+    attached = [SharedArray.attach(spec) for spec in seam_specs]
+    _worker['shm'] = [image_shm] + [shm for shm, _ in attached]  # keep the mappings alive
+    seams = [array for _, array in attached]
+    if len(seams) == 1:
+        _worker['model'] = PuzzleModel(image, tile_size, rotations=rotations, table=seams[0])
+    else:
+        _worker['model'] = PuzzleModel(image, tile_size, rotations=rotations, sparse=seams)
+
+def _run_chain(seed, start_perm, initial_temp, cooling_rate, min_temp):
+    random.seed(seed)
+    np.random.seed(seed)
+    start = time.perf_counter()
+    perm, energy = anneal_model(_worker['model'], start_perm, initial_temp, cooling_rate, min_temp)
+    return {'seed': seed, 'perm': perm, 'energy': energy, 'time': time.perf_counter() - start}
+
+
+# ------------------------ Parallel Restarts ------------------------
+def parallel_restarts(model, chains, initial_temp, cooling_rate, min_temp, start_perm=None,
+                      max_workers=None, base_seed=0):
+    """
+    Run `chains` independently seeded annealing chains in a process pool and yield each
+    result dict (seed, perm, energy, time) as soon as its chain finishes.
+    The image and the parent's seam costs (the dense table, or the sparse k-best
+    neighbour arrays) are placed in shared memory once, so workers attach to them
+    instead of receiving copies or recomputing any seam.
+    """
+    start_perm = model.identity() if start_perm is None else list(start_perm)
+    image = SharedArray(model.render(model.identity()))
+    if model.table is not None:
+        seams = [SharedArray(model.table)]
+    else:
+        seams = [SharedArray(model.near), SharedArray(model.near_costs)]
+    try:
+        with ProcessPoolExecutor(max_workers=max_workers, initializer=_init_worker,
+                                 initargs=(image.spec, [array.spec for array in seams], model.tile_size,
+                                           model.orientations > 1)) as pool:
+            futures = [pool.submit(_run_chain, base_seed + chain, start_perm, initial_temp,
+                                   cooling_rate, min_temp) for chain in range(chains)]
+            for future in as_completed(futures):
+                yield future.result()
+    finally:
+        image.release()
+        for array in seams:
+            array.release()
@@ -0,0 +1,110 @@
+from .model import DOWN, LEFT, RIGHT, UP
+
+# Grid offset of the neighbouring slot on each side, and the side facing back
+_OFFSETS = {RIGHT: (0, 1), DOWN: (1, 0), LEFT: (0, -1), UP: (-1, 0)}
+_OPPOSITE = {RIGHT: LEFT, LEFT: RIGHT, DOWN: UP, UP: DOWN}
+
+
+# --------------------- Best Buddies ---------------------
+def best_neighbours(model):
+    """best[side][a]: the single cheapest piece to place on that side of piece a."""
+    return [[model.neighbours(a, side, 1)[0][0] for a in range(model.num_pieces)]
+            for side in (RIGHT, DOWN, LEFT, UP)]
+
+
+def count_best_buddies(best):
+    """buddies[a]: sides on which a and its best neighbour pick each other."""
+    return [sum(best[_OPPOSITE[side]][best[side][a]] == a for side in (RIGHT, DOWN, LEFT, UP))
+            for a in range(len(best[0]))]
+
+
+def _seam(model, piece, side, other):
+    """Cost of `other` sitting on `side` of `piece`."""
+    if side == RIGHT:
+        return model.cost(piece, other, RIGHT)
+    if side == DOWN:
+        return model.cost(piece, other, DOWN)
+    if side == LEFT:
+        return model.cost(other, piece, RIGHT)
+    return model.cost(other, piece, DOWN)
+
+
+# --------------------- Greedy Placement ---------------------
+def greedy_placement(model, k=8):
+    """
+    Build an arrangement by growing one connected region of pieces.
+
+    Start from the piece with the most best-buddy relations (pairs of pieces that are
+    each other's cheapest neighbour). Every empty slot next to the region gets one
+    candidate from the k cheapest neighbours of the pieces around it. The slot placed
+    next is the one whose candidate agrees with the most best buddies, with ties broken
+    by how clearly that candidate beats the runner-up for the slot. The region never
+    outgrows the rows x cols frame.
+    Returns a row-major permutation of piece ids.
+    """
+    R = model.orientations
+    best = best_neighbours(model)
+    buddies = count_best_buddies(best)
+    seed = max(range(model.num_pieces), key=lambda a: (buddies[a], -a))
+
+    placed = {(0, 0): seed}
+    used_tiles = {seed // R}
+    bounds = [0, 0, 0, 0]  # min row, max row, min col, max col
+    slot_choice = {}       # empty slot -> (key, piece); smaller key is better
+
+    def fits(r, c):
+        return (max(bounds[1], r) - min(bounds[0], r) < model.rows
+                and max(bounds[3], c) - min(bounds[2], c) < model.cols)
+
+    def around(r, c):
+        for side, (dr, dc) in _OFFSETS.items():
+            piece = placed.get((r + dr, c + dc))
+            if piece is not None:
+                yield _OPPOSITE[side], piece  # the slot lies on this side of `piece`
+
+    def choose(r, c):
+        neighbours = list(around(r, c))
+        pool = {b for side, piece in neighbours for b, _ in model.neighbours(piece, side, k)
+                if b // R not in used_tiles}
+        if not pool:  # every nearby candidate is used: fall back to all remaining pieces
+            pool = {b for b in range(model.num_pieces) if b // R not in used_tiles}
+        scored = []
+        for b in pool:
+            agree = sum(best[side][piece] == b and best[_OPPOSITE[side]][b] == piece
+                        for side, piece in neighbours)
+            cost = sum(_seam(model, piece, side, b) for side, piece in neighbours) / len(neighbours)
+            scored.append((-agree, cost, b))
+        scored.sort()
+        agree, cost, b = scored[0]
+        # Confidence: how clearly the winner beats the runner-up; slots past the true image
+        # border have no good fit, so they score low and are filled last
+        runner_up = scored[1][1] if len(scored) > 1 else cost
+        confidence = (runner_up - cost) / (runner_up + 1e-9)
+        return (agree, -confidence, cost, b), b
+
+    def refresh(r, c):
+        if (r, c) not in placed and fits(r, c):
+            slot_choice[(r, c)] = choose(r, c)
+
+    for dr, dc in _OFFSETS.values():
+        refresh(dr, dc)
+
+    while len(placed) < model.rows * model.cols:
+        slot = min(slot_choice, key=lambda s: slot_choice[s][0])
+        _, piece = slot_choice.pop(slot)
+        placed[slot] = piece
+        used_tiles.add(piece // R)
+        r, c = slot
+        bounds[:] = [min(bounds[0], r), max(bounds[1], r), min(bounds[2], c), max(bounds[3], c)]
+
+        # Slots next to the new piece gain a neighbour; slots whose candidate was just used need a new one
+        stale = [s for s, (_, b) in slot_choice.items() if b // R == piece // R]
+        for dr, dc in _OFFSETS.values():
+            stale.append((r + dr, c + dc))
+        for s in stale:
+            refresh(*s)
+        for s in [s for s in slot_choice if not fits(*s)]:
+            del slot_choice[s]
+
+    return [placed[(bounds[0] + pos // model.cols, bounds[2] + pos % model.cols)]
+            for pos in range(model.rows * model.cols)]
@@ -1,45 +1,75 @@
-import numpy as np
-from PIL import Image
-from functions.helpers import load_file, simulated_annealing, calculate_energy
+import os
+
+from functions.helpers import load_file
+from functions.model import PuzzleModel, anneal_model
+from functions.output import SnapshotWriter
+from functions.parallel import parallel_restarts
+from functions.placement import greedy_placement
 
 # ------------------------ Parameters ------------------------
+input_path = os.path.join(os.path.dirname(os.path.abspath(__file__)), "lena.txt")
 image_size = 512
+tile_size = 128         # 4x4 grid of tiles
+allow_rotation = False  # also search the orientation of every tile
+greedy_start = True     # seed annealing with the best-buddy greedy placement
 initial_temp = 1000
 decay_rate = 0.90
 minimum_temp = 0.01
 total_iterations = 10
+parallel_chains = 0     # > 0: run this many seeded chains in a process pool instead
+snapshot_every = 1      # save every n-th intermediate arrangement (unchanged ones are skipped)
+
+
+def main():
+    # ------------------------ Load Input ------------------------
+    input_grid = load_file(input_path, shape=(image_size, image_size))
+
+    # Tiles and seam costs are computed once; the annealer only moves piece indices
+    model = PuzzleModel(input_grid, tile_size, rotations=allow_rotation)
+
+    # PNGs are rendered and encoded on a background thread; leaving the block waits for them
+    with SnapshotWriter(model, every=snapshot_every) as writer:
+        writer.save_array(input_grid, 'input_image.png')
 
-# ------------------------ Load Input ------------------------
-input_grid = load_file("lena.txt")
+        # ------------------------ Simulated Annealing ------------------------
+        lowest_energy = float('inf')
+        best_solution_perm = None
+        start_perm = model.identity()
+        if greedy_start:
+            start_perm = greedy_placement(model)
+            print(f"Greedy placement, Energy: {model.energy(start_perm)}")
 
-# Save initial image
-Image.fromarray(input_grid.astype(np.uint8), mode='L').save('input_image.png')
+        if parallel_chains > 0:
+            # Independent chains share the image and seam table; results arrive as chains finish
+            for result in parallel_restarts(model, parallel_chains, initial_temp, decay_rate, minimum_temp,
+                                            start_perm=start_perm):
+                if result['energy'] < lowest_energy:
+                    lowest_energy = result['energy']
+                    best_solution_perm = result['perm']
+                print(f"Chain {result['seed']} finished, Energy: {result['energy']} ({result['time']:.2f} s)")
+                writer.snapshot(result['perm'], f"output_chain_{result['seed']}.png")
+        else:
+            for iteration in range(1, total_iterations + 1):
+                # Run simulated annealing on the tile permutation
+                current_solution_perm, current_energy = anneal_model(model, start_perm, initial_temp,
+                                                                     decay_rate, minimum_temp)
 
-# ------------------------ Simulated Annealing ------------------------
-lowest_energy = float('inf')
-best_solution_grid = None
+                # Update best solution if energy is lower
+                if current_energy < lowest_energy:
+                    lowest_energy = current_energy
+                    best_solution_perm = current_solution_perm.copy()
+                    start_perm = current_solution_perm.copy()
 
-for iteration in range(1, total_iterations + 1):
-    # Run simulated annealing
-    current_solution_grid = simulated_annealing(input_grid, initial_temp, decay_rate, minimum_temp)
-    
-    if current_solution_grid is None:
-        continue
+                print(f"Iteration {iteration}, Energy: {current_energy}")
 
-    # Calculate energy (cost) of current solution
-    current_energy = calculate_energy(current_solution_grid)
+                # Save intermediate output
+                writer.snapshot(current_solution_perm, f'output_iteration_{iteration}.png')
 
-    # Update best solution if energy is lower
-    if current_energy < lowest_energy:
-        lowest_energy = current_energy
-        best_solution_grid = current_solution_grid.copy()
-        input_grid = current_solution_grid.copy()
-    
-    print(f"Iteration {iteration}, Energy: {current_energy}")
+        # ------------------------ Save Final Output ------------------------
+        if best_solution_perm is not None:
+            writer.snapshot(best_solution_perm, 'final_output.png', force=True)
+    print(f"Snapshots: {writer.stats}")
 
-    # Save intermediate output
-    Image.fromarray(current_solution_grid.astype(np.uint8), mode='L').save(f'output_iteration_{iteration}.png')
 
-# ------------------------ Save Final Output ------------------------
-if best_solution_grid is not None:
-    Image.fromarray(best_solution_grid.astype(np.uint8), mode='L').save('final_output.png')
+if __name__ == "__main__":
+    main()
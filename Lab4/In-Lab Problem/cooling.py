@@ -0,0 +1,139 @@
+import math
+import statistics
+
+# Every schedule is called once per iteration as schedule(T, accepted, improved) and
+# returns the next temperature; start(T0, iterations) is called before the first step.
+# frozen(T) decides whether the run stops because the temperature is exhausted, so a
+# schedule that reheats or holds a floor is never cut short by a fixed threshold.
+
+# Below this temperature an uphill move is never accepted
+T_MIN = 1e-8
+
+# --------------------- Cooling Schedules ---------------------
+class GeometricCooling:
+    """T <- alpha * T (the original schedule)."""
+
+    def __init__(self, alpha=0.99):
+        self.alpha = alpha
+
+    def start(self, T0, iterations):
+        pass
+
+    def __call__(self, T, accepted, improved):
+        return T * self.alpha
+
+    def frozen(self, T):
+        return T < T_MIN
+
+
+class LundyMeesCooling:
+    """
+    T <- T / (1 + beta * T). Without an explicit beta, it is chosen so the temperature
+    reaches T_final after exactly the iteration budget.
+    """
+
+    def __init__(self, beta=None, T_final=1e-3):
+        self.beta = beta
+        self.T_final = T_final
+
+    def start(self, T0, iterations):
+        # A computed beta belongs to this run only, so a reused instance recomputes it
+        self.run_beta = self.beta
+        if self.run_beta is None:
+            self.run_beta = (T0 - self.T_final) / (max(iterations, 1) * T0 * self.T_final)
+
+    def __call__(self, T, accepted, improved):
+        return T / (1 + self.run_beta * T)
+
+    def frozen(self, T):
+        return False  # decays only as 1 / iteration, so it runs the full budget
+
+
+class AdaptiveCooling:
+    """
+    Geometric cooling whose rate is re-chosen every `window` steps from the acceptance
+    rate: cool quickly (alpha) while many moves are accepted and slowly (slow_alpha,
+    by default alpha ** 0.25) once acceptance drops below target, where most of the
+    useful search happens. The temperature is held at T_MIN rather than stopping the
+    run, which ends on the iteration budget or stall detection.
+    """
+
+    def __init__(self, alpha=0.99, slow_alpha=None, target=0.1, window=200):
+        self.alpha = alpha
+        self.slow_alpha = alpha ** 0.25 if slow_alpha is None else slow_alpha
+        self.target = target
+        self.window = window
+
+    def start(self, T0, iterations):
+        self.factor = self.alpha
+        self.steps = 0
+        self.accepted = 0
+
+    def __call__(self, T, accepted, improved):
+        self.steps += 1
+        self.accepted += accepted
+        if self.steps == self.window:
+            self.factor = self.alpha if self.accepted / self.steps > self.target else self.slow_alpha
+            self.steps = self.accepted = 0
+        return max(T * self.factor, T_MIN)
+
+    def frozen(self, T):
+        return False
+
+
+class ReheatingCooling:
+    """
+    Geometric cooling that reheats to reheat_fraction * T0 after `patience` steps
+    without a new best tour, or as soon as the temperature would fall below T_MIN,
+    to escape a local minimum the walk has frozen into.
+    """
+
+    def __init__(self, alpha=0.99, patience=2000, reheat_fraction=0.1):
+        self.alpha = alpha
+        self.patience = patience
+        self.reheat_fraction = reheat_fraction
+
+    def start(self, T0, iterations):
+        self.T0 = T0
+        self.stale = 0
+        self.reheats = 0
+
+    def __call__(self, T, accepted, improved):
+        self.stale = 0 if improved else self.stale + 1
+        if self.stale >= self.patience or T * self.alpha < T_MIN:
+            self.stale = 0
+            self.reheats += 1
+            return max(T, self.reheat_fraction * self.T0)
+        return T * self.alpha
+
+    def frozen(self, T):
+        return False
+
+
+SCHEDULES = {
+    "geometric": GeometricCooling,
+    "lundy_mees": LundyMeesCooling,
+    "adaptive": AdaptiveCooling,
+    "reheating": ReheatingCooling,
+}
+
+
+def make_schedule(name, alpha=0.99, **kwargs):
+    """Build a schedule by name; alpha is passed to the schedules that cool geometrically."""
+    cls = SCHEDULES[name]
+    if cls is not LundyMeesCooling:
+        kwargs.setdefault("alpha", alpha)
+    return cls(**kwargs)
+
+
+# --------------------- Initial Temperature ---------------------
+def calibrate_T0(sample_delta, samples=200, acceptance=0.8):
+    """
+    Choose T0 so an average uphill move is accepted with the given probability:
+    T0 = -mean(uphill delta) / ln(acceptance). sample_delta() returns the delta of one
+    random proposal without applying it.
+    """
+    uphill = [d for d in (sample_delta() for _ in range(samples)) if d > 0]
+    if not uphill:
+        return 1.0
+    return -statistics.mean(uphill) / math.log(acceptance)
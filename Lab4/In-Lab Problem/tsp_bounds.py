@@ -0,0 +1,193 @@
+from collections import deque
+
+import numpy as np
+
+# --------------------- Held-Karp 1-Tree Lower Bound ---------------------
+def _one_tree(w):
+    """
+    Minimum 1-tree under weights w: a spanning tree on cities 1..n-1 (Prim) plus the two
+    cheapest edges at city 0. Returns (cost, degree of every city).
+    """
+    n = len(w)
+    degree = np.zeros(n, dtype=np.int64)
+    in_tree = np.zeros(n, dtype=bool)
+    in_tree[:2] = True
+    key = w[1].copy()
+    key[:2] = np.inf
+    parent = np.ones(n, dtype=np.int64)
+    cost = 0.0
+    for _ in range(n - 2):
+        v = int(np.argmin(key))
+        cost += key[v]
+        degree[v] += 1
+        degree[parent[v]] += 1
+        in_tree[v] = True
+        key[v] = np.inf
+        closer = ~in_tree & (w[v] < key)
+        key[closer] = w[v][closer]
+        parent[closer] = v
+    two = np.argpartition(w[0, 1:], 1)[:2] + 1
+    cost += w[0, two].sum()
+    degree[two] += 1
+    degree[0] = 2
+    return cost, degree
+
+
+def held_karp_bound(dist, upper=None, iterations=300, step=2.0, patience=20):
+    """
+    Held-Karp lower bound on the optimal tour length: maximise the 1-tree bound over
+    city penalties pi by subgradient ascent, moving pi towards degree 2 at every city.
+    upper is a known tour length (the step size scales with upper - bound); the
+    nearest-neighbour tour is used when it is not given. The step is halved after
+    `patience` iterations without a better bound.
+    """
+    d = np.asarray(dist, dtype=np.float64)
+    n = len(d)
+    if n < 3:
+        return float(2 * d.max()) if n == 2 else 0.0
+    if upper is None:
+        upper = tour_cost(nearest_neighbour_tour(d.tolist()), d.tolist())
+    pi = np.zeros(n)
+    best = -np.inf
+    stale = 0
+    for _ in range(iterations):
+        cost, degree = _one_tree(d + pi[:, None] + pi[None, :])
+        bound = cost - 2 * pi.sum()
+        if bound > best + 1e-9:
+            best, stale = bound, 0
+        else:
+            stale += 1
+            if stale >= patience:
+                step, stale = step / 2, 0
+        g = degree - 2
+        norm = float((g * g).sum())
+        if norm == 0 or step < 1e-6:
+            break  # the 1-tree is a tour (so the bound is tight), or ascent has converged
+        pi += step * max(upper - bound, 1e-9) / norm * g
+    return float(best)
+
+
+# --------------------- Construction Helpers ---------------------
+def tour_cost(tour, dist):
+    return sum(dist[tour[i]][tour[(i+1) % len(tour)]] for i in range(len(tour)))
+
+
+def nearest_neighbour_tour(dist, start=0):
+    n = len(dist)
+    tour, left = [start], set(range(n)) - {start}
+    while left:
+        row = dist[tour[-1]]
+        city = min(left, key=row.__getitem__)
+        tour.append(city)
+        left.remove(city)
+    return tour
+
+
+def neighbour_lists(dist, k=8):
+    """neighbours[a]: the k cities nearest to a in a dense distance matrix."""
+    n = len(dist)
+    return [sorted((c for c in range(n) if c != a), key=dist[a].__getitem__)[:k] for a in range(n)]
+
+
+# --------------------- 2-opt / Or-opt Polish ---------------------
+def _reverse(tour, pos, i, j):
+    """Reverse the cyclic stretch tour[i..j], or its complement when that is shorter."""
+    n = len(tour)
+    length = (j - i) % n + 1
+    if 2 * length > n:
+        i, j, length = (j + 1) % n, (i - 1) % n, n - length
+    for k in range(length // 2):
+        a, b = (i + k) % n, (j - k) % n
+        tour[a], tour[b] = tour[b], tour[a]
+        pos[tour[a]], pos[tour[b]] = a, b
+
+
+def _try_2opt(a, tour, pos, dist, neighbours):
+    n = len(tour)
+    i = pos[a]
+    for succ_side in (True, False):
+        b = tour[(i + 1) % n] if succ_side else tour[i - 1]
+        d_ab = dist[a][b]
+        for c in neighbours[a]:
+            d_ac = dist[a][c]
+            if d_ac >= d_ab:
+                break  # neighbours are sorted, so no later c can gain either
+            j = pos[c]
+            d = tour[(j + 1) % n] if succ_side else tour[j - 1]
+            if c == b or d == a:
+                continue
+            gain = d_ab + dist[c][d] - d_ac - dist[b][d]
+            if gain > 1e-10:
+                if succ_side:
+                    _reverse(tour, pos, (i + 1) % n, j)   # a-c ... b-d
+                else:
+                    _reverse(tour, pos, i, (j - 1) % n)   # b-d ... a-c
+                return (a, b, c, d)
+    return None
+
+
+def _try_oropt(a, tour, pos, dist, neighbours, max_segment=3):
+    """Move the segment starting at a (1..max_segment cities) next to one of a's neighbours."""
+    n = len(tour)
+    i = pos[a]
+    for length in range(1, min(max_segment, n - 3) + 1):
+        segment = [tour[(i + k) % n] for k in range(length)]
+        first, last = segment[0], segment[-1]
+        p, nx = tour[i - 1], tour[(i + length) % n]
+        removal = dist[p][first] + dist[last][nx] - dist[p][nx]
+        inside = set(segment)
+        for c in neighbours[first]:
+            if c in inside:
+                continue
+            for u, v in ((tour[pos[c] - 1], c), (c, tour[(pos[c] + 1) % n])):
+                if u in inside or v in inside:
+                    continue
+                forward = dist[u][first] + dist[last][v]
+                backward = dist[u][last] + dist[first][v]
+                insertion = min(forward, backward) - dist[u][v]
+                if removal - insertion > 1e-10:
+                    rest = [city for city in tour if city not in inside]
+                    if backward < forward:
+                        segment.reverse()
+                    at = rest.index(u) + 1
+                    tour[:] = rest[:at] + segment + rest[at:]
+                    for k, city in enumerate(tour):
+                        pos[city] = k
+                    return (p, nx, u, v, first, last)
+    return None
+
+
+def polish(tour, dist, neighbours=None, or_opt=True):
+    """
+    First-improvement 2-opt (and Or-opt) local search over neighbour lists with
+    don't-look bits: only cities whose edges changed are re-examined, so the polish
+    ends in near-linear time once the tour is close to a local optimum.
+    Returns (tour, length).
+    """
+    tour = list(tour)
+    if len(tour) < 5:
+        return tour, tour_cost(tour, dist)
+    neighbours = neighbour_lists(dist) if neighbours is None else neighbours
+    pos = [0] * len(tour)
+    for k, city in enumerate(tour):
+        pos[city] = k
+    queue = deque(tour)
+    queued = set(tour)
+    while queue:
+        a = queue.popleft()
+        queued.discard(a)
+        touched = _try_2opt(a, tour, pos, dist, neighbours)
+        if touched is None and or_opt:
+            touched = _try_oropt(a, tour, pos, dist, neighbours)
+        if touched is None:
+            continue  # don't look at a again until one of its edges changes
+        for city in touched + (a,):
+            if city not in queued:
+                queue.append(city)
+                queued.add(city)
+    return tour, tour_cost(tour, dist)
+
+
+def optimality_gap(length, bound):
+    """Relative excess of a tour length over a lower bound (0.05 means within 5%)."""
+    return (length - bound) / bound if bound > 0 else 0.0
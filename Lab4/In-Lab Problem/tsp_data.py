@@ -0,0 +1,301 @@
+import csv
+import hashlib
+import math
+import os
+
+import numpy as np
+
+EARTH_RADIUS_KM = 6371.0
+
+# TSPLIB's GEO distance uses these constants (not math.pi or the mean Earth radius),
+# so published optimal tour lengths are only reproduced with exactly these values
+TSPLIB_PI = 3.141592
+TSPLIB_RRR = 6378.388
+TSPLIB_METRICS = ("euc_2d", "ceil_2d", "att", "geo")
+
+# --------------------- Instance Loading ---------------------
+def read_tsplib(path):
+    """
+    Read the NODE_COORD_SECTION of a TSPLIB .tsp file.
+    Returns (names, coords, metric) with coords the file's (n, 2) float64 coordinates
+    and metric the lower-cased EDGE_WEIGHT_TYPE ("euc_2d", "ceil_2d", "att" or "geo"),
+    so distances follow TSPLIB's integer rounding rules.
+    """
+    header = {}
+    rows = []
+    in_coords = False
+    with open(path) as file:
+        for line in file:
+            line = line.strip()
+            if not line or line == "EOF":
+                continue
+            if in_coords:
+                parts = line.split()
+                if parts[0].isdigit():
+                    rows.append((parts[0], float(parts[1]), float(parts[2])))
+                    continue
+                in_coords = False  # the next section has started
+            if line.startswith("NODE_COORD_SECTION"):
+                in_coords = True
+            elif ':' in line:
+                key, value = line.split(':', 1)
+                header[key.strip().upper()] = value.strip()
+
+    metric = header.get("EDGE_WEIGHT_TYPE", "EUC_2D").lower()
+    if metric not in TSPLIB_METRICS:
+        raise ValueError(f"Unsupported EDGE_WEIGHT_TYPE: {metric.upper()}")
+
+    if "DIMENSION" in header and int(header["DIMENSION"]) != len(rows):
+        raise ValueError(f"{path}: DIMENSION is {header['DIMENSION']} but {len(rows)} nodes were read")
+    coords = np.array([(x, y) for _, x, y in rows], dtype=np.float64).reshape(-1, 2)
+    return [name for name, _, _ in rows], coords, metric
+
+
+def read_csv_cities(path, metric="haversine"):
+    """
+    Read name,lat,lon (or name,x,y) rows from a CSV file; a header row is skipped
+    when its coordinate columns are not numbers.
+    """
+    names, coords = [], []
+    with open(path, newline='') as file:
+        for row in csv.reader(file):
+            if not row:
+                continue
+            try:
+                a, b = float(row[1]), float(row[2])
+            except ValueError:
+                continue  # header
+            names.append(row[0])
+            coords.append((a, b))
+    return names, np.array(coords, dtype=np.float64).reshape(-1, 2), metric
+
+
+def load_instance(path, metric="haversine"):
+    """Load a .tsp (TSPLIB) or .csv city file as (names, coords, metric)."""
+    if path.lower().endswith(".tsp"):
+        return read_tsplib(path)
+    return read_csv_cities(path, metric)
+
+
+# --------------------- Dense Distance Matrices ---------------------
+def _haversine_block(coords, rows):
+    lat = np.radians(coords[:, 0])
+    lon = np.radians(coords[:, 1])
+    dlat = lat[rows, None] - lat[None, :]
+    dlon = lon[rows, None] - lon[None, :]
+    hav = np.sin(dlat / 2) ** 2 + np.cos(lat[rows, None]) * np.cos(lat[None, :]) * np.sin(dlon / 2) ** 2
+    return 2 * EARTH_RADIUS_KM * np.arcsin(np.sqrt(np.clip(hav, 0.0, 1.0)))
+
+
+def _euclidean_block(coords, rows):
+    diff = coords[rows, None, :] - coords[None, :, :]
+    return np.sqrt((diff ** 2).sum(axis=-1))
+
+
+def _geo_radians(values):
+    """TSPLIB GEO coordinates are DDD.MM (degrees and minutes); convert to radians."""
+    degrees = np.trunc(values)
+    return TSPLIB_PI * (degrees + 5.0 * (values - degrees) / 3.0) / 180.0
+
+
+# TSPLIB distances are integers: nint() for EUC_2D, rounding up for CEIL_2D, the
+# pseudo-Euclidean ATT rule and int() of the idealised-sphere GEO distance
+def _euc_2d_block(coords, rows):
+    return np.floor(_euclidean_block(coords, rows) + 0.5)
+
+
+def _ceil_2d_block(coords, rows):
+    return np.ceil(_euclidean_block(coords, rows))
+
+
+def _att_block(coords, rows):
+    r = _euclidean_block(coords, rows) / math.sqrt(10.0)
+    t = np.floor(r + 0.5)
+    return np.where(t < r, t + 1, t)
+
+
+def _geo_block(coords, rows):
+    lat = _geo_radians(coords[:, 0])
+    lon = _geo_radians(coords[:, 1])
+    q1 = np.cos(lon[rows, None] - lon[None, :])
+    q2 = np.cos(lat[rows, None] - lat[None, :])
+    q3 = np.cos(lat[rows, None] + lat[None, :])
+    cosine = np.clip(0.5 * ((1.0 + q1) * q2 - (1.0 - q1) * q3), -1.0, 1.0)
+    d = np.floor(TSPLIB_RRR * np.arccos(cosine) + 1.0)
+    index = np.arange(len(coords))[rows]
+    d[np.arange(len(index)), index] = 0.0  # the formula gives 1 for d(i, i)
+    return d
+
+
+_BLOCKS = {"haversine": _haversine_block, "euclidean": _euclidean_block, "euc_2d": _euc_2d_block,
+           "ceil_2d": _ceil_2d_block, "att": _att_block, "geo": _geo_block}
+
+
+def _fill_matrix(out, coords, metric, block_rows=512):
+    """Write the matrix block by block so temporaries stay O(block_rows * n)."""
+    block = _BLOCKS[metric]
+    for start in range(0, len(coords), block_rows):
+        rows = slice(start, start + block_rows)
+        out[rows] = block(coords, rows)
+    return out
+
+
+def haversine_matrix(coords, dtype=np.float64):
+    """Great-circle distances (km) between all (lat, lon) pairs."""
+    coords = np.asarray(coords, dtype=np.float64)
+    return _fill_matrix(np.empty((len(coords), len(coords)), dtype=dtype), coords, "haversine")
+
+
+def euclidean_matrix(coords, dtype=np.float64):
+    """Straight-line distances between all (x, y) pairs."""
+    coords = np.asarray(coords, dtype=np.float64)
+    return _fill_matrix(np.empty((len(coords), len(coords)), dtype=dtype), coords, "euclidean")
+
+
+def cached_distance_matrix(coords, metric="haversine", cache_dir=".tsp_cache"):
+    """
+    float32 distance matrix stored as .npy under cache_dir and memory-mapped on later
+    runs. The file name hashes the coordinates, so a changed instance never hits a
+    stale cache.
+    """
+    coords = np.ascontiguousarray(coords, dtype=np.float64)
+    digest = hashlib.sha1(coords.tobytes() + metric.encode()).hexdigest()[:16]
+    path = os.path.join(cache_dir, f"{metric}-{len(coords)}-{digest}.npy")
+    if not os.path.exists(path):
+        os.makedirs(cache_dir, exist_ok=True)
+        partial = path + ".part"
+        out = np.lib.format.open_memmap(partial, mode='w+', dtype=np.float32,
+                                        shape=(len(coords), len(coords)))
+        _fill_matrix(out, coords, metric)
+        out.flush()
+        del out
+        os.replace(partial, path)
+    return np.load(path, mmap_mode='r')
+
+
+# --------------------- On-Demand Distances ---------------------
+class _DistanceRow:
+    __slots__ = ("owner", "i")
+
+    def __init__(self, owner, i):
+        self.owner = owner
+        self.i = i
+
+    def __getitem__(self, j):
+        return self.owner.distance(self.i, j)
+
+
+class OnDemandDistances:
+    """
+    Drop-in replacement for a distance matrix (dist[a][b]) that computes each entry
+    when asked, for instances too large to hold n^2 distances.
+    """
+
+    def __init__(self, coords, metric="haversine"):
+        coords = np.asarray(coords, dtype=np.float64)
+        if metric not in _BLOCKS:
+            raise ValueError(f"Unknown metric: {metric}")
+        self.metric = metric
+        if metric == "haversine":
+            self.a = np.radians(coords[:, 0]).tolist()
+            self.b = np.radians(coords[:, 1]).tolist()
+            self.cos_a = np.cos(np.radians(coords[:, 0])).tolist()
+        elif metric == "geo":
+            self.a = _geo_radians(coords[:, 0]).tolist()
+            self.b = _geo_radians(coords[:, 1]).tolist()
+        else:
+            self.a = coords[:, 0].tolist()
+            self.b = coords[:, 1].tolist()
+
+    def __len__(self):
+        return len(self.a)
+
+    def __getitem__(self, i):
+        return _DistanceRow(self, i)
+
+    def distance(self, i, j):
+        metric = self.metric
+        if metric == "haversine":
+            hav = (math.sin((self.a[j] - self.a[i]) / 2) ** 2
+                   + self.cos_a[i] * self.cos_a[j] * math.sin((self.b[j] - self.b[i]) / 2) ** 2)
+            return 2 * EARTH_RADIUS_KM * math.asin(math.sqrt(min(hav, 1.0)))
+        if metric == "geo":
+            if i == j:
+                return 0.0
+            q1 = math.cos(self.b[i] - self.b[j])
+            q2 = math.cos(self.a[i] - self.a[j])
+            q3 = math.cos(self.a[i] + self.a[j])
+            cosine = max(-1.0, min(1.0, 0.5 * ((1.0 + q1) * q2 - (1.0 - q1) * q3)))
+            return float(math.floor(TSPLIB_RRR * math.acos(cosine) + 1.0))
+        d = math.hypot(self.a[i] - self.a[j], self.b[i] - self.b[j])
+        if metric == "euclidean":
+            return d
+        if metric == "euc_2d":
+            return float(math.floor(d + 0.5))
+        if metric == "ceil_2d":
+            return float(math.ceil(d))
+        r = d / math.sqrt(10.0)  # att
+        t = math.floor(r + 0.5)
+        return float(t + 1 if t < r else t)
+
+
+# --------------------- Candidate Lists ---------------------
+def _unit_sphere(lat, lon):
+    """(lat, lon) in radians -> 3D points on the unit sphere; chord length orders pairs like great-circle distance."""
+    return np.column_stack((np.cos(lat) * np.cos(lon), np.cos(lat) * np.sin(lon), np.sin(lat)))
+
+
+def nearest_neighbours(coords, k=10, metric="haversine", block_rows=512):
+    """
+    candidates[i]: the k cities closest to city i, nearest first. Uses a k-d tree
+    from scipy when it is installed and blockwise NumPy argpartition otherwise.
+    """
+    coords = np.asarray(coords, dtype=np.float64)
+    n = len(coords)
+    k = min(k, n - 1)
+    if k <= 0:
+        return [[] for _ in range(n)]
+    if metric == "haversine":
+        points = _unit_sphere(np.radians(coords[:, 0]), np.radians(coords[:, 1]))
+    elif metric == "geo":
+        points = _unit_sphere(_geo_radians(coords[:, 0]), _geo_radians(coords[:, 1]))
+    else:
+        points = coords  # the TSPLIB rounding rules keep the Euclidean order (up to ties)
+
+    try:
+        from scipy.spatial import cKDTree
+    except ImportError:
+        cKDTree = None
+
+    if cKDTree is not None:
+        _, idx = cKDTree(points).query(points, k=k + 1)
+        return [[j for j in row if j != i][:k] for i, row in enumerate(idx.tolist())]
+
+    candidates = []
+    for start in range(0, n, block_rows):
+        rows = np.arange(start, min(start + block_rows, n))
+        d = ((points[rows, None, :] - points[None, :, :]) ** 2).sum(axis=-1)
+        d[np.arange(len(rows)), rows] = np.inf
+        near = np.argpartition(d, k - 1, axis=1)[:, :k]
+        order = np.take_along_axis(d, near, axis=1).argsort(axis=1)
+        candidates.extend(np.take_along_axis(near, order, axis=1).tolist())
+    return candidates
+
+
+# --------------------- Choosing a Representation ---------------------
+def build_distances(coords, metric="haversine", cache_dir=None, dense_limit=20000, list_limit=2000):
+    """
+    Distances for the annealer: a list-of-lists matrix up to list_limit cities (fastest
+    scalar lookups, but about 32 bytes per entry), a float32 matrix up to dense_limit
+    cities (cached and memory-mapped when cache_dir is given), and on-demand
+    computation beyond that.
+    """
+    n = len(coords)
+    if n > dense_limit:
+        return OnDemandDistances(coords, metric)
+    if cache_dir is not None:
+        return cached_distance_matrix(coords, metric, cache_dir)
+    coords = np.asarray(coords, dtype=np.float64)
+    if n > list_limit:
+        return _fill_matrix(np.empty((n, n), dtype=np.float32), coords, metric)
+    return _fill_matrix(np.empty((n, n)), coords, metric).tolist()
@@ -0,0 +1,239 @@
+import argparse
+import math
+import os
+import random
+import statistics
+import sys
+import time
+from concurrent.futures import ProcessPoolExecutor
+
+from cooling import SCHEDULES, make_schedule
+from tsp_bounds import held_karp_bound, optimality_gap, polish
+from tsp_data import build_distances, load_instance, nearest_neighbours
+from tsp_rajasthan_sa_problem import MOVES, dist, n, plot_tour, simulated_annealing, tour_length
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__)))))
+from cs307.metrics import SearchMetrics  # noqa: E402
+
+BOUND_LIMIT = 2000  # the Held-Karp bound needs a dense float64 matrix and O(n^2) work per step
+
+# --------------------- Problem Instance ---------------------
+# Chains read the instance from here: the Rajasthan cities unless an instance file
+# was loaded with use_instance (in the parent and, via the pool initializer, in
+# every worker; with cache_dir set the workers memory-map the parent's matrix).
+instance = {'dist': dist, 'n': n, 'candidates': None, 'points': None, 'labels': None}
+
+
+def use_instance(path, metric="haversine", cache_dir=None, candidates=0, dense_limit=20000):
+    """Load a .tsp or .csv instance, its distances and (when candidates > 0) k-nearest candidate lists."""
+    names, coords, metric = load_instance(path, metric)
+    instance['dist'] = build_distances(coords, metric, cache_dir, dense_limit)
+    instance['n'] = len(coords)
+    instance['candidates'] = nearest_neighbours(coords, candidates, metric) if candidates else None
+    # (lat, lon) instances are plotted as (lon, lat); planar ones as (x, y)
+    instance['points'] = coords[:, ::-1].tolist() if metric in ("haversine", "geo") else coords.tolist()
+    instance['labels'] = names if len(names) <= 60 else None
+    return instance
+
+# --------------------- Independent Chains ---------------------
+def run_chain(alpha, seed, iterations=50000, T0=4000.0, move="2opt", schedule="geometric",
+              stall_epochs=None, polish_tour=False):
+    """One annealing chain (optionally followed by a 2-opt/Or-opt polish); returns a result row."""
+    start = time.perf_counter()
+    metrics = SearchMetrics()
+    tour, length = simulated_annealing(alpha=alpha, iterations=iterations, T0=T0, seed=seed, move=move,
+                                       dist=instance['dist'], candidates=instance['candidates'],
+                                       schedule=make_schedule(schedule, alpha), stall_epochs=stall_epochs,
+                                       metrics=metrics)
+    if polish_tour:
+        tour, length = polish(tour, instance['dist'], neighbours=instance['candidates'])
+    config = f"alpha={alpha}" if schedule == "geometric" else f"{schedule} {alpha}"
+    return {'config': config, 'alpha': alpha, 'seed': seed, 'best_len': length,
+            'tour': tour, 'time': time.perf_counter() - start, 'iterations': metrics.info['iterations']}
+
+
+# --------------------- Parallel Tempering ---------------------
+def _metropolis(tour, length, T, steps, move_types):
+    """Fixed-temperature moves on tour in place; returns (length, best_tour, best_len)."""
+    best, best_len = tour.copy(), length
+    for _ in range(steps):
+        propose, apply = move_types[0] if len(move_types) == 1 else random.choice(move_types)
+        delta, proposal = propose(tour, instance['dist'])
+        if delta < 0 or random.random() < math.exp(-delta / T):
+            apply(tour, proposal)
+            length += delta
+            if length < best_len:
+                best, best_len = tour.copy(), length
+    return length, best, best_len
+
+
+def parallel_tempering(seed, replicas=8, T_max=1000.0, T_min=1.0, sweeps=60,
+                       steps_per_sweep=100, move="2opt"):
+    """
+    Replicas run Metropolis at fixed temperatures on a geometric ladder from T_max to
+    T_min. After every sweep, neighbouring replicas exchange tours with probability
+    min(1, exp((1/T_i - 1/T_j)(L_i - L_j))), so good tours drift towards the cold end
+    while hot replicas keep exploring.
+    """
+    start = time.perf_counter()
+    random.seed(seed)
+    move_types = list(MOVES.values()) if move == "mixed" else [MOVES[move]]
+    ratio = (T_min / T_max) ** (1 / max(replicas - 1, 1))
+    temps = [T_max * ratio ** k for k in range(replicas)]
+    tours = []
+    for _ in range(replicas):
+        tour = list(range(instance['n']))
+        random.shuffle(tour)
+        tours.append(tour)
+    lengths = [tour_length(tour, instance['dist']) for tour in tours]
+    best_len = min(lengths)
+    best = tours[lengths.index(best_len)].copy()
+    swaps = attempts = 0
+
+    for sweep in range(sweeps):
+        for k in range(replicas):
+            lengths[k], tour, length = _metropolis(tours[k], lengths[k], temps[k], steps_per_sweep,
+                                                   move_types)
+            if length < best_len:
+                best, best_len = tour, length
+        for k in range(sweep % 2, replicas - 1, 2):
+            attempts += 1
+            exponent = (1 / temps[k] - 1 / temps[k+1]) * (lengths[k] - lengths[k+1])
+            if exponent >= 0 or random.random() < math.exp(exponent):
+                tours[k], tours[k+1] = tours[k+1], tours[k]
+                lengths[k], lengths[k+1] = lengths[k+1], lengths[k]
+                swaps += 1
+
+    return {'config': f"PT x{replicas}", 'alpha': None, 'seed': seed,
+            'best_len': tour_length(best, instance['dist']),
+            'tour': best, 'time': time.perf_counter() - start,
+            'iterations': sweeps * replicas * steps_per_sweep, 'swap_rate': swaps / attempts if attempts else 0.0}
+
+
+# --------------------- Sweep and Summary ---------------------
+def _run_task(task):
+    kind, kwargs = task
+    return run_chain(**kwargs) if kind == "chain" else parallel_tempering(**kwargs)
+
+
+def run_sweep(alphas, seeds, iterations=50000, move="2opt", tempering=False, replicas=8,
+              max_workers=None, schedule="geometric", T0=4000.0, stall_epochs=None, polish_tour=False,
+              instance_args=None):
+    """
+    Every (alpha, seed) chain, plus one tempering run per seed, in a process pool.
+    instance_args are use_instance arguments each worker loads its instance with.
+    """
+    tasks = [("chain", {'alpha': a, 'seed': s, 'iterations': iterations, 'move': move,
+                        'schedule': schedule, 'T0': T0, 'stall_epochs': stall_epochs,
+                        'polish_tour': polish_tour})
+             for a in alphas for s in seeds]
+    if tempering:
+        steps_per_sweep = 100
+        sweeps = max(1, iterations // (replicas * steps_per_sweep))  # same move budget as a chain
+        tasks += [("pt", {'seed': s, 'replicas': replicas, 'sweeps': sweeps,
+                          'steps_per_sweep': steps_per_sweep, 'move': move}) for s in seeds]
+    initializer = use_instance if instance_args is not None else None
+    with ProcessPoolExecutor(max_workers=max_workers, initializer=initializer,
+                             initargs=instance_args or ()) as pool:
+        return list(pool.map(_run_task, tasks))
+
+
+def summarize(rows, bound=None):
+    """Best, mean and std of the tour length per configuration, with the mean gap to a lower bound."""
+    groups = {}
+    for row in rows:
+        groups.setdefault(row['config'], []).append(row)
+    summary = []
+    for config, group in groups.items():
+        lengths = [row['best_len'] for row in group]
+        best_row = min(group, key=lambda row: row['best_len'])
+        summary.append({
+            'config': config,
+            'alpha': group[0]['alpha'],
+            'runs': len(group),
+            'best': best_row['best_len'],
+            'mean': statistics.mean(lengths),
+            'std': statistics.stdev(lengths) if len(lengths) > 1 else 0.0,
+            'mean_time': statistics.mean(row['time'] for row in group),
+            'mean_iterations': statistics.mean(row['iterations'] for row in group),
+            'best_tour': best_row['tour'],
+            'gap': optimality_gap(statistics.mean(lengths), bound) if bound else None,
+        })
+    return summary
+
+
+def print_summary(summary):
+    print(f"{'Config':<18}{'Runs':>6}{'Best (km)':>12}{'Mean (km)':>12}{'Std':>9}{'Gap %':>8}"
+          f"{'Iters':>9}{'Time (s)':>10}")
+    for row in summary:
+        gap = f"{100 * row['gap']:>8.2f}" if row['gap'] is not None else f"{'-':>8}"
+        print(f"{row['config']:<18}{row['runs']:>6}{row['best']:>12.2f}{row['mean']:>12.2f}"
+              f"{row['std']:>9.2f}{gap}{row['mean_iterations']:>9.0f}{row['mean_time']:>10.3f}")
+
+
+# --------------------- Command Line Entry Point ---------------------
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Run many TSP annealing chains in parallel.")
+    parser.add_argument('--alphas', type=float, nargs='+', default=[0.99, 0.95, 0.90])
+    parser.add_argument('--seeds', type=int, default=8, help="chains per configuration")
+    parser.add_argument('--iterations', type=int, default=50000)
+    parser.add_argument('--move', default="2opt", choices=sorted(MOVES) + ["mixed"])
+    parser.add_argument('--schedule', default="geometric", choices=sorted(SCHEDULES))
+    parser.add_argument('--t0', default="4000", help='start temperature, or "auto" to calibrate it')
+    parser.add_argument('--stall-epochs', type=int, default=None,
+                        help="stop a chain after this many stalled 1000-iteration epochs")
+    parser.add_argument('--polish', action='store_true', help="2-opt/Or-opt polish every chain's tour")
+    parser.add_argument('--tempering', action='store_true', help="also run parallel tempering")
+    parser.add_argument('--replicas', type=int, default=8)
+    parser.add_argument('--workers', type=int, default=None)
+    parser.add_argument('--plot-dir', default="tsp_plots", help="where the best tour per configuration is saved")
+    parser.add_argument('--no-plots', action='store_true')
+    parser.add_argument('--instance', default=None,
+                        help="TSPLIB .tsp or name,lat,lon .csv file (default: the Rajasthan cities)")
+    parser.add_argument('--metric', default="haversine", choices=["haversine", "euclidean"],
+                        help="distance for .csv instances (.tsp files use their EDGE_WEIGHT_TYPE)")
+    parser.add_argument('--cache-dir', default=None,
+                        help="cache the float32 distance matrix here and memory-map it in every worker")
+    parser.add_argument('--dense-limit', type=int, default=20000,
+                        help="compute distances on demand above this many cities")
+    parser.add_argument('--candidates', type=int, default=0,
+                        help="restrict 2-opt to each city's k nearest neighbours (2opt moves only)")
+    args = parser.parse_args(argv)
+    if args.candidates and args.move != "2opt":
+        parser.error("--candidates drives 2-opt moves only")
+
+    instance_args = None
+    if args.instance is not None:
+        instance_args = (args.instance, args.metric, args.cache_dir, args.candidates, args.dense_limit)
+        use_instance(*instance_args)
+        print(f"{args.instance}: {instance['n']} cities")
+
+    start = time.perf_counter()
+    rows = run_sweep(args.alphas, range(args.seeds), args.iterations, args.move,
+                     args.tempering, args.replicas, args.workers, args.schedule,
+                     args.t0 if args.t0 == "auto" else float(args.t0), args.stall_epochs, args.polish,
+                     instance_args)
+    bound = None
+    if instance['n'] <= BOUND_LIMIT:
+        bound = held_karp_bound(instance['dist'], upper=min(row['best_len'] for row in rows))
+    summary = summarize(rows, bound)
+    print(f"{len(rows)} runs on {args.workers or os.cpu_count()} workers in {time.perf_counter() - start:.1f} s")
+    if bound is not None:
+        print(f"Held-Karp lower bound: {bound:.2f} km\n")
+    else:
+        print(f"Held-Karp lower bound skipped (more than {BOUND_LIMIT} cities)\n")
+    print_summary(summary)
+
+    if not args.no_plots:
+        os.makedirs(args.plot_dir, exist_ok=True)
+        for row in summary:
+            label = row['config'].replace('=', '_').replace(' ', '_')
+            path = os.path.join(args.plot_dir, f"tour_{label}.png")
+            alpha = row['alpha'] if row['alpha'] is not None else row['config']
+            plot_tour(row['best_tour'], row['best'], alpha, save_path=path,
+                      points=instance['points'], labels=instance['labels'])
+        print(f"\nPlots saved to {args.plot_dir}/")
+
+
+if __name__ == "__main__":
+    main()
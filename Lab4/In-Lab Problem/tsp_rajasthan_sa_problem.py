@@ -1,7 +1,9 @@
 import math
 import random
 import time
-import matplotlib.pyplot as plt
+
+from cooling import GeometricCooling, calibrate_T0
+from tsp_data import haversine_matrix
 
 # --------------------- Utility ---------------------
 def haversine(a, b):
@@ -41,62 +43,241 @@ cities = {
 names = list(cities.keys())
 n = len(names)
 
-# Precompute distance matrix
-dist = [[0]*n for _ in range(n)]
-for i in range(n):
-    for j in range(n):
-        if i != j:
-            dist[i][j] = haversine(cities[names[i]], cities[names[j]])
+# Precompute distance matrix (vectorised; nested lists keep scalar lookups fast)
+dist = haversine_matrix([cities[name] for name in names]).tolist()
 
-def tour_length(tour):
+def tour_length(tour, dist=dist):
     return sum(dist[tour[i]][tour[(i+1)%len(tour)]] for i in range(len(tour)))
 
+# --------------------- Neighbourhood Moves ---------------------
+# Each move type has a proposal that returns (delta, move) from O(1) distance lookups
+# without touching the tour, and an apply step that edits the tour in place.
+
+def propose_2opt(tour, dist):
+    """Reverse tour[i..j]; only the two edges at the ends of the segment change."""
+    n = len(tour)
+    i = random.randrange(0, n-1)
+    j = random.randrange(i+1, n)
+    if i == 0 and j == n - 1:
+        return 0.0, (i, j)  # reversing the whole cycle gives the same tour
+    a, b = tour[i-1], tour[i]
+    c, d = tour[j], tour[(j+1) % n]
+    return dist[a][c] + dist[b][d] - dist[a][b] - dist[c][d], (i, j)
+
+def apply_2opt(tour, move):
+    i, j = move
+    tour[i:j+1] = tour[j:i-1:-1] if i > 0 else tour[j::-1]
+
+def propose_2opt_near(tour, dist, candidates, pos):
+    """
+    2-opt that links a random city a to one of its candidate neighbours c by reversing
+    the stretch after a up to c, so large instances only try plausible edges.
+    """
+    n = len(tour)
+    a = random.randrange(n)
+    c = random.choice(candidates[a])
+    i, j = pos[a], pos[c]
+    if i > j:
+        i, j = j, i
+    i += 1  # reverse tour[i..j]; tour[i-1] and tour[j] become neighbours
+    p, b = tour[i-1], tour[i]
+    e, d = tour[j], tour[(j+1) % n]
+    return dist[p][e] + dist[b][d] - dist[p][b] - dist[e][d], (i, j)
+
+def apply_2opt_tracked(tour, move, pos):
+    apply_2opt(tour, move)
+    i, j = move
+    for k in range(i, j+1):
+        pos[tour[k]] = k
+
+def _edges_at(tour, positions, dist):
+    n = len(tour)
+    return sum(dist[tour[k]][tour[(k+1) % n]] for k in positions)
+
+def propose_swap(tour, dist):
+    """Exchange the cities at positions i and j; at most four edges change."""
+    n = len(tour)
+    i, j = random.sample(range(n), 2)
+    positions = {(i-1) % n, i, (j-1) % n, j}
+    before = _edges_at(tour, positions, dist)
+    tour[i], tour[j] = tour[j], tour[i]
+    after = _edges_at(tour, positions, dist)
+    tour[i], tour[j] = tour[j], tour[i]
+    return after - before, (i, j)
+
+def apply_swap(tour, move):
+    i, j = move
+    tour[i], tour[j] = tour[j], tour[i]
+
+def propose_oropt(tour, dist, max_segment=3):
+    """
+    Move a segment of 1-3 cities (optionally reversed) between two other neighbours.
+    Tours of fewer than 4 cities have no such move; the proposal is then (0.0, None).
+    """
+    n = len(tour)
+    if n < 4:
+        return 0.0, None
+    length = random.randint(1, min(max_segment, n - 3))
+    i = random.randrange(0, n - length + 1)
+    k = i + length - 1
+    # Insert after tour[p] for any p outside the segment and its predecessor
+    p = (k + 1 + random.randrange(n - length - 1)) % n
+    reverse = random.random() < 0.5
+    prev, nxt = tour[i-1], tour[(k+1) % n]
+    s0, s1 = tour[i], tour[k]
+    u, v = tour[p], tour[(p+1) % n]
+    if reverse:
+        s0, s1 = s1, s0
+    delta = (dist[prev][nxt] + dist[u][s0] + dist[s1][v]
+             - dist[prev][tour[i]] - dist[tour[k]][nxt] - dist[u][v])
+    return delta, (i, length, p, reverse)
+
+def apply_oropt(tour, move):
+    if move is None:
+        return
+    i, length, p, reverse = move
+    segment = tour[i:i+length]
+    if reverse:
+        segment.reverse()
+    del tour[i:i+length]
+    # p lies outside the segment; positions after it shift left once it is removed
+    insert_at = p + 1 - (length if p > i else 0)
+    tour[insert_at:insert_at] = segment
+
+MOVES = {
+    "2opt": (propose_2opt, apply_2opt),
+    "swap": (propose_swap, apply_swap),
+    "oropt": (propose_oropt, apply_oropt),
+}
+
 # --------------------- Simulated Annealing ---------------------
-def simulated_annealing(alpha=0.99, iterations=50000, T0=4000.0, seed=42):
+def simulated_annealing(alpha=0.99, iterations=50000, T0=4000.0, seed=42, move="2opt",
+                        dist=dist, candidates=None, schedule=None, epoch_length=1000,
+                        stall_epochs=None, min_acceptance=0.01, metrics=None):
+    """
+    Anneal a random tour. Each proposal is scored from the few distance-matrix entries
+    it changes and applied in place only when accepted, so rejected moves cost O(1).
+    move is "2opt", "swap", "oropt" or "mixed" (a uniformly random type each step).
+    dist may be any dist[a][b] lookup (nested lists, a NumPy/memory-mapped matrix or
+    tsp_data.OnDemandDistances); candidates[c] (e.g. tsp_data.nearest_neighbours)
+    restricts 2-opt to edges towards each city's nearest neighbours.
+
+    schedule is a cooling.py schedule (geometric with alpha when None) and T0="auto"
+    calibrates the start temperature from sampled deltas. With stall_epochs set, the
+    run stops once that many consecutive epochs of epoch_length iterations accept
+    fewer than min_acceptance of their moves without improving the best tour.
+    A metrics object (cs307.metrics.SearchMetrics) counts accepted, rejected and
+    improving moves, records per-epoch temperature, acceptance rate and lengths in
+    its 'epochs' series and notes the 'iterations' run and the 'stop_reason'.
+    """
     random.seed(seed)
-    curr = list(range(n))
+    curr = list(range(len(dist)))
     random.shuffle(curr)
-    best = curr.copy()
-    curr_len = tour_length(curr)
+    curr_len = tour_length(curr, dist)
+    best = None  # only copied when the walk is about to leave the best tour
     best_len = curr_len
+    at_best = True
+    if candidates is not None:
+        if move != "2opt":
+            raise ValueError("candidate lists drive 2-opt moves only")
+        pos = [0] * len(curr)
+        for k, city in enumerate(curr):
+            pos[city] = k
+        move_types = [(lambda tour, dist: propose_2opt_near(tour, dist, candidates, pos),
+                       lambda tour, proposal: apply_2opt_tracked(tour, proposal, pos))]
+    else:
+        move_types = list(MOVES.values()) if move == "mixed" else [MOVES[move]]
+
+    if T0 == "auto":
+        T0 = calibrate_T0(lambda: random.choice(move_types)[0](curr, dist)[0])
+    if schedule is None:
+        schedule = GeometricCooling(alpha)
+    schedule.start(T0, iterations)
     T = T0
+    stop_reason = "iterations"
+    epoch_accepted = 0
+    epoch_best = best_len
+    stalled = 0
+    it = 0
 
-    for _ in range(iterations):
-        i = random.randrange(0, n-1)
-        j = random.randrange(i+1, n)
-        neigh = curr.copy()
-        neigh[i:j+1] = reversed(neigh[i:j+1])
-        neigh_len = tour_length(neigh)
-        delta = neigh_len - curr_len
+    for it in range(1, iterations + 1):
+        propose, apply = move_types[0] if len(move_types) == 1 else random.choice(move_types)
+        delta, proposal = propose(curr, dist)
 
+        accepted = improved = False
         if delta < 0 or random.random() < math.exp(-delta / T):
-            curr, curr_len = neigh, neigh_len
+            if at_best and delta > 0:
+                best, at_best = curr.copy(), False
+            apply(curr, proposal)
+            curr_len += delta
+            accepted = True
             if curr_len < best_len:
-                best, best_len = curr.copy(), curr_len
-        T *= alpha
-        if T < 1e-8:
+                best_len, at_best, improved = curr_len, True, True
+        epoch_accepted += accepted
+        T = schedule(T, accepted, improved)
+        if metrics is not None:
+            metrics.count('accepted' if accepted else 'rejected')
+            if improved:
+                metrics.count('improved')
+
+        if it % epoch_length == 0:
+            acceptance = epoch_accepted / epoch_length
+            if metrics is not None:
+                metrics.record('epochs', {'iteration': it, 'T': T, 'acceptance': acceptance,
+                                          'curr_len': curr_len, 'best_len': best_len})
+            stalled = stalled + 1 if acceptance < min_acceptance and best_len >= epoch_best else 0
+            epoch_accepted, epoch_best = 0, best_len
+            if stall_epochs is not None and stalled >= stall_epochs:
+                stop_reason = "stalled"
+                break
+        if schedule.frozen(T):
+            stop_reason = "frozen"
             break
 
-    return best, best_len
+    if metrics is not None:
+        metrics.note('iterations', it)
+        metrics.note('stop_reason', stop_reason)
+    if at_best:
+        best = curr.copy()
+    # Re-measure once so accumulated floating-point deltas do not leak into the result
+    return best, tour_length(best, dist)
 
 # --------------------- Plotting Function ---------------------
-def plot_tour(tour, best_len, alpha):
-    x = [cities[names[i]][1] for i in tour] + [cities[names[tour[0]]][1]]
-    y = [cities[names[i]][0] for i in tour] + [cities[names[tour[0]]][0]]
+def plot_tour(tour, best_len, alpha, save_path=None, points=None, labels=None):
+    """
+    Show the tour, or write it to save_path without opening a window (headless runs).
+    points[i] is the (x, y) plot position of city i and labels[i] its name (None for
+    no labels); both default to the Rajasthan cities.
+    """
+    import matplotlib
+    if save_path is not None:
+        matplotlib.use("Agg")
+    import matplotlib.pyplot as plt
+
+    if points is None:
+        points = [(cities[name][1], cities[name][0]) for name in names]
+        labels = names
+    x = [points[i][0] for i in tour] + [points[tour[0]][0]]
+    y = [points[i][1] for i in tour] + [points[tour[0]][1]]
 
     plt.figure(figsize=(6, 4))
     plt.plot(x, y, 'go-', linewidth=2)
-    for i, idx in enumerate(tour):
-        plt.text(x[i]+0.05, y[i]+0.05, names[idx], fontsize=8)
+    if labels is not None:
+        for i, idx in enumerate(tour):
+            plt.text(x[i]+0.05, y[i]+0.05, labels[idx], fontsize=8)
     plt.title(f"Optimal Tour — Total Distance: {best_len:.2f} km\nα = {alpha}")
     plt.xlabel("Longitude")
     plt.ylabel("Latitude")
     plt.grid(True)
     plt.tight_layout()
-    plt.show()
+    if save_path is None:
+        plt.show()
+    else:
+        plt.savefig(save_path, dpi=120)
+        plt.close()
 
 # --------------------- Run Experiments ---------------------
-if __name__ == "__main__":
+def main():
     alphas = [0.99, 0.95, 0.90]
     results = []
 
@@ -109,3 +290,7 @@ if __name__ == "__main__":
     print("\n=== Summary of Cooling Rates ===")
     for a, _, best_len in results:
         print(f"α = {a} → Best Distance = {best_len:.2f} km")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,157 @@
+import argparse
+import contextlib
+import io
+import json
+import os
+import platform
+import statistics
+import sys
+import time
+
+import numpy as np
+
+from cases import CASES
+
+HERE = os.path.dirname(os.path.abspath(__file__))
+BASELINE = os.path.join(HERE, "baseline.json")
+THRESHOLD = 0.25
+
+# ------------------------------------------------------------
+# Timing
+# ------------------------------------------------------------
+def time_case(name, repeat=5):
+    """
+    Set up one case and time `repeat` calls of its run(); the solvers' own progress
+    output is discarded. Returns the row stored in the results JSON.
+    """
+    with contextlib.redirect_stdout(io.StringIO()):
+        run = CASES[name]()
+        times = []
+        for _ in range(repeat):
+            start = time.perf_counter()
+            result = run()
+            times.append(time.perf_counter() - start)
+    return {
+        'min': min(times),
+        'median': statistics.median(times),
+        'max': max(times),
+        'repeat': repeat,
+        'result': result,
+    }
+
+
+def run_cases(names, repeat=5):
+    results = {}
+    for name in names:
+        results[name] = time_case(name, repeat)
+        print(f"{name:>22}  min {results[name]['min'] * 1000:9.1f} ms  "
+              f"median {results[name]['median'] * 1000:9.1f} ms  result {results[name]['result']}")
+    return {
+        'python': platform.python_version(),
+        'numpy': np.__version__,
+        'machine': f"{platform.system()} {platform.machine()}, {os.cpu_count()} CPUs",
+        'cases': results,
+    }
+
+
+# ------------------------------------------------------------
+# Comparison Against a Baseline
+# ------------------------------------------------------------
+def _spread(name, row, label):
+    """Run-to-run spread of a case relative to its median."""
+    if 'max' not in row:
+        raise ValueError(f"{label} entry for {name!r} has no 'max' time, so its spread is unknown; "
+                         f"re-record it with the current bench.py")
+    if not row['median']:
+        return 0.0
+    return (row['max'] - row['min']) / row['median']
+
+
+def compare(baseline, current, threshold=THRESHOLD):
+    """
+    Compare the median times of every case present in both result sets. A case
+    regresses when its median is slower than the baseline's by more than `threshold`
+    (0.25 = 25%) plus the larger relative spread (max - min) / median of the two runs,
+    so a noisy case needs a larger slowdown to fail, or when its result changed.
+    Raises ValueError for a case recorded without its max time.
+    Returns the list of regressed case names.
+    """
+    regressed = []
+    print(f"{'Case':>22}  {'Baseline':>10}  {'Current':>10}  {'Ratio':>6}  {'Limit':>6}  Status")
+    for name, row in current['cases'].items():
+        base = baseline['cases'].get(name)
+        if base is None:
+            print(f"{name:>22}  {'-':>10}  {row['median'] * 1000:8.1f}ms  {'-':>6}  {'-':>6}  new")
+            continue
+        ratio = row['median'] / base['median'] if base['median'] else float('inf')
+        allowed = threshold + max(_spread(name, base, "baseline"), _spread(name, row, "current"))
+        if row['result'] != base['result']:
+            status = f"RESULT CHANGED ({base['result']} -> {row['result']})"
+        elif ratio > 1 + allowed:
+            status = "SLOWER"
+        elif ratio < 1 / (1 + allowed):
+            status = "faster"
+        else:
+            status = "ok"
+        if status.startswith(("SLOWER", "RESULT")):
+            regressed.append(name)
+        print(f"{name:>22}  {base['median'] * 1000:8.1f}ms  {row['median'] * 1000:8.1f}ms  {ratio:6.2f}  "
+              f"{1 + allowed:6.2f}  {status}")
+    return regressed
+
+
+def _read(path):
+    with open(path) as f:
+        return json.load(f)
+
+
+def _write(path, results):
+    with open(path, 'w') as f:
+        json.dump(results, f, indent=2)
+        f.write("\n")
+
+
+# ------------------------------------------------------------
+# Command Line Entry Point
+# ------------------------------------------------------------
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Fixed-input benchmarks for the hot paths of every lab.")
+    commands = parser.add_subparsers(dest='command', required=True)
+
+    run = commands.add_parser('run', help="time the cases and write a results JSON")
+    run.add_argument('--cases', nargs='+', default=list(CASES), choices=list(CASES))
+    run.add_argument('--repeat', type=int, default=5)
+    run.add_argument('--out', default=os.path.join(HERE, "results.json"))
+    run.add_argument('--save-baseline', action='store_true', help=f"also write the results to {BASELINE}")
+    run.add_argument('--compare', nargs='?', const=BASELINE, default=None, metavar='BASELINE',
+                     help="compare against a baseline JSON after running")
+    run.add_argument('--threshold', type=float, default=THRESHOLD,
+                     help="allowed median slowdown on top of the recorded spread (default: %(default)s)")
+
+    cmp = commands.add_parser('compare', help="compare two results JSON files")
+    cmp.add_argument('current')
+    cmp.add_argument('--baseline', default=BASELINE)
+    cmp.add_argument('--threshold', type=float, default=THRESHOLD,
+                     help="allowed median slowdown on top of the recorded spread (default: %(default)s)")
+
+    args = parser.parse_args(argv)
+    if args.command == 'run':
+        current = run_cases(args.cases, args.repeat)
+        _write(args.out, current)
+        if args.save_baseline:
+            _write(BASELINE, current)
+        print(f"Results written to {args.out}")
+        if args.compare is None:
+            return 0
+        baseline = _read(args.compare)
+    else:
+        current, baseline = _read(args.current), _read(args.baseline)
+
+    regressed = compare(baseline, current, args.threshold)
+    if regressed:
+        print(f"{len(regressed)} case(s) regressed beyond {args.threshold:.0%} plus noise: {', '.join(regressed)}")
+    return 1 if regressed else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
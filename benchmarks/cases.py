@@ -0,0 +1,202 @@
+import os
+import random
+import sys
+
+import numpy as np
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+from cs307.labs import ROOT, load  # noqa: E402
+from cs307.metrics import SearchMetrics  # noqa: E402
+
+# Every case does its setup (imports, fixed inputs) untimed and returns a `run`
+# callable. run() is what gets timed; it reseeds itself so every repeat does the same
+# work, and returns a small JSON value used to check the answer did not change.
+
+# ------------------------------------------------------------
+# Lab 1: Rabbit Leap BFS / DFS
+# ------------------------------------------------------------
+RABBIT_START = ('E', 'E', 'E', 'O', 'W', 'W', 'W')
+RABBIT_GOAL = ('W', 'W', 'W', 'O', 'E', 'E', 'E')
+
+
+def rabbit_bfs():
+    module = load("Lab1/Challenge Problem", "rabbit_leap_problem")
+
+    def run():
+        for _ in range(200):
+            path = module.breadth_first_search(RABBIT_START, RABBIT_GOAL)
+        return len(path)
+    return run
+
+
+def rabbit_dfs():
+    module = load("Lab1/Challenge Problem", "rabbit_leap_problem")
+
+    def run():
+        for _ in range(200):
+            path = module.depth_first_search(RABBIT_START, RABBIT_GOAL)
+        return len(path)
+    return run
+
+
+# ------------------------------------------------------------
+# Lab 2: 8-Puzzle IDS
+# ------------------------------------------------------------
+def _puzzle8(use_table):
+    def case():
+        module = load("Lab2/In-Lab Problem", "puzzle_8")
+        start = [1, 2, 3, 4, 5, 6, 7, 0, 8]
+        goal = [1, 3, 5, 8, 0, 6, 4, 2, 7]  # 13 moves from start
+
+        def run():
+            return module.iterative_deepening_search(start, goal, use_table=use_table).depth
+        return run
+    return case
+
+
+# ------------------------------------------------------------
+# Lab 2: Edit Distance and A* Sentence Alignment
+# ------------------------------------------------------------
+def _sentences(rng, count, vocabulary):
+    return [" ".join(rng.choice(vocabulary) for _ in range(rng.randint(6, 14))) for _ in range(count)]
+
+
+def _edited(rng, sentences, vocabulary):
+    # Copy the document, rewording some sentences and dropping or inserting others
+    out = []
+    for sentence in sentences:
+        roll = rng.random()
+        if roll < 0.1:
+            continue
+        words = sentence.split()
+        if roll < 0.5:
+            words[rng.randrange(len(words))] = rng.choice(vocabulary)
+        out.append(" ".join(words))
+        if rng.random() < 0.1:
+            out.extend(_sentences(rng, 1, vocabulary))
+    return out
+
+
+def edit_distance():
+    module = load("Lab2/Challenge Problem", "A_star_plag_checker")
+    rng = random.Random(0)
+    pairs = [("".join(rng.choice("abcd") for _ in range(120)), "".join(rng.choice("abcd") for _ in range(120)))
+             for _ in range(10)]
+
+    def run():
+        return sum(module.compute_edit_distance(a, b) for a, b in pairs)
+    return run
+
+
+def alignment():
+    module = load("Lab2/Challenge Problem", "A_star_plag_checker")
+    rng = random.Random(0)
+    vocabulary = ["search", "state", "node", "goal", "cost", "path", "agent", "heuristic",
+                  "frontier", "graph", "tree", "edge", "depth", "queue", "stack", "optimal"]
+    doc1 = _sentences(rng, 40, vocabulary)
+    doc2 = _edited(rng, doc1, vocabulary)
+
+    def run():
+        return len(module.perform_astar_alignment(doc1, doc2))
+    return run
+
+
+# ------------------------------------------------------------
+# Lab 3: Peg Solitaire A* / Best-First
+# ------------------------------------------------------------
+# A 16-peg position taken from the middle of the optimal solution of the full board
+PEG_BOARD = [
+    [2, 2, 0, 0, 0, 2, 2],
+    [2, 2, 0, 0, 1, 2, 2],
+    [1, 0, 0, 1, 1, 1, 1],
+    [0, 0, 0, 1, 1, 1, 1],
+    [0, 0, 0, 1, 1, 1, 1],
+    [2, 2, 1, 0, 0, 2, 2],
+    [2, 2, 1, 0, 0, 2, 2],
+]
+
+
+def _peg(module, function, heuristic):
+    def case():
+        search = getattr(load("Lab3/In-Lab Problem", f"functions.{module}"), function)
+
+        def run():
+            metrics = SearchMetrics()
+            length = search([row[:] for row in PEG_BOARD], heuristic, metrics)
+            return [length, metrics.counters.get('expansions', 0)]
+        return run
+    return case
+
+
+# ------------------------------------------------------------
+# Lab 3: SAT Local Search
+# ------------------------------------------------------------
+def _sat(solver, **kwargs):
+    def case():
+        module = load("Lab3/Challenge Problem", "k_sat_unsat")
+        random.seed("instance-100-426-0")
+        clauses = module.generate_3sat_instance(100, 426)
+        function = getattr(module, solver)
+
+        def run():
+            random.seed(0)
+            assignment, solved = function(clauses, 100, **kwargs)
+            return [bool(solved), module.count_unsatisfied_clauses(clauses, assignment)]
+        return run
+    return case
+
+
+# ------------------------------------------------------------
+# Lab 4: TSP Simulated Annealing
+# ------------------------------------------------------------
+def tsp_sa():
+    module = load("Lab4/In-Lab Problem", "tsp_rajasthan_sa_problem")
+
+    def run():
+        tour, length = module.simulated_annealing(alpha=0.999, iterations=100000, seed=42)
+        return round(length, 3)
+    return run
+
+
+# ------------------------------------------------------------
+# Lab 4: Jigsaw Energy
+# ------------------------------------------------------------
+def jigsaw_energy():
+    helpers = load("Lab4/Challenge Problem", "functions.helpers")
+    image = helpers.load_file(os.path.join(ROOT, "Lab4/Challenge Problem/lena.txt"))
+
+    def run():
+        return float(sum(helpers.calculate_energy(image, 128) for _ in range(500)) / 500)
+    return run
+
+
+def jigsaw_anneal():
+    helpers = load("Lab4/Challenge Problem", "functions.helpers")
+    image = helpers.load_file(os.path.join(ROOT, "Lab4/Challenge Problem/lena.txt"))
+    model_module = load("Lab4/Challenge Problem", "functions.model")
+    model = model_module.PuzzleModel(image, 32)
+
+    def run():
+        random.seed(0)
+        np.random.seed(0)
+        perm, energy = model_module.anneal_model(model, model.identity(), 1000, 0.9995, 0.01)
+        return float(energy)
+    return run
+
+
+CASES = {
+    'rabbit_bfs': rabbit_bfs,
+    'rabbit_dfs': rabbit_dfs,
+    'puzzle8_ids': _puzzle8(True),
+    'puzzle8_ids_no_table': _puzzle8(False),
+    'edit_distance': edit_distance,
+    'alignment': alignment,
+    'peg_astar_manhattan': _peg("a_star", "a_star_search", "Manhattan"),
+    'peg_astar_exponential': _peg("a_star", "a_star_search", "Exponential"),
+    'peg_best_first': _peg("best_first_search", "best_first_search", "Exponential"),
+    'sat_hill_climb': _sat("hill_climb_unsat"),
+    'sat_walksat': _sat("walksat", max_flips=20000),
+    'tsp_sa': tsp_sa,
+    'jigsaw_energy': jigsaw_energy,
+    'jigsaw_anneal': jigsaw_anneal,
+}
@@ -0,0 +1,59 @@
+import argparse
+import sys
+
+from .labs import load
+
+# ------------------------------------------------------------
+# Solvers
+# ------------------------------------------------------------
+# name: (lab folder, module, main() accepts an argv list, description)
+SOLVERS = {
+    'rabbit-leap': ("Lab1/Challenge Problem", "rabbit_leap_problem", False,
+                    "BFS and DFS on the rabbit leap puzzle"),
+    'puzzle8': ("Lab2/In-Lab Problem", "puzzle_8", False,
+                "iterative deepening on 8-puzzle goals of increasing depth"),
+    'plagiarism': ("Lab2/Challenge Problem", "A_star_plag_checker", True,
+                   "A* sentence alignment and plagiarism report for two documents"),
+    'peg': ("Lab3/In-Lab Problem", "main", False,
+            "best-first and A* search on peg solitaire"),
+    'ksat': ("Lab3/Challenge Problem", "k_sat_unsat", False,
+             "3-SAT local search with the unsatisfied-clause heuristic"),
+    'ksat-weighted': ("Lab3/Challenge Problem", "k_sat", False,
+                      "3-SAT local search with clause weighting"),
+    'sat-portfolio': ("Lab3/Challenge Problem", "portfolio", False,
+                      "race several 3-SAT solvers in worker processes"),
+    'sat-benchmark': ("Lab3/Challenge Problem", "sat_benchmark", True,
+                      "phase-transition sweep of the 3-SAT solvers"),
+    'tsp': ("Lab4/In-Lab Problem", "tsp_rajasthan_sa_problem", False,
+            "simulated annealing on the Rajasthan tour"),
+    'tsp-parallel': ("Lab4/In-Lab Problem", "tsp_parallel", True,
+                     "parallel SA chains and parallel tempering for the TSP"),
+    'jigsaw': ("Lab4/Challenge Problem", "main", False,
+               "reassemble the scrambled lena image"),
+    'bench': ("benchmarks", "bench", True,
+              "cross-lab benchmarks and baseline comparison"),
+}
+
+
+# ------------------------------------------------------------
+# Command Line Entry Point
+# ------------------------------------------------------------
+def main(argv=None):
+    parser = argparse.ArgumentParser(
+        prog="python -m cs307",
+        description="Run any lab's solver. Arguments after the solver name are passed on to it.",
+        formatter_class=argparse.RawDescriptionHelpFormatter,
+        epilog="solvers:\n" + "\n".join(f"  {name:<14} {info[3]}" for name, info in SOLVERS.items()))
+    parser.add_argument('solver', choices=list(SOLVERS), metavar='solver')
+    parser.add_argument('args', nargs=argparse.REMAINDER)
+    args = parser.parse_args(argv)
+
+    directory, module, takes_argv, _ = SOLVERS[args.solver]
+    if args.args and not takes_argv:
+        parser.error(f"{args.solver} takes no arguments")
+    entry = load(directory, module, keep_path=True).main
+    return entry(args.args) if takes_argv else entry()
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,29 @@
+import importlib
+import os
+import sys
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+# Module names reused across labs: Lab3 and Lab4 both ship a `functions` package and
+# a `main.py` script
+_SHARED_NAMES = ("functions", "main")
+
+
+def load(directory, module, keep_path=False):
+    """
+    Import `module` as if running from the lab folder `directory` (relative to the repo
+    root), so the lab's own sibling imports resolve. Modules whose names are reused
+    across labs are dropped from sys.modules first, so each lab gets its own copy.
+    With keep_path the folder stays on sys.path, which lazy imports and spawned
+    worker processes of a long-running solver need.
+    """
+    path = os.path.join(ROOT, directory)
+    for name in list(sys.modules):
+        if name.split(".")[0] in _SHARED_NAMES:
+            del sys.modules[name]
+    sys.path.insert(0, path)
+    try:
+        return importlib.import_module(module)
+    finally:
+        if not keep_path:
+            sys.path.remove(path)
@@ -0,0 +1,91 @@
+import json
+import time
+from contextlib import contextmanager
+
+# ------------------------------------------------------------
+# Search / Annealing Metrics
+# ------------------------------------------------------------
+# Solvers take an optional `metrics` argument, their only instrumentation hook, and
+# touch it behind `if metrics is not None`, so a run without metrics pays one
+# comparison per event.
+# Counter names shared by all solvers:
+#   expansions  nodes whose successors were generated
+#   generated   successor nodes created (or neighbours evaluated in local search)
+#   duplicates  popped or generated nodes that had already been explored
+#   accepted    local-search / annealing moves applied (committed flips for SAT)
+#   rejected    moves proposed but not applied
+#   improved    moves that produced a new best solution
+# The CDCL solver counts decisions, conflicts, propagations, learnt clauses,
+# restarts and reductions instead.
+# Peaks: `frontier` is the high-water mark of the open list, queue or stack.
+# Per-run facts (a stop reason, an iteration count) go in `info` via note(), and
+# per-epoch rows in `series` via record().
+
+
+class SearchMetrics:
+    """
+    Counters, high-water marks and phase timings for one or more solver runs.
+
+    callback(snapshot) is called every `sample_every` counted events, which lets a
+    long run be profiled while it is still going.
+    """
+
+    def __init__(self, callback=None, sample_every=10000):
+        self.counters = {}
+        self.peaks = {}
+        self.phases = {}
+        self.info = {}
+        self.series = {}
+        self.callback = callback
+        self.sample_every = sample_every
+        self.events = 0
+        self.started = time.perf_counter()
+
+    def count(self, name, n=1):
+        self.counters[name] = self.counters.get(name, 0) + n
+        if self.callback is not None:
+            self.events += 1
+            if self.events % self.sample_every == 0:
+                self.callback(self.snapshot())
+
+    def peak(self, name, value):
+        if value > self.peaks.get(name, 0):
+            self.peaks[name] = value
+
+    def note(self, name, value):
+        self.info[name] = value
+
+    def record(self, name, row):
+        self.series.setdefault(name, []).append(row)
+
+    @contextmanager
+    def phase(self, name):
+        """Time a block; repeated phases with the same name accumulate."""
+        start = time.perf_counter()
+        try:
+            yield self
+        finally:
+            self.add_time(name, time.perf_counter() - start)
+
+    def add_time(self, name, seconds):
+        entry = self.phases.setdefault(name, {'seconds': 0.0, 'calls': 0})
+        entry['seconds'] += seconds
+        entry['calls'] += 1
+
+    def snapshot(self):
+        return {
+            'elapsed': time.perf_counter() - self.started,
+            'counters': dict(self.counters),
+            'peaks': dict(self.peaks),
+            'phases': {name: dict(entry) for name, entry in self.phases.items()},
+            'info': dict(self.info),
+            'series': {name: list(rows) for name, rows in self.series.items()},
+        }
+
+    def to_json(self, path=None):
+        """Return the snapshot as JSON text, also writing it to `path` when given."""
+        text = json.dumps(self.snapshot(), indent=2)
+        if path is not None:
+            with open(path, 'w') as f:
+                f.write(text + "\n")
+        return text
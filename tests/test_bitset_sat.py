@@ -0,0 +1,33 @@
+import random
+
+import pytest
+
+from cs307.labs import load
+
+LAB = "Lab3/Challenge Problem"
+
+
+def _instance(module, num_vars=20, num_clauses=85, seed=0):
+    random.seed(seed)
+    return module.generate_3sat_instance(num_vars, num_clauses)
+
+
+@pytest.mark.parametrize("solver", ["beam_search_u64", "beam_search_bits", "beam_search_with_weights_bits"])
+def test_zero_steps_returns_the_best_starting_assignment(solver):
+    pytest.importorskip("numpy")
+    bitset_sat = load(LAB, "bitset_sat")
+    k_sat_unsat = load(LAB, "k_sat_unsat")
+    clauses = _instance(k_sat_unsat)
+    assignment, solved = getattr(bitset_sat, solver)(clauses, 20, max_steps=0)
+    assert len(assignment) == 20
+    assert solved == (k_sat_unsat.count_unsatisfied_clauses(clauses, assignment) == 0)
+
+
+def test_u64_beam_solves_an_easy_instance():
+    pytest.importorskip("numpy")
+    bitset_sat = load(LAB, "bitset_sat")
+    k_sat_unsat = load(LAB, "k_sat_unsat")
+    clauses = _instance(k_sat_unsat, num_clauses=40)
+    random.seed(0)
+    assignment, solved = bitset_sat.beam_search_u64(clauses, 20)
+    assert solved and k_sat_unsat.count_unsatisfied_clauses(clauses, assignment) == 0
@@ -0,0 +1,96 @@
+import itertools
+import random
+
+import pytest
+
+from cs307.labs import load
+from cs307.metrics import SearchMetrics
+
+LAB = "Lab3/Challenge Problem"
+
+
+def _satisfies(clauses, assignment):
+    return all(any(assignment[abs(lit) - 1] == (lit > 0) for lit in clause) for clause in clauses)
+
+
+def _brute_force_sat(clauses, num_vars):
+    return any(_satisfies(clauses, bits) for bits in itertools.product((False, True), repeat=num_vars))
+
+
+def _pigeonhole(holes):
+    """holes + 1 pigeons in `holes` holes; variable p * holes + h + 1 puts pigeon p in hole h."""
+    var = lambda p, h: p * holes + h + 1
+    clauses = [[var(p, h) for h in range(holes)] for p in range(holes + 1)]
+    for h in range(holes):
+        for p, q in itertools.combinations(range(holes + 1), 2):
+            clauses.append([-var(p, h), -var(q, h)])
+    return clauses, (holes + 1) * holes
+
+
+def test_luby_sequence():
+    cdcl = load(LAB, "cdcl")
+    assert [cdcl.luby(i) for i in range(1, 16)] == [1, 1, 2, 1, 1, 2, 4, 1, 1, 2, 1, 1, 2, 4, 8]
+
+
+def test_agrees_with_brute_force_on_small_instances():
+    cdcl = load(LAB, "cdcl")
+    k_sat_unsat = load(LAB, "k_sat_unsat")
+    random.seed(0)
+    seen = set()
+    for ratio in (3.0, 4.3, 6.0):
+        for _ in range(15):
+            clauses = k_sat_unsat.generate_3sat_instance(10, round(ratio * 10))
+            assignment, status = cdcl.cdcl_solve(clauses, 10)
+            expected = cdcl.SAT if _brute_force_sat(clauses, 10) else cdcl.UNSAT
+            assert status == expected
+            if status == cdcl.SAT:
+                assert _satisfies(clauses, assignment)
+            seen.add(status)
+    assert seen == {cdcl.SAT, cdcl.UNSAT}
+
+
+@pytest.mark.parametrize("clauses, num_vars, status", [
+    ([], 3, 'SAT'),
+    ([[1], [-1]], 1, 'UNSAT'),
+    ([[1, -1], [2]], 2, 'SAT'),  # tautologies are dropped
+    ([[1, 2], [-1, 2], [1, -2], [-1, -2]], 2, 'UNSAT'),
+])
+def test_edge_cases(clauses, num_vars, status):
+    cdcl = load(LAB, "cdcl")
+    assignment, result = cdcl.cdcl_solve(clauses, num_vars)
+    assert result == status
+    if result == cdcl.SAT:
+        assert len(assignment) == num_vars and _satisfies(clauses, assignment)
+
+
+def test_pigeonhole_is_unsat_after_learnt_clause_reductions():
+    cdcl = load(LAB, "cdcl")
+    clauses, num_vars = _pigeonhole(5)
+    solver = cdcl.CDCLSolver(clauses, num_vars, restart_base=4)
+    solver.max_learnts = 5  # reduce at almost every restart
+    metrics = SearchMetrics()
+    assert solver.solve(metrics=metrics) == (None, cdcl.UNSAT)
+    assert metrics.counters['reductions'] > 0
+
+
+def test_models_survive_learnt_clause_reductions():
+    cdcl = load(LAB, "cdcl")
+    k_sat_unsat = load(LAB, "k_sat_unsat")
+    random.seed(3)
+    solved = 0
+    for _ in range(5):
+        clauses = k_sat_unsat.generate_3sat_instance(60, 250)
+        solver = cdcl.CDCLSolver(clauses, 60, restart_base=4)
+        solver.max_learnts = 5
+        metrics = SearchMetrics()
+        assignment, status = solver.solve(metrics=metrics)
+        if status == cdcl.SAT:
+            assert _satisfies(clauses, assignment)
+            solved += metrics.counters.get('reductions', 0) > 0
+    assert solved > 0
+
+
+def test_conflict_budget_reports_unknown():
+    cdcl = load(LAB, "cdcl")
+    clauses, num_vars = _pigeonhole(7)
+    assert cdcl.cdcl_solve(clauses, num_vars, max_conflicts=10) == (None, cdcl.UNKNOWN)
@@ -0,0 +1,32 @@
+from cs307.labs import load
+from cs307.metrics import SearchMetrics
+
+LAB = "Lab4/In-Lab Problem"
+
+
+def test_reheating_schedule_reheats_instead_of_freezing():
+    cooling = load(LAB, "cooling")
+    tsp = load(LAB, "tsp_rajasthan_sa_problem")
+    schedule = cooling.ReheatingCooling(alpha=0.9, patience=2000)
+    metrics = SearchMetrics()
+    tsp.simulated_annealing(alpha=0.9, iterations=5000, schedule=schedule, metrics=metrics)
+    assert schedule.reheats > 0
+    assert metrics.info['stop_reason'] == "iterations"
+    assert metrics.info['iterations'] == 5000
+
+
+def test_geometric_schedule_still_freezes():
+    tsp = load(LAB, "tsp_rajasthan_sa_problem")
+    metrics = SearchMetrics()
+    tsp.simulated_annealing(alpha=0.9, iterations=5000, metrics=metrics)
+    assert metrics.info['stop_reason'] == "frozen"
+
+
+def test_lundy_mees_recomputes_beta_per_run():
+    cooling = load(LAB, "cooling")
+    schedule = cooling.LundyMeesCooling()
+    schedule.start(4000.0, 1000)
+    first = schedule.run_beta
+    schedule.start(100.0, 50000)
+    assert schedule.beta is None
+    assert schedule.run_beta != first
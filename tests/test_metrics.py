@@ -0,0 +1,68 @@
+import json
+import time
+
+from cs307.metrics import SearchMetrics
+
+
+def test_count_and_peak():
+    metrics = SearchMetrics()
+    metrics.count('expansions')
+    metrics.count('generated', 3)
+    metrics.count('generated', 2)
+    metrics.peak('frontier', 4)
+    metrics.peak('frontier', 2)
+    assert metrics.counters == {'expansions': 1, 'generated': 5}
+    assert metrics.peaks == {'frontier': 4}
+
+
+def test_phases_accumulate():
+    metrics = SearchMetrics()
+    for _ in range(2):
+        with metrics.phase("search"):
+            time.sleep(0.001)
+    entry = metrics.phases["search"]
+    assert entry['calls'] == 2
+    assert entry['seconds'] >= 0.002
+
+
+def test_phase_is_recorded_when_the_block_raises():
+    metrics = SearchMetrics()
+    try:
+        with metrics.phase("failing"):
+            raise ValueError
+    except ValueError:
+        pass
+    assert metrics.phases["failing"]['calls'] == 1
+
+
+def test_snapshot_is_a_copy():
+    metrics = SearchMetrics()
+    metrics.count('accepted')
+    metrics.note('stop_reason', "frozen")
+    metrics.record('epochs', {'T': 1.0})
+    snapshot = metrics.snapshot()
+    metrics.count('accepted')
+    metrics.record('epochs', {'T': 0.5})
+    assert snapshot['counters'] == {'accepted': 1}
+    assert snapshot['info'] == {'stop_reason': "frozen"}
+    assert snapshot['series'] == {'epochs': [{'T': 1.0}]}
+    assert snapshot['elapsed'] >= 0
+
+
+def test_to_json_round_trips(tmp_path):
+    metrics = SearchMetrics()
+    metrics.count('improved', 2)
+    metrics.peak('frontier', 7)
+    path = tmp_path / "metrics.json"
+    text = metrics.to_json(str(path))
+    assert json.loads(text) == json.loads(path.read_text())
+    assert json.loads(text)['counters'] == {'improved': 2}
+    assert json.loads(text)['peaks'] == {'frontier': 7}
+
+
+def test_callback_every_sample_every_events():
+    seen = []
+    metrics = SearchMetrics(callback=seen.append, sample_every=3)
+    for _ in range(7):
+        metrics.count('generated')
+    assert [snapshot['counters']['generated'] for snapshot in seen] == [3, 6]
@@ -0,0 +1,88 @@
+import itertools
+import random
+
+from cs307.labs import load
+
+LAB = "Lab3/Challenge Problem"
+
+
+def _satisfies(clauses, assignment):
+    return all(any(assignment[abs(lit) - 1] == (lit > 0) for lit in clause) for clause in clauses)
+
+
+def _models(clauses, num_vars):
+    return [list(bits) for bits in itertools.product((False, True), repeat=num_vars)
+            if _satisfies(clauses, bits)]
+
+
+def test_unit_propagation_fixes_implied_variables():
+    preprocess = load(LAB, "preprocess")
+    clauses = [[1], [-1, 2], [-2, 3, 4], [-3, -4], [3, -4], [-3, 4, 5], [-5, 3]]
+    result = preprocess.preprocess_formula(clauses, 5)
+    assert not result.unsat
+    assert result.fixed[1] is True and result.fixed[2] is True
+    assert result.new_to_old == [3, 4, 5]
+    models = _models(result.clauses, result.num_vars)
+    assert models and all(_satisfies(clauses, result.reconstruct(model)) for model in models)
+
+
+def test_conflicting_units_are_unsat():
+    preprocess = load(LAB, "preprocess")
+    result = preprocess.preprocess_formula([[1, 2], [-1], [-2]], 2)
+    assert result.unsat
+    assert result.clauses == [] and result.num_vars == 0
+
+
+def test_pure_literals_are_assigned_their_polarity():
+    preprocess = load(LAB, "preprocess")
+    # 3 only occurs positively; 1 and 2 occur both ways
+    clauses = [[1, 2, 3], [-1, -2], [1, -2], [-1, 2]]
+    result = preprocess.preprocess_formula(clauses, 3)
+    assert result.fixed[3] is True
+    assert all(3 not in map(abs, clause) for clause in result.clauses)
+
+
+def test_duplicate_and_subsumed_clauses_are_removed():
+    preprocess = load(LAB, "preprocess")
+    # Every literal occurs in both polarities and there are no units, so only
+    # subsumption applies: [1, 2] subsumes [1, 2, 3], and [1, 2] is duplicated
+    clauses = [[1, 2], [2, 1], [1, 2, 3], [-1, -2], [-1, -3], [-2, 3], [1, -3]]
+    result = preprocess.preprocess_formula(clauses, 3)
+    assert not result.fixed
+    expected = [[1, 2], [-1, -2], [-1, -3], [-2, 3], [1, -3]]
+    assert sorted(map(sorted, result.clauses)) == sorted(map(sorted, expected))
+
+
+def test_remaining_variables_are_renumbered_densely():
+    preprocess = load(LAB, "preprocess")
+    # Variables 2 and 5 stay (as an XOR pair); 1, 3, 4 and 6 never occur
+    clauses = [[2, 5], [-2, -5]]
+    result = preprocess.preprocess_formula(clauses, 6)
+    assert result.num_vars == 2
+    assert result.new_to_old == [2, 5]
+    assert sorted(map(sorted, result.clauses)) == [[-2, -1], [1, 2]]
+    full = result.reconstruct([True, False])
+    assert len(full) == 6
+    assert full[1] is True and full[4] is False
+
+
+def test_simplified_formula_is_equisatisfiable_and_models_map_back():
+    preprocess = load(LAB, "preprocess")
+    rng = random.Random(0)
+    outcomes = set()
+    for _ in range(200):
+        num_vars = 8
+        clauses = [[rng.choice((-1, 1)) * v for v in rng.sample(range(1, num_vars + 1), rng.randint(1, 3))]
+                   for _ in range(rng.randint(5, 30))]
+        result = preprocess.preprocess_formula(clauses, num_vars)
+        original_sat = bool(_models(clauses, num_vars))
+        if result.unsat:
+            assert not original_sat
+            outcomes.add('unsat')
+            continue
+        reduced_models = _models(result.clauses, result.num_vars)
+        assert bool(reduced_models) == original_sat
+        for model in reduced_models:
+            assert _satisfies(clauses, result.reconstruct(model))
+        outcomes.add('sat' if original_sat else 'reduced unsat')
+    assert {'sat', 'unsat'} <= outcomes
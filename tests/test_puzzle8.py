@@ -0,0 +1,65 @@
+from collections import deque
+
+import pytest
+
+from cs307.labs import load
+
+LAB = "Lab2/In-Lab Problem"
+START = [1, 2, 3, 4, 5, 6, 7, 0, 8]
+
+
+def _goals_by_depth(puzzle, start, max_depth):
+    """One state at each optimal distance 1..max_depth from start, by breadth-first search."""
+    goals = {}
+    seen = {tuple(start)}
+    queue = deque([(start, 0)])
+    while queue:
+        state, depth = queue.popleft()
+        if depth == max_depth:
+            continue
+        for neighbour in puzzle.generate_neighbors(puzzle.PuzzleNode(state)):
+            key = tuple(neighbour.state)
+            if key not in seen:
+                seen.add(key)
+                goals.setdefault(depth + 1, neighbour.state)
+                queue.append((neighbour.state, depth + 1))
+    return goals
+
+
+def test_remaining_depth_rule():
+    puzzle = load(LAB, "puzzle_8")
+    table = puzzle.TranspositionTable()
+    key = puzzle.pack_state(START)
+    assert not table.visit(key, 3)   # first visit is recorded
+    assert table.visit(key, 3)       # same remaining depth: already searched
+    assert table.visit(key, 2)       # fewer moves left: pruned
+    assert not table.visit(key, 5)   # more moves left: searched again and recorded
+    assert table.entries[key] == 5
+    assert table.visit(key, 4)
+    assert table.stats == {'lookups': 5, 'hits': 3, 'evictions': 0}
+
+
+def test_least_recently_used_entry_is_evicted():
+    puzzle = load(LAB, "puzzle_8")
+    table = puzzle.TranspositionTable(max_size=2)
+    table.visit('a', 1)
+    table.visit('b', 1)
+    table.visit('a', 1)  # a hit also refreshes a
+    table.visit('c', 1)
+    assert list(table.entries) == ['a', 'c']
+    assert table.stats['evictions'] == 1
+    assert not table.visit('b', 1)  # forgotten, so searched again
+
+
+@pytest.mark.parametrize("max_size", [64, 200000])
+def test_capped_table_still_finds_optimal_depths(max_size):
+    puzzle = load(LAB, "puzzle_8")
+    goals = _goals_by_depth(puzzle, START, 14)
+    for depth in (6, 10, 14):
+        table = puzzle.TranspositionTable(max_size=max_size)
+        result = puzzle.iterative_deepening_search(START, goals[depth], table=table)
+        assert result.state == goals[depth]
+        assert result.depth == depth
+        assert len(table.entries) <= max_size
+    if max_size == 64:
+        assert table.stats['evictions'] > 0
@@ -0,0 +1,40 @@
+import numpy as np
+
+from cs307.labs import load
+
+LAB = "Lab4/Challenge Problem"
+
+
+def test_sparse_model_rebuilt_from_shared_arrays_matches():
+    model_module = load(LAB, "functions.model")
+    image = np.random.default_rng(0).integers(0, 256, (64, 64)).astype(np.float64)
+    model = model_module.PuzzleModel(image, 8, rotations=True, k_best=4)
+    copy = model_module.PuzzleModel(image, 8, rotations=True, sparse=(model.near, model.near_costs))
+    assert copy.table is None
+    assert copy.best == model.best
+    perm = model.identity()[::-1]
+    assert copy.energy(perm) == model.energy(perm)
+
+
+def test_load_file_parses_text_and_falls_back_to_loadtxt(tmp_path):
+    helpers = load(LAB, "functions.helpers")
+    plain = tmp_path / "plain.txt"
+    plain.write_text(" 1\n 2\n 3\n 4\n")
+    commented = tmp_path / "commented.txt"
+    commented.write_text("# 2x2 image\n1 2\n3 4\n")
+    expected = np.array([[1.0, 3.0], [2.0, 4.0]])  # stored row-major, returned transposed
+    assert np.array_equal(helpers.load_file(str(plain), use_cache=False), expected)
+    assert np.array_equal(helpers.load_file(str(commented), use_cache=False), expected)
+
+
+def test_out_of_range_k_best_falls_back_to_the_dense_table():
+    model_module = load(LAB, "functions.model")
+    image = np.random.default_rng(1).integers(0, 256, (32, 32)).astype(np.float64)
+    dense = model_module.PuzzleModel(image, 8)
+    perm = dense.identity()[::-1]
+    # 16 tiles: each piece has 15 possible neighbours, so only 1 <= k_best < 15 is sparse
+    for k_best in (0, -1, 15, 40):
+        model = model_module.PuzzleModel(image, 8, k_best=k_best)
+        assert model.table is not None and model.near is None
+        assert model.energy(perm) == dense.energy(perm)
+    assert model_module.PuzzleModel(image, 8, k_best=14).table is None
@@ -0,0 +1,31 @@
+import random
+
+import pytest
+
+from cs307.labs import load
+from cs307.metrics import SearchMetrics
+
+LAB = "Lab3/Challenge Problem"
+
+
+@pytest.mark.parametrize("solver", ["beam_search_unsat_np", "beam_search_with_weights_np"])
+def test_zero_steps_returns_the_best_starting_assignment(solver):
+    sat_numpy = load(LAB, "sat_numpy")
+    k_sat_unsat = load(LAB, "k_sat_unsat")
+    random.seed(0)
+    clauses = k_sat_unsat.generate_3sat_instance(20, 85)
+    metrics = SearchMetrics()
+    assignment, solved = getattr(sat_numpy, solver)(clauses, 20, max_steps=0, metrics=metrics)
+    assert len(assignment) == 20
+    assert solved == (k_sat_unsat.count_unsatisfied_clauses(clauses, assignment) == 0)
+    assert 'accepted' not in metrics.counters
+
+
+def test_beam_counts_flips_per_beam_member():
+    sat_numpy = load(LAB, "sat_numpy")
+    k_sat_unsat = load(LAB, "k_sat_unsat")
+    random.seed(0)
+    clauses = k_sat_unsat.generate_3sat_instance(20, 85)
+    metrics = SearchMetrics()
+    sat_numpy.beam_search_unsat_np(clauses, 20, beam_width=3, max_steps=5, metrics=metrics)
+    assert 0 < metrics.counters['accepted'] <= 15
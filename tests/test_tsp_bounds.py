@@ -0,0 +1,55 @@
+import itertools
+import math
+import random
+
+import pytest
+
+from cs307.labs import load
+
+LAB = "Lab4/In-Lab Problem"
+
+
+def _random_instance(seed, n):
+    rng = random.Random(seed)
+    points = [(rng.random(), rng.random()) for _ in range(n)]
+    return [[math.dist(p, q) for q in points] for p in points]
+
+
+def _brute_force_optimum(dist):
+    # City 0 is fixed first; every other order is tried
+    n = len(dist)
+    return min(dist[0][perm[0]] + sum(dist[a][b] for a, b in zip(perm, perm[1:])) + dist[perm[-1]][0]
+               for perm in itertools.permutations(range(1, n)))
+
+
+@pytest.mark.parametrize("seed", range(5))
+def test_held_karp_bound_never_exceeds_the_optimum(seed):
+    pytest.importorskip("numpy")
+    tsp_bounds = load(LAB, "tsp_bounds")
+    dist = _random_instance(seed, 8)
+    optimum = _brute_force_optimum(dist)
+    bound = tsp_bounds.held_karp_bound(dist)
+    assert bound <= optimum + 1e-9
+    assert bound >= 0.8 * optimum  # the 1-tree bound is usually within a few percent
+
+
+@pytest.mark.parametrize("n", [4, 9, 40])
+def test_polish_returns_a_permutation_no_longer_than_its_input(n):
+    pytest.importorskip("numpy")
+    tsp_bounds = load(LAB, "tsp_bounds")
+    dist = _random_instance(n, n)
+    tour = list(range(n))
+    random.Random(n).shuffle(tour)
+    start = tsp_bounds.tour_cost(tour, dist)
+    polished, length = tsp_bounds.polish(tour, dist)
+    assert sorted(polished) == list(range(n))
+    assert length == pytest.approx(tsp_bounds.tour_cost(polished, dist))
+    assert length <= start + 1e-9
+
+
+def test_polished_nearest_neighbour_tour_is_never_below_the_optimum():
+    pytest.importorskip("numpy")
+    tsp_bounds = load(LAB, "tsp_bounds")
+    dist = _random_instance(7, 8)
+    _, length = tsp_bounds.polish(tsp_bounds.nearest_neighbour_tour(dist), dist)
+    assert length >= _brute_force_optimum(dist) - 1e-9
@@ -0,0 +1,44 @@
+import numpy as np
+
+from cs307.labs import load
+
+LAB = "Lab4/In-Lab Problem"
+
+# TSPLIB burma14 (EDGE_WEIGHT_TYPE: GEO); its optimal tour has length 3323
+BURMA14 = [(16.47, 96.10), (16.47, 94.44), (20.09, 92.54), (22.39, 93.37), (25.23, 97.24),
+           (22.00, 96.05), (20.47, 97.02), (17.20, 96.29), (16.30, 97.38), (14.05, 98.12),
+           (16.53, 97.38), (21.52, 95.59), (19.41, 97.13), (20.09, 94.55)]
+BURMA14_OPTIMAL = [0, 1, 13, 2, 3, 4, 5, 11, 6, 12, 7, 10, 8, 9]
+
+
+def _length(dist, tour):
+    return sum(dist[tour[i]][tour[(i + 1) % len(tour)]] for i in range(len(tour)))
+
+
+def test_geo_reproduces_tsplib_optimum(tmp_path):
+    tsp_data = load(LAB, "tsp_data")
+    path = tmp_path / "burma14.tsp"
+    rows = "\n".join(f"{i + 1} {lat} {lon}" for i, (lat, lon) in enumerate(BURMA14))
+    path.write_text(f"NAME: burma14\nDIMENSION: 14\nEDGE_WEIGHT_TYPE: GEO\nNODE_COORD_SECTION\n{rows}\nEOF\n")
+    names, coords, metric = tsp_data.read_tsplib(str(path))
+    assert metric == "geo"
+    assert _length(tsp_data.build_distances(coords, metric), BURMA14_OPTIMAL) == 3323
+    assert _length(tsp_data.OnDemandDistances(coords, metric), BURMA14_OPTIMAL) == 3323
+
+
+def test_euc_2d_rounds_to_nearest_integer():
+    tsp_data = load(LAB, "tsp_data")
+    coords = np.array([(0.0, 0.0), (1.0, 1.0), (3.0, 0.0)])  # sqrt(2), 3, sqrt(5)
+    dist = tsp_data.build_distances(coords, "euc_2d")
+    assert dist[0][1] == 1 and dist[0][2] == 3 and dist[1][2] == 2
+    assert tsp_data.OnDemandDistances(coords, "euc_2d")[1][2] == 2
+    assert tsp_data.build_distances(coords, "ceil_2d")[0][1] == 2
+
+
+def test_large_instances_are_not_nested_lists():
+    tsp_data = load(LAB, "tsp_data")
+    coords = np.random.default_rng(0).random((50, 2))
+    assert isinstance(tsp_data.build_distances(coords, "euclidean"), list)
+    dense = tsp_data.build_distances(coords, "euclidean", list_limit=10)
+    assert isinstance(dense, np.ndarray) and dense.dtype == np.float32
+    assert isinstance(tsp_data.build_distances(coords, "euclidean", dense_limit=10), tsp_data.OnDemandDistances)
@@ -0,0 +1,38 @@
+import math
+import random
+
+import pytest
+
+from cs307.labs import load
+
+LAB = "Lab4/In-Lab Problem"
+
+
+def _random_instance(rng, n):
+    points = [(rng.random(), rng.random()) for _ in range(n)]
+    return [[math.dist(p, q) for q in points] for p in points]
+
+
+def test_oropt_delta_matches_the_applied_tour():
+    tsp = load(LAB, "tsp_rajasthan_sa_problem")
+    rng = random.Random(0)
+    random.seed(0)
+    for _ in range(500):
+        n = rng.randint(4, 12)
+        dist = _random_instance(rng, n)
+        tour = list(range(n))
+        rng.shuffle(tour)
+        delta, move = tsp.propose_oropt(tour, dist)
+        moved = tour[:]
+        tsp.apply_oropt(moved, move)
+        assert sorted(moved) == list(range(n))
+        assert tsp.tour_length(moved, dist) - tsp.tour_length(tour, dist) == pytest.approx(delta)
+
+
+@pytest.mark.parametrize("n", [1, 2, 3])
+def test_oropt_has_no_move_on_tiny_tours(n):
+    tsp = load(LAB, "tsp_rajasthan_sa_problem")
+    dist = _random_instance(random.Random(n), n)
+    tour, length = tsp.simulated_annealing(iterations=100, dist=dist, move="oropt")
+    assert sorted(tour) == list(range(n))
+    assert length == pytest.approx(tsp.tour_length(tour, dist))
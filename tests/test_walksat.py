@@ -0,0 +1,55 @@
+import itertools
+import random
+
+import pytest
+
+from cs307.labs import load
+
+LAB = "Lab3/Challenge Problem"
+
+
+def _unsat_weight(clauses, assignment, weights):
+    return sum(w for clause, w in zip(clauses, weights)
+               if not any(assignment[abs(lit) - 1] == (lit > 0) for lit in clause))
+
+
+def _random_formula(rng, num_vars, num_clauses):
+    # Clauses of 1-3 distinct variables, so literals are never repeated or tautological
+    return [[rng.choice((-1, 1)) * v for v in rng.sample(range(1, num_vars + 1), rng.randint(1, 3))]
+            for _ in range(num_clauses)]
+
+
+@pytest.mark.parametrize("weighted", [False, True])
+def test_flip_delta_matches_a_from_scratch_recount(weighted):
+    walksat = load(LAB, "walksat")
+    rng = random.Random(0)
+    for _ in range(40):
+        num_vars = rng.randint(3, 8)
+        clauses = _random_formula(rng, num_vars, rng.randint(5, 25))
+        weights = [rng.randint(1, 5) for _ in clauses] if weighted else None
+        recount_weights = weights or [1] * len(clauses)
+        assignment = [rng.random() < 0.5 for _ in range(num_vars)]
+        state = walksat.ClauseState(clauses, num_vars, assignment=assignment, weights=weights)
+        before = _unsat_weight(clauses, assignment, recount_weights)
+        single = state.flip_deltas()
+        for size in (1, 2, 3):
+            for flip_set in itertools.combinations(range(num_vars), size):
+                flipped = assignment[:]
+                for v in flip_set:
+                    flipped[v] = not flipped[v]
+                expected = _unsat_weight(clauses, flipped, recount_weights) - before
+                assert state.flip_delta(flip_set, single) == expected
+                assert state.flip_delta(flip_set) == expected
+
+
+def test_incremental_state_matches_a_recount_after_flips():
+    walksat = load(LAB, "walksat")
+    rng = random.Random(1)
+    num_vars = 12
+    clauses = _random_formula(rng, num_vars, 50)
+    state = walksat.ClauseState(clauses, num_vars, assignment=[False] * num_vars)
+    for _ in range(200):
+        state.flip(rng.randrange(num_vars))
+        unsat = [idx for idx, clause in enumerate(clauses)
+                 if not any(state.assignment[abs(lit) - 1] == (lit > 0) for lit in clause)]
+        assert sorted(state.unsat) == unsat